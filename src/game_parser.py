@@ -1,9 +1,11 @@
 import os
 import random
 import re
+import sys
+import threading
 from datetime import datetime, timedelta
 from dateutil import parser as dateutil_parser
-from collections import defaultdict, Counter, namedtuple
+from collections import defaultdict, Counter, OrderedDict, namedtuple
 from dataclasses import dataclass
 
 # Accent color constants (Discord integer colors) for the scoreboard containers.
@@ -15,7 +17,7 @@ SCORES_COLOR = 3003583        # teal  #2DD4BF
 OTHER_GAMES_COLOR = 10395294  # gray  #9E9E9E
 
 # Wordle's guess limit. Shared by the Wordle game spec and the standalone
-# bot-image grid parser (_parse_single_grid), so it stays a module constant.
+# bot-image grid reader (_read_grids), so it stays a module constant.
 DEFAULT_WORDLE_TOTAL = 6
 
 
@@ -26,7 +28,7 @@ class Game:
     Produced by build_games() from a GameSpec: display metadata plus the
     compiled regex and the score extractor. Consumed by both the scoreboard
     (emoji/title/metric/total/puzzle/url) and the parser (pattern/parse/
-    needs_timestamp/search_pattern).
+    needs_timestamp/search_pattern/anchor).
     """
     key: str
     emoji: str
@@ -39,6 +41,7 @@ class Game:
     needs_timestamp: bool = False
     search_pattern: re.Pattern = None   # optional cheap pre-check before the full pattern
     parse: object = None                # callable(match, content) -> (score, metadata)
+    anchor: str = None                  # literal every match contains; see _dispatch_index
 
 
 def compute_puzzle_numbers(reference_date):
@@ -76,159 +79,174 @@ def make_timestamp_checker(reference_date, tz, hours_after_midnight, time_window
     return check
 
 
+# How far before the scoring day's local midnight a post can still count for
+# it. Games keyed by puzzle number take a result whenever it was posted, and
+# a player whose clock runs ahead of the guild's gets tomorrow's puzzle early:
+# 14 hours is the furthest any zone runs ahead of UTC.
+EARLY_POST_HOURS = 14
+
+
+def fetch_window_start(reference_date, tz):
+    """The oldest moment a message can have been posted and still count toward
+    reference_date -- where a fetch for that day can stop reading.
+
+    Timestamp-checked games count from make_timestamp_checker's window start,
+    the day-start hour. Games keyed by puzzle number count whenever the share
+    was posted, which starts at local midnight (before the day-start hour) and
+    earlier still for a player in a zone ahead of the guild's. Late shares
+    need no allowance: a fetch always reads up to the present.
+    """
+    midnight = reference_date.replace(hour=0, minute=0, second=0, microsecond=0,
+                                      tzinfo=tz)
+    return midnight - timedelta(hours=EARLY_POST_HOURS)
+
+
 # Wordle bot preview image: cell colors
 _WORDLE_GREEN = (83, 141, 78)
 _WORDLE_YELLOW = (181, 159, 59)
 _WORDLE_GRAY = (58, 58, 60)
 _WORDLE_EMPTY = (18, 18, 19)
 
+# Cell classes, in the order _read_grids' palette lists them; ties go to the
+# earlier one. A cell further than 40 from every colour is UNKNOWN.
+_CELL_GREEN, _CELL_YELLOW, _CELL_GRAY, _CELL_EMPTY, _CELL_UNKNOWN = range(5)
+_CELL_MAX_DISTANCE2 = 40 ** 2
 
-def _color_distance(c1, c2):
-    return sum((a - b) ** 2 for a, b in zip(c1, c2)) ** 0.5
 
+def _tile_mask(px):
+    """True where a pixel of an (..., 3) int32 array is a tile colour.
 
-def _classify_cell(px):
-    distances = {
-        'green': _color_distance(px, _WORDLE_GREEN),
-        'yellow': _color_distance(px, _WORDLE_YELLOW),
-        'gray': _color_distance(px, _WORDLE_GRAY),
-        'empty': _color_distance(px, _WORDLE_EMPTY),
-    }
-    closest = min(distances, key=distances.get)
-    return closest if distances[closest] < 40 else 'unknown'
+    GREEN/YELLOW/GRAY within tolerance; EMPTY is excluded, it aliases the
+    background. The squared distance to all three colours is one broadcast,
+    (..., 1, 3) against (3, 3); int32 holds the worst case (3 * 255^2).
+    """
+    import numpy as np
 
+    palette = np.array([_WORDLE_GREEN, _WORDLE_YELLOW, _WORDLE_GRAY], dtype=np.int32)
+    dist2 = ((px[..., None, :] - palette) ** 2).sum(axis=-1)
+    return (dist2 < 25).any(axis=-1)  # tol=5 squared
 
-def _detect_grids(img):
-    """Detect Wordle grid positions in a preview image.
 
-    Two-phase scan to keep Python hot loops small:
-      1. Coarse pass (every 4th row) to find rows that contain any tile-colored
-         pixels — produces a small candidate list.
-      2. Full scan of each candidate row to extract 5-cell player groups; stop
-         as soon as a row yields at least one valid group since cells are much
-         taller than the sample stride.
+def _runs(mask):
+    """(row, start, end) of every run of True along the last axis of a 2-D
+    bool array, ends inclusive, in row-major order.
 
-    Returns a list of dicts: {grid_x, grid_y, cell_size, pitch_x, pitch_y,
-    avatar_cx, avatar_cy, avatar_r}. Empty list if nothing detected.
+    Padding each row with a False on both sides means every run has exactly
+    one rising and one falling edge in np.diff, and np.nonzero reports both in
+    row-major order -- so the k-th rise and the k-th fall are the same run.
     """
-    w, h = img.size
-    pixels = img.load()
-
-    # Inline tile check — 3 squared distances (GREEN/YELLOW/GRAY; EMPTY is
-    # excluded, it aliases the background) under a tolerance. Hoisting the
-    # color constants into locals avoids repeated global lookups in the hot loop.
-    gR, gG, gB = _WORDLE_GREEN
-    yR, yG, yB = _WORDLE_YELLOW
-    aR, aG, aB = _WORDLE_GRAY
-    tol2 = 25  # tol=5 squared
-
-    def is_tile(px):
-        r, g, b = px
-        dr = r - gR; dg = g - gG; db = b - gB
-        if dr * dr + dg * dg + db * db < tol2:
-            return True
-        dr = r - yR; dg = g - yG; db = b - yB
-        if dr * dr + dg * dg + db * db < tol2:
-            return True
-        dr = r - aR; dg = g - aG; db = b - aB
-        return dr * dr + dg * dg + db * db < tol2
-
-    def cell_runs_on_row(y):
-        runs = []
-        in_run = False
-        start = 0
-        for x in range(w):
-            if is_tile(pixels[x, y]):
-                if not in_run:
-                    start = x
-                    in_run = True
-            elif in_run:
-                if x - start >= 3:
-                    runs.append((start, x - 1))
-                in_run = False
-        if in_run and w - start >= 3:
-            runs.append((start, w - 1))
-        return runs
-
-    def group_by_player(runs):
-        if not runs:
-            return []
-        bands = []
-        cur = [runs[0]]
-        for r in runs[1:]:
-            # Cells in same grid have gaps < 4px (1px stride gap). Player separators are wider.
-            if r[0] - cur[-1][1] < 8:
-                cur.append(r)
-            else:
-                bands.append(cur)
-                cur = [r]
-        bands.append(cur)
-        valid = []
-        for band in bands:
-            if len(band) != 5:
-                continue
-            widths = [r[1] - r[0] + 1 for r in band]
-            if max(widths) - min(widths) <= 2:
-                valid.append(band)
-        return valid
-
-    # Phase 1: coarse pass — find rows with tile pixels. Cells are ≥15px tall,
-    # so sampling every 4 rows cannot miss a grid row entirely.
-    candidate_ys = []
-    for y in range(0, h, 4):
-        for x in range(0, w, 8):  # also stride horizontally — cells are ≥15px wide
-            if is_tile(pixels[x, y]):
-                candidate_ys.append(y)
-                break
+    import numpy as np
 
-    # Phase 2: full scan of each candidate row; keep best
-    best_bands = []
-    for y in candidate_ys:
-        runs = cell_runs_on_row(y)
-        if not runs:
-            continue
-        bands = group_by_player(runs)
-        if len(bands) > len(best_bands):
-            best_bands = bands
+    edges = np.diff(np.pad(mask, ((0, 0), (1, 1))).view(np.int8), axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    ends = np.nonzero(edges == -1)[1] - 1
+    return rows, starts, ends
 
-    if not best_bands:
-        return []
+
+def _valid_bands(mask, scale=1):
+    """The 5-cell player bands across the rows of a 2-D tile mask, as
+    (row, grid_x, cell_size, pitch_x) arrays in row-major order.
+
+    Runs of ≥3 tile pixels are cells. Cells in same grid have gaps < 4px (1px
+    stride gap); player separators are wider -- so a band breaks where the row
+    changes or the gap from the previous run reaches 8. A band is valid with
+    exactly five cells whose widths agree within 2px of full resolution.
+    """
+    import numpy as np
+
+    rows, starts, ends = _runs(mask)
+    keep = ends - starts + 1 >= 3
+    rows, starts, ends = rows[keep], starts[keep], ends[keep]
+    if not len(rows):
+        return rows, starts, starts, starts
+
+    breaks = np.ones(len(rows), dtype=bool)
+    breaks[1:] = (rows[1:] != rows[:-1]) | (starts[1:] - ends[:-1] >= 8)
+    band_at = np.nonzero(breaks)[0]
+    widths = ends - starts + 1
+    band_len = np.diff(np.append(band_at, len(rows)))
+    spread = (np.maximum.reduceat(widths, band_at)
+              - np.minimum.reduceat(widths, band_at))
+    first = band_at[(band_len == 5) & (spread <= 2 * scale)]
+    return rows[first], starts[first], widths[first], starts[first + 1] - starts[first]
+
+
+def _detect_grids(arr, scale=1):
+    """Detect Wordle grid positions in a preview image, given as an (h, w, 3)
+    int32 array.
+
+    Every scan below is run-finding on a tile mask of a slice of the array
+    (_tile_mask). Only the slices the scan reads are masked -- about a
+    thirtieth of the pixels for the coarse pass, then the candidate rows and
+    one column per grid -- which is what kept the old per-pixel loop
+    competitive on small previews:
+      1. Coarse pass (every 4th row, every 8th column) to find rows that contain
+         any tile-colored pixels -- a small candidate list.
+      2. Cell runs on every candidate row at once, grouped into 5-cell player
+         bands (_valid_bands); the row with the most bands wins (the first on
+         ties).
+      3. A walk down each band's first column for the rows of cells
+         (_grids_below).
+
+    `scale` is how many times smaller than the bot's own rendering the image
+    is (a reduced rendition, see WORDLE_REDUCED_SCALE): the strides, the band
+    gap and the avatar offset, all sized for full resolution, shrink with it.
+
+    Returns (band_row, bands, grids): the image row the bands were read from;
+    its (grid_x, cell_size, pitch_x) bands; and a list of dicts: {grid_x,
+    grid_y, cell_size, pitch_x, pitch_y, avatar_cx, avatar_cy, avatar_r}, in
+    the image's own pixels. Empty lists if nothing detected.
+    """
+    import numpy as np
+
+    # Phase 1: coarse pass. Cells are ≥15px tall and wide, so sampling every 4
+    # rows and 8 columns cannot miss a grid row entirely.
+    row_step, col_step = max(1, 4 // scale), max(1, 8 // scale)
+    candidate_ys = np.nonzero(_tile_mask(arr[::row_step, ::col_step]).any(axis=1))[0] * row_step
+    if not len(candidate_ys):
+        return None, [], []
+
+    # Phase 2: player bands on every candidate row.
+    rows, starts, widths, pitches = _valid_bands(_tile_mask(arr[candidate_ys]), scale)
+    if not len(rows):
+        return None, [], []
+    per_row = np.bincount(rows, minlength=len(candidate_ys))
+    best = int(per_row.argmax())
+    on_best = rows == best
+
+    bands = list(zip(starts[on_best].tolist(), widths[on_best].tolist(),
+                     pitches[on_best].tolist()))
+    return int(candidate_ys[best]), bands, _grids_below(arr, bands, scale)
+
+
+def _grids_below(arr, bands, scale=1):
+    """Phase 3 of _detect_grids: the grid under each (grid_x, cell_size,
+    pitch_x) band, found by walking down the band's first column. A band whose
+    column shows no cell-high tile run (an all-empty grid's outline can pass
+    for a band) has no grid."""
+    import numpy as np
 
     grids = []
-    for band in best_bands:
-        grid_x = band[0][0]
-        cell_size = band[0][1] - band[0][0] + 1
-        pitch_x = band[1][0] - band[0][0]
-        cx = (band[0][0] + band[0][1]) // 2
-
-        # Walk column cx top-to-bottom, find tile runs (each = one row of cells)
-        tile_rows = []
-        in_run = False
-        rs = 0
-        for y in range(h):
-            if is_tile(pixels[cx, y]):
-                if not in_run:
-                    rs = y
-                    in_run = True
-            elif in_run:
-                if abs((y - rs) - cell_size) <= 2:
-                    tile_rows.append((rs, y - 1))
-                in_run = False
-        if in_run and abs((h - rs) - cell_size) <= 2:
-            tile_rows.append((rs, h - 1))
-
-        if not tile_rows:
+    for grid_x, cell_size, pitch_x in bands:
+        cx = (2 * grid_x + cell_size - 1) // 2
+
+        # Walk column cx top-to-bottom; each tile run the height of a cell
+        # (within 2px) is one row of cells.
+        _, rs, run_ends = _runs(_tile_mask(arr[None, :, cx]))
+        tile_rows = rs[np.abs(run_ends - rs + 1 - cell_size) <= 2 * scale]
+
+        if not len(tile_rows):
             continue
 
-        grid_y = tile_rows[0][0]
-        pitch_y = tile_rows[1][0] - tile_rows[0][0] if len(tile_rows) > 1 else pitch_x
+        grid_y = int(tile_rows[0])
+        pitch_y = int(tile_rows[1]) - grid_y if len(tile_rows) > 1 else pitch_x
 
         # Multi-player layouts stack the avatar circle directly above each grid.
         # Avatar diameter ≈ grid width; sits with a small gap above grid_y.
         grid_width = pitch_x * 5 - (pitch_x - cell_size)
         avatar_r = grid_width // 2
         avatar_cx = grid_x + grid_width // 2
-        avatar_cy = max(0, grid_y - avatar_r - 18)
+        avatar_cy = max(0, grid_y - avatar_r - 18 // scale)
 
         grids.append({
             'grid_x': grid_x,
@@ -240,39 +258,123 @@ def _detect_grids(img):
             'avatar_cy': avatar_cy,
             'avatar_r': avatar_r,
         })
+    return grids
+
 
+# The bot draws every preview from a handful of layouts -- one per image size
+# and player count -- and the costly part of _detect_grids is finding where
+# the layout's bands are: the coarse pass and run-finding on every candidate
+# row. Once a layout is known, a new image of the same size only has to show
+# the same bands on the same row (one row of run-finding) to skip both; the
+# column walks under the bands still run, so grid_y, pitch_y and which grids
+# are empty come from the image itself. Keyed by (width, height, scale, band
+# count); the least recently fitted layout gives way past the cap.
+WORDLE_LAYOUT_CACHE_SIZE = 32
+_wordle_layouts = OrderedDict()   # (w, h, scale, bands) -> (band row, bands)
+_wordle_layouts_lock = threading.Lock()
+
+
+def _proven(grids, bands, band_row):
+    """True if every band has its grid and the band row crosses each grid's
+    first row of cells -- the row _detect_grids settles on for a clean image
+    of the layout. A noisy image can settle elsewhere (a lower row, a band
+    whose column walk fails); its geometry is neither kept nor reused."""
+    return bool(grids) and len(grids) == len(bands) and all(
+        g['grid_y'] <= band_row < g['grid_y'] + g['cell_size'] for g in grids)
+
+
+def _locate_grids(arr, scale=1):
+    """_detect_grids through the layout cache: the grids under a known
+    layout's bands if this image shows exactly those bands on its band row,
+    else a full detection, whose layout is then remembered."""
+    h, w = arr.shape[:2]
+    with _wordle_layouts_lock:
+        known = [(key, layout) for key, layout in _wordle_layouts.items()
+                 if key[:3] == (w, h, scale)]
+    # Layouts of one size mostly share a band row; read each row once.
+    seen = {}
+    for key, (band_row, bands) in known:
+        if band_row not in seen:
+            _, starts, widths, pitches = _valid_bands(
+                _tile_mask(arr[band_row:band_row + 1]), scale)
+            seen[band_row] = list(zip(starts.tolist(), widths.tolist(), pitches.tolist()))
+        if seen[band_row] != bands:
+            continue
+        grids = _grids_below(arr, bands, scale)
+        if _proven(grids, bands, band_row):
+            with _wordle_layouts_lock:
+                if key in _wordle_layouts:
+                    _wordle_layouts.move_to_end(key)
+            return grids
+
+    band_row, bands, grids = _detect_grids(arr, scale)
+    if _proven(grids, bands, band_row):
+        key = (w, h, scale, len(bands))
+        with _wordle_layouts_lock:
+            _wordle_layouts[key] = (band_row, bands)
+            _wordle_layouts.move_to_end(key)
+            while len(_wordle_layouts) > WORDLE_LAYOUT_CACHE_SIZE:
+                _wordle_layouts.popitem(last=False)
     return grids
 
 
-def _parse_single_grid(img, grid_x, grid_y, cell_size, pitch_x, pitch_y):
-    """Read a single 5x6 Wordle grid.
+def _read_grids(arr, grids, spread=0):
+    """Read every detected 5x6 Wordle grid at once.
 
-    Returns:
+    All cell centres of all grids are gathered with one fancy index into the
+    (h, w, 3) array, (grids, 6 rows, 5 cols), and classified against the four
+    cell colours in one broadcast of squared distances. `spread` widens each
+    sample to the (2*spread+1)^2 pixels around the centre, averaged before
+    classifying -- sturdier against a stray antialiased pixel, at the cost of a
+    bigger gather. The default samples the centre pixel alone.
+
+    Returns one score per grid, in order:
         int 1..6: solved in that many guesses
         7: X/6 (6 rows filled, last row not all green)
         -1: in progress (some rows filled, not solved, fewer than 6)
         None: empty (no rows filled)
     """
-    filled_rows = 0
-    last_row_all_green = False
-    for row in range(6):
-        cy = grid_y + row * pitch_y + cell_size // 2
-        row_colors = [
-            _classify_cell(img.getpixel((grid_x + col * pitch_x + cell_size // 2, cy)))
-            for col in range(5)
-        ]
-        if all(c == 'empty' for c in row_colors):
-            break
-        filled_rows += 1
-        last_row_all_green = all(c == 'green' for c in row_colors)
+    import numpy as np
 
-    if filled_rows == 0:
-        return None
-    if last_row_all_green:
-        return filled_rows
-    if filled_rows == 6:
-        return DEFAULT_WORDLE_TOTAL + 1  # X/6
-    return -1  # in progress
+    if not grids:
+        return []
+    gx, gy, size, px, py = (np.array([g[k] for g in grids]).reshape(-1, 1, 1)
+                            for k in ('grid_x', 'grid_y', 'cell_size', 'pitch_x', 'pitch_y'))
+    xs = gx + np.arange(5).reshape(1, 1, 5) * px + size // 2    # (G, 1, 5)
+    ys = gy + np.arange(6).reshape(1, 6, 1) * py + size // 2    # (G, 6, 1)
+    if spread:
+        offsets = np.arange(-spread, spread + 1)
+        xs = xs[..., None, None] + offsets.reshape(1, -1)      # (G, 1, 5, 1, k)
+        ys = ys[..., None, None] + offsets.reshape(-1, 1)      # (G, 6, 1, k, 1)
+    h, w = arr.shape[:2]
+    cells = arr[np.clip(ys, 0, h - 1), np.clip(xs, 0, w - 1)]
+    if spread:
+        cells = cells.mean(axis=(3, 4))
+    # cells is (G, 6, 5, 3); against the (4, 3) palette -> (G, 6, 5, 4).
+    palette = np.array([_WORDLE_GREEN, _WORDLE_YELLOW, _WORDLE_GRAY, _WORDLE_EMPTY])
+    dist2 = ((cells[..., None, :] - palette) ** 2).sum(axis=-1)
+    kind = dist2.argmin(axis=-1)
+    kind[dist2.min(axis=-1) >= _CELL_MAX_DISTANCE2] = _CELL_UNKNOWN
+
+    # A grid's filled rows end at its first all-empty row (argmax finds the
+    # first True; the appended column stands in for "no empty row" -> 6).
+    empty_row = (kind == _CELL_EMPTY).all(axis=2)
+    filled = np.concatenate([empty_row, np.ones((len(grids), 1), dtype=bool)],
+                            axis=1).argmax(axis=1)
+    green_row = (kind == _CELL_GREEN).all(axis=2)
+    last_green = green_row[np.arange(len(grids)), np.maximum(filled - 1, 0)]
+
+    scores = []
+    for n, solved in zip(filled.tolist(), last_green.tolist()):
+        if n == 0:
+            scores.append(None)
+        elif solved:
+            scores.append(n)
+        elif n == 6:
+            scores.append(DEFAULT_WORDLE_TOTAL + 1)  # X/6
+        else:
+            scores.append(-1)  # in progress
+    return scores
 
 
 def _avatar_ahash(img_crop):
@@ -299,12 +401,93 @@ def _avatar_ahash(img_crop):
     return bits
 
 
-def _hamming(a, b):
-    return bin(a ^ b).count('1')
+def _popcount64(x):
+    """Set bits per element of a uint64 array. np.bitwise_count is NumPy 2;
+    older builds count through a byte lookup table instead."""
+    import numpy as np
+
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x).astype(np.int32)
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.int32)
+    return table[x[..., None].view(np.uint8)].sum(axis=-1)
+
+
+def _assign(cost):
+    """Minimum-cost assignment of rows to distinct columns (rows <= columns).
+
+    The Hungarian method in its shortest-augmenting-path form, one row added
+    per round with the dual potentials u/v kept feasible. Pure Python: the
+    matrices here are a handful of grids by a few dozen columns, where the
+    O(n^2 m) loop costs less than the NumPy call overhead would. Returns the
+    column index for each row.
+    """
+    n, m = len(cost), len(cost[0])
+    inf = float('inf')
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    owner = [0] * (m + 1)   # column -> 1-based row, 0 for free
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        owner[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            row = cost[i0 - 1]
+            delta, j1 = inf, 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+    assigned = [None] * n
+    for j in range(1, m + 1):
+        if owner[j]:
+            assigned[owner[j] - 1] = j - 1
+    return assigned
+
+
+def _crop_hashes(img, grids):
+    """Average hash of the avatar above each grid, or None where the crop is
+    too small to mean anything (a grid at the very edge of the image)."""
+    w, h = img.size
+    hashes = []
+    for grid in grids:
+        cx, cy, r = grid['avatar_cx'], grid['avatar_cy'], grid['avatar_r']
+        left = max(0, cx - r)
+        upper = max(0, cy - r)
+        right = min(w, cx + r)
+        lower = min(h, cy + r)
+        if right - left < 8 or lower - upper < 8:
+            hashes.append(None)
+        else:
+            hashes.append(_avatar_ahash(img.crop((left, upper, right, lower))))
+    return hashes
+
 
+def _match_avatars(crop_hashes, candidate_hashes, max_distance=18, margin=4):
+    """Attribute every grid in an image to a candidate user, one user per grid.
 
-def _match_avatar(img, grid, candidate_hashes, max_distance=18, margin=4):
-    """Crop the avatar at grid position, compare against candidate hashes.
+    crop_hashes holds each grid's avatar hash (_crop_hashes), so this step
+    needs no pixels and can re-run alone whenever the pool changes.
 
     candidate_hashes maps user_id -> one hash or several, because a member can
     be rendered with either their server-profile avatar or their global one and
@@ -312,75 +495,152 @@ def _match_avatar(img, grid, candidate_hashes, max_distance=18, margin=4):
     closest picture, so `margin` below always compares two *different people*
     rather than two pictures of the same one.
 
-    Returns matched user_id or None. Requires the best match to beat the
-    second-best by at least `margin` bits to guard against default-avatar
-    look-alikes.
+    Every crop hash is XORed against every pool hash in one uint64 broadcast
+    and popcounted, then reduced to a grids x users distance matrix. Grids are
+    assigned jointly (_assign) so two grids can never claim the same player:
+    a user is eligible for a grid within `max_distance` bits, and each grid
+    also has a private "nobody" column priced just above that, so leaving a
+    grid unattributed always costs more than any eligible match. The margin
+    guard against default-avatar look-alikes then runs per grid against the
+    runner-up among every other user, attributed elsewhere or not, exactly as
+    the one-grid-at-a-time matcher did: the joint assignment decides who goes
+    where, it never makes a look-alike safe to accept.
+
+    Returns a user_id or None per grid, in order.
     """
-    if not candidate_hashes:
-        return None
-    cx, cy, r = grid['avatar_cx'], grid['avatar_cy'], grid['avatar_r']
-    w, h = img.size
-    left = max(0, cx - r)
-    upper = max(0, cy - r)
-    right = min(w, cx + r)
-    lower = min(h, cy + r)
-    if right - left < 8 or lower - upper < 8:
-        return None
-    crop = img.crop((left, upper, right, lower))
-    crop_hash = _avatar_ahash(crop)
+    import numpy as np
 
-    scored = []
+    matched = [None] * len(crop_hashes)
+    if not candidate_hashes:
+        return matched
+    uids, owners, pool = [], [], []
     for uid, hashes in candidate_hashes.items():
         if not hashes:
             continue
-        scored.append((uid, min(_hamming(crop_hash, ah) for ah in hashes)))
-    if not scored:
-        return None
-    scored.sort(key=lambda x: x[1])
-    best_uid, best_d = scored[0]
-    if best_d > max_distance:
-        return None
-    if len(scored) > 1 and scored[1][1] - best_d < margin:
-        return None
-    return best_uid
+        owners.extend([len(uids)] * len(hashes))
+        pool.extend(hashes)
+        uids.append(uid)
+    if not uids:
+        return matched
+
+    rows = [i for i, h in enumerate(crop_hashes) if h is not None]
+    if not rows:
+        return matched
+
+    bits = _popcount64(np.array([crop_hashes[i] for i in rows], dtype=np.uint64)[:, None]
+                       ^ np.array(pool, dtype=np.uint64)[None, :])
+    # Closest picture per user: (grids, pool hashes) -> (grids, users).
+    dist = np.full((len(rows), len(uids)), 65, dtype=np.int32)
+    np.minimum.at(dist.T, np.array(owners), bits.T)
+
+    eligible = np.nonzero((dist <= max_distance).any(axis=0))[0]
+    if not len(eligible):
+        return matched
+    nobody = max_distance + 1
+    cost = np.where(dist[:, eligible] <= max_distance, dist[:, eligible], 2 * nobody)
+    cost = np.hstack([cost, np.full((len(rows), len(rows)), nobody)])
+    columns = _assign(cost.tolist())
+
+    for k, col in enumerate(columns):
+        if col >= len(eligible):
+            continue
+        user = eligible[col]
+        others = np.ones(len(uids), dtype=bool)
+        others[user] = False
+        if others.any() and dist[k, others].min() - dist[k, user] < margin:
+            continue
+        matched[rows[k]] = uids[user]
+    return matched
 
 
-def parse_wordle_image(image_bytes, candidate_hashes=None):
-    """Parse a Wordle bot preview image.
+# One decoded preview: where its grids are, what each one scored, and the hash
+# of the avatar above each. Everything parse_wordle_image needs except the
+# pool, so it can be cached per attachment while attribution re-runs.
+WordleDecode = namedtuple('WordleDecode', 'grids scores crop_hashes')
+
+
+# Linear factor the preview is shrunk by before it is scanned. Image.reduce is a
+# box filter: each output pixel is the exact mean of a 2x2 block, so a cell's
+# interior keeps its colour to the unit and only its edge pixels blend with
+# the gap. Lanczos or bicubic resizing (a proxy rendition, say) rings at those
+# edges, and on the sample corpus misread whole rows. A quarter of the pixels
+# then go through the RGB conversion, the int32 array and every scan.
+WORDLE_REDUCED_SCALE = 2
+
 
-    Returns a list of (user_id_or_None, score) pairs for every finished grid we
-    could attribute. For single-player images, yields [(None, score)] and the
-    caller assigns the user from message metadata. For multi-player images,
-    yields one entry per grid that we matched to a candidate user. Unfinished
-    grids and unmatchable grids are dropped.
+def decode_wordle_image(image_bytes, scale=WORDLE_REDUCED_SCALE):
+    """Geometry, scores and avatar crop hashes of a Wordle bot preview image.
+
+    Read at 1/scale resolution first (WORDLE_REDUCED_SCALE), and again at full
+    resolution if that finds no grid or a grid it can't read -- a reduction
+    can only lose a grid, never invent one. The full-resolution read is final:
+    a grid still unreadable there scores None and the others stand. Geometry
+    is in the pixels of whichever image produced it.
+
+    Crop hashes are only taken for multi-player images: a single grid is
+    attributed to the message's own user, never by face.
     """
     from PIL import Image
     import io
+    import numpy as np
+
+    source = Image.open(io.BytesIO(image_bytes))
+    source.load()
+    for factor in ((scale, 1) if scale > 1 else (1,)):
+        img = (source.reduce(factor) if factor > 1 else source).convert('RGB')
+        arr = np.asarray(img, dtype=np.int32)  # (h, w, 3), shared by both passes
+        grids = _locate_grids(arr, factor)
+        if not grids:
+            continue
+        scores = _read_grids(arr, grids)
+        if None in scores and factor > 1:
+            # A grid the reduction left unreadable may read at full
+            # resolution. At full resolution an unreadable grid is just an
+            # unfinished game: keep it as None with the rest, and let
+            # attribute_wordle drop it -- the other players still score.
+            continue
+        crop_hashes = _crop_hashes(img, grids) if len(grids) > 1 else [None]
+        return WordleDecode(grids, scores, crop_hashes)
+    return WordleDecode([], [], [])
 
-    img = Image.open(io.BytesIO(image_bytes)).convert('RGB')
-    grids = _detect_grids(img)
-    if not grids:
-        return []
 
+def attribute_wordle(decoded, candidate_hashes=None):
+    """(user_id_or_None, score) pairs for a decoded image against a pool.
+
+    For single-player images, yields [(None, score)] and the caller assigns the
+    user from message metadata. For multi-player images, yields one entry per
+    grid that we matched to a candidate user. Unfinished grids and unmatchable
+    grids are dropped.
+    """
     results = []
-    if len(grids) == 1:
-        g = grids[0]
-        score = _parse_single_grid(img, g['grid_x'], g['grid_y'], g['cell_size'], g['pitch_x'], g['pitch_y'])
+    if len(decoded.grids) == 1:
+        score = decoded.scores[0]
         if score is not None and score != -1:
             results.append((None, score))
         return results
 
-    for g in grids:
-        score = _parse_single_grid(img, g['grid_x'], g['grid_y'], g['cell_size'], g['pitch_x'], g['pitch_y'])
-        if score is None or score == -1:
-            continue
-        uid = _match_avatar(img, g, candidate_hashes)
-        if uid is None:
+    # Every grid takes part in attribution, finished or not: a player still
+    # mid-game is in the picture too, and must not lend their face to a
+    # neighbouring grid.
+    uids = _match_avatars(decoded.crop_hashes, candidate_hashes)
+    for uid, score in zip(uids, decoded.scores):
+        if score is None or score == -1 or uid is None:
             continue
         results.append((uid, score))
     return results
 
 
+def parse_wordle_image(image_bytes, candidate_hashes=None):
+    """Parse a Wordle bot preview image: decode_wordle_image, then
+    attribute_wordle. Returns the (user_id_or_None, score) pairs."""
+    return attribute_wordle(decode_wordle_image(image_bytes), candidate_hashes)
+
+
+# Concurrent image downloads per prefetch (prefetch_wordle_attachments). The
+# fetch session keeps exactly this many connections per host, so every worker
+# holds a live one and none is opened only to be thrown away.
+WORDLE_FETCH_WORKERS = 8
+
 _wordle_fetch_session = None
 
 
@@ -392,7 +652,8 @@ def _get_wordle_fetch_session():
         _wordle_fetch_session = requests.Session()
         _wordle_fetch_session.mount(
             'https://',
-            requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=8),
+            requests.adapters.HTTPAdapter(pool_connections=2,
+                                          pool_maxsize=WORDLE_FETCH_WORKERS),
         )
     return _wordle_fetch_session
 
@@ -407,46 +668,290 @@ def _get_wordle_fetch_session():
 WORDLE_BOT_ID = '1211781489931452447'
 
 
-# Parsed results per attachment. Attachments are immutable, so a decoded grid
-# never changes; the avatar-hash pool rides in the key because multi-player
-# attribution depends on it, and a changed pool (a member's new avatar) must
-# recompute. Without this, the sticky's one-minute tick re-downloaded and
-# re-decoded every in-window image on every pass. Only a completed download is
-# cached -- a transient CDN failure stays retryable -- and callers must treat
-# the returned list as read-only. Cleared wholesale if it somehow outgrows any
-# plausible in-window population.
-_wordle_result_cache = {}
+# Decoded images per attachment id, least recently used first. Attachments are
+# immutable, so a decode never changes -- and the pool is deliberately not part
+# of the key: attribution (attribute_wordle) re-runs against whatever pool the
+# caller brings, so a member's new avatar costs a few popcounts, not a
+# re-download of every image. Without this, the sticky's one-minute tick
+# re-downloaded and re-decoded every in-window image on every pass. Only a
+# completed download is cached -- a transient CDN failure stays retryable --
+# and the oldest entries give way once the estimated size passes the budget.
+WORDLE_DECODE_CACHE_BYTES = 2 * 1024 * 1024
+_wordle_decode_cache = OrderedDict()   # attachment id -> (WordleDecode, est. bytes)
+_wordle_decode_bytes = 0
+_wordle_decode_lock = threading.Lock()
+
+
+def _decode_size(decoded):
+    """Rough resident size of a WordleDecode: the containers plus one geometry
+    dict and two small ints per grid."""
+    size = sys.getsizeof(decoded) + sum(sys.getsizeof(part) for part in decoded)
+    if decoded.grids:
+        size += len(decoded.grids) * (sys.getsizeof(decoded.grids[0]) + 64)
+    return size
+
+
+def _cached_decode(key):
+    with _wordle_decode_lock:
+        entry = _wordle_decode_cache.get(key)
+        if entry is None:
+            return None
+        _wordle_decode_cache.move_to_end(key)
+        return entry[0]
+
+
+def _cache_decode(key, decoded):
+    global _wordle_decode_bytes
+    size = _decode_size(decoded)
+    with _wordle_decode_lock:
+        old = _wordle_decode_cache.pop(key, None)
+        if old:
+            _wordle_decode_bytes -= old[1]
+        _wordle_decode_cache[key] = (decoded, size)
+        _wordle_decode_bytes += size
+        while _wordle_decode_bytes > WORDLE_DECODE_CACHE_BYTES and len(_wordle_decode_cache) > 1:
+            _, (_, evicted) = _wordle_decode_cache.popitem(last=False)
+            _wordle_decode_bytes -= evicted
+
+
+def _is_wordle_result(attachment):
+    """True for a Wordle bot image worth decoding. Recap images (streak
+    summaries) use "solved" in their description rather than
+    "finished"/"unfinished", and are skipped."""
+    return (attachment.get('content_type', '').startswith('image/')
+            and 'finished' in attachment.get('description', ''))
+
+
+def _attachment_key(attachment):
+    return attachment.get('id') or attachment['url'].split('?', 1)[0]
+
+
+def _fetch_decode(attachment, pool=None):
+    """The attachment's WordleDecode, from the cache or the CDN; None when the
+    download failed (and so is worth retrying later). The decode runs in
+    `pool` (an ImagePool) when given, in this process otherwise."""
+    key = _attachment_key(attachment)
+    decoded = _cached_decode(key)
+    if decoded is not None:
+        return decoded
+    try:
+        img_response = _get_wordle_fetch_session().get(attachment['url'], timeout=4)
+        img_response.raise_for_status()
+    except Exception:
+        return None
+    try:
+        decoded = (pool.decode(img_response.content) if pool
+                   else decode_wordle_image(img_response.content))
+    except Exception:
+        decoded = WordleDecode([], [], [])
+    _cache_decode(key, decoded)
+    return decoded
 
 
 def parse_wordle_attachment(attachment, candidate_hashes=None):
     """Download and parse a Wordle bot image attachment.
 
     Returns list of (user_id_or_None, score) pairs; empty list on skip/failure.
-    Skips recap images (streak summaries) — those use "solved" in their
-    description rather than "finished"/"unfinished".
     """
-    if not attachment.get('content_type', '').startswith('image/'):
+    if not _is_wordle_result(attachment):
         return []
-    desc = attachment.get('description', '')
-    if 'finished' not in desc:
+    decoded = _fetch_decode(attachment)
+    if decoded is None:
         return []
-    cache_key = (attachment.get('id') or attachment['url'].split('?', 1)[0],
-                 tuple(sorted((candidate_hashes or {}).items())))
-    if cache_key in _wordle_result_cache:
-        return _wordle_result_cache[cache_key]
-    try:
-        img_response = _get_wordle_fetch_session().get(attachment['url'], timeout=4)
-        img_response.raise_for_status()
-    except Exception:
-        return []
-    try:
-        result = parse_wordle_image(img_response.content, candidate_hashes)
-    except Exception:
-        result = []
-    if len(_wordle_result_cache) > 128:
-        _wordle_result_cache.clear()
-    _wordle_result_cache[cache_key] = result
-    return result
+    return attribute_wordle(decoded, candidate_hashes)
+
+
+def _window_attachments(messages, timestamp_checker):
+    """Every Wordle bot result image posted inside the window."""
+    for msg in messages:
+        if (msg['author']['id'] != WORDLE_BOT_ID or not msg.get('attachments')
+                or not timestamp_checker(msg['timestamp'])):
+            continue
+        for attachment in msg['attachments']:
+            if _is_wordle_result(attachment):
+                yield attachment
+
+
+def wordle_decodes(messages, timestamp_checker):
+    """WordleDecode of every in-window Wordle bot image, fetched side by side
+    (prefetch_wordle_attachments) where the cache doesn't have them. An image
+    whose download failed is left out."""
+    prefetch_wordle_attachments(messages, timestamp_checker)
+    decodes = []
+    for attachment in _window_attachments(messages, timestamp_checker):
+        decoded = _cached_decode(_attachment_key(attachment))
+        if decoded is not None:
+            decodes.append(decoded)
+    return decodes
+
+
+def prefetch_wordle_attachments(messages, timestamp_checker):
+    """Download and decode every in-window Wordle bot image at once.
+
+    match_message reaches a bot image one message at a time, inside the
+    caller's serial loop, so a window holding several paid each CDN round trip
+    in turn. Run this first and they are fetched side by side into the decode
+    cache, where match_message then finds them. Returns how many were fetched;
+    a failed download is simply left for match_message to retry.
+
+    With several to fetch, the decodes go to the image pool when one is
+    configured (image_pool), so they overlap each other as well as the
+    downloads.
+    """
+    pending = {}
+    for attachment in _window_attachments(messages, timestamp_checker):
+        key = _attachment_key(attachment)
+        if key not in pending and _cached_decode(key) is None:
+            pending[key] = attachment
+    if len(pending) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        pool = image_pool()
+        with ThreadPoolExecutor(max_workers=min(WORDLE_FETCH_WORKERS, len(pending))) as ex:
+            list(ex.map(lambda att: _fetch_decode(att, pool), pending.values()))
+    elif pending:
+        _fetch_decode(*pending.values())
+    return len(pending)
+
+
+# Image decoding, grid detection and hashing are pure CPU and hold the GIL, so
+# the fetch threads above overlap only the downloads. IMAGE_WORKERS > 0 routes
+# the CPU half of a batch to that many worker processes instead -- worth it
+# only where the function has a second vCPU to run them on (Lambda grants one
+# per 1769MB; at 512MB a worker just queues behind the parent), which is why
+# it is opt-in. tools/bench_wordle.py --workers measures a batch both ways.
+#
+# Plain Process + Pipe rather than multiprocessing.Pool or a Queue: Lambda has
+# no /dev/shm, which the latter need for their semaphores. Workers are forked
+# (no re-import of the deploy zip per worker) and live as long as the
+# container. Forking is only safe while this process has one thread: a child
+# of a multi-threaded parent inherits every lock another thread held at that
+# moment (urllib3's, boto3's, the import lock) and can wait on one forever. So
+# each handler starts the pool before its GUILD_WORKERS / STICKY_WORKERS
+# executor, and image_pool() will not fork once other threads run.
+# Forkserver and spawn avoid the hazard but re-run the entry script in every
+# worker, which on Lambda is the runtime's own bootstrap. Subinterpreters are
+# no option while numpy and Pillow do not support them.
+IMAGE_WORKERS = int(os.getenv('IMAGE_WORKERS') or 0)
+
+# WordleDecode's geometry dicts cross the pipe as plain tuples in this order.
+_GRID_FIELDS = ('grid_x', 'grid_y', 'cell_size', 'pitch_x', 'pitch_y',
+                'avatar_cx', 'avatar_cy', 'avatar_r')
+
+
+def _image_job(kind, payload):
+    """Run one job on image bytes; what a worker computes, in the compact form
+    it sends back."""
+    if kind == 'decode':
+        decoded = decode_wordle_image(payload)
+        return ([tuple(g[k] for k in _GRID_FIELDS) for g in decoded.grids],
+                decoded.scores, decoded.crop_hashes)
+    if kind == 'ahash':
+        from PIL import Image
+        import io
+        return _avatar_ahash(Image.open(io.BytesIO(payload)).convert('RGB'))
+    raise ValueError(f'unknown image job {kind!r}')
+
+
+def _image_worker(conn):
+    """A worker's loop: (kind, bytes) in, (ok, result or error text) out,
+    until the parent closes its end."""
+    while True:
+        try:
+            kind, payload = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send((True, _image_job(kind, payload)))
+        except Exception as e:
+            conn.send((False, f'{type(e).__name__}: {e}'))
+
+
+class ImagePool:
+    """A fixed set of image worker processes, each behind its own pipe.
+
+    Safe to call from many threads at once: a caller takes an idle worker,
+    hands it one job and waits for the answer, so the threads that download
+    are also the ones that keep the workers busy. A job that fails in a
+    worker raises RuntimeError where the inline call would have raised. A
+    worker that dies leaves a None in its place in the rotation: whoever draws
+    it runs the job here instead, so callers waiting on the pool never hang on
+    a dead one.
+    """
+
+    def __init__(self, workers):
+        import multiprocessing
+        import queue
+
+        ctx = multiprocessing.get_context('fork')
+        self._idle = queue.Queue()
+        for _ in range(workers):
+            parent, child = ctx.Pipe()
+            ctx.Process(target=_image_worker, args=(child,), daemon=True).start()
+            child.close()
+            self._idle.put(parent)
+
+    def run(self, kind, payload):
+        conn = self._idle.get()
+        if conn is None:
+            self._idle.put(None)
+            return _image_job(kind, payload)
+        lost = None
+        try:
+            conn.send((kind, payload))
+            ok, result = conn.recv()
+        except (EOFError, OSError) as e:
+            lost = e
+            conn.close()
+            conn = None
+        finally:
+            # Every path hands the slot back -- the conn, or None once it is
+            # lost -- or callers blocked on _idle would wait for it forever.
+            # Anything else raised here (a pickling error) came before send
+            # wrote or after recv read, so the conn is still in step.
+            self._idle.put(conn)
+        if lost is not None:
+            print(f'image pool: worker lost ({type(lost).__name__}), running its jobs inline')
+            return _image_job(kind, payload)
+        if not ok:
+            raise RuntimeError(result)
+        return result
+
+    def decode(self, image_bytes):
+        """decode_wordle_image, in a worker."""
+        grids, scores, crop_hashes = self.run('decode', image_bytes)
+        return WordleDecode([dict(zip(_GRID_FIELDS, g)) for g in grids], scores, crop_hashes)
+
+    def ahash(self, image_bytes):
+        """_avatar_ahash of an encoded image, in a worker."""
+        return self.run('ahash', image_bytes)
+
+
+_shared_image_pool = None
+_shared_image_pool_lock = threading.Lock()
+
+
+def image_pool():
+    """The process's ImagePool, started on first use; None when IMAGE_WORKERS
+    is 0 or the platform cannot fork.
+
+    Also None, for now, when the pool is not up yet and other threads are
+    running: the work then runs inline rather than forking a multi-threaded
+    process. The handlers call this before starting any, so in the lambdas
+    the pool is always up by the time a guild thread asks for it.
+    """
+    global _shared_image_pool
+    if IMAGE_WORKERS <= 0:
+        return None
+    with _shared_image_pool_lock:
+        if _shared_image_pool is None:
+            if threading.active_count() > 1:
+                return None
+            try:
+                _shared_image_pool = ImagePool(IMAGE_WORKERS)
+            except (ValueError, OSError) as e:
+                print(f'image pool: unavailable, decoding inline -- {type(e).__name__}: {e}')
+                _shared_image_pool = False
+        return _shared_image_pool or None
 
 
 def get_connections_results(content):
@@ -486,6 +991,12 @@ class GameSpec:
                                          return (None, {}) to decline and let other
                                          games try the same message
     Optional:
+      anchor    a literal (case-insensitive) that every message the pattern can
+                match must contain -- usually the game's name as the share text
+                spells it. match_message only tries the games whose anchor
+                appears, so a chat message costs a few substring probes, not
+                one regex per game. None means "always try" (correct but
+                slow). A wrong anchor silently stops the game parsing.
       search    cheap pre-filter regex builder (same signature as pattern); if set,
                 it must match before the full pattern is attempted
       total_key puzzle_numbers slot whose value overrides `total` (bandle's total
@@ -506,6 +1017,7 @@ class GameSpec:
     parse: object               # callable(match, content) -> (score, metadata)
     needs_timestamp: bool = False
     search: object = None       # callable(reference_date, puzzle) -> re.Pattern
+    anchor: str = None          # literal the pattern requires, case-insensitive
     total_key: str = None       # puzzle_numbers key that overrides `total`
     disabled: bool = False
 
@@ -647,6 +1159,7 @@ GAME_SPECS = [
     GameSpec(
         key='connections', emoji='🔗', title='Connections', metric='connections',
         total=4, url='https://www.nytimes.com/games/connections',
+        anchor='Connections',
         puzzle=lambda ref: (ref - datetime(2023, 6, 12)).days + 1,
         pattern=lambda ref, n: re.compile(rf'Connections.*?Puzzle #{n}', re.IGNORECASE | re.DOTALL),
         parse=lambda m, c: (get_connections_results(c), {}),
@@ -654,6 +1167,7 @@ GAME_SPECS = [
     GameSpec(
         key='bandle', emoji='🎵', title='Bandle', metric='guesses',
         total=6, total_key='bandle_total', url='https://bandle.app/daily',
+        anchor='Bandle #',
         puzzle=lambda ref: (ref - datetime(2022, 8, 18)).days + 1,
         pattern=lambda ref, n: re.compile(rf'Bandle #{n} (\d+|x)/(\d+)', re.IGNORECASE),
         parse=_parse_bandle,
@@ -661,6 +1175,7 @@ GAME_SPECS = [
     GameSpec(
         key='sports', emoji='🏈', title='Sports Connections', metric='connections',
         total=4, url='https://www.nytimes.com/athletic/connections-sports-edition',
+        anchor='Connections: Sports Edition',
         puzzle=lambda ref: (ref - datetime(2024, 9, 24)).days + 1,
         pattern=lambda ref, n: re.compile(rf'Connections: Sports Edition.*? #{n}', re.IGNORECASE | re.DOTALL),
         parse=lambda m, c: (get_connections_results(c), {}),
@@ -668,6 +1183,7 @@ GAME_SPECS = [
     GameSpec(
         key='pips', emoji='🎲', title='Pips', metric='time',
         total=0, url='https://www.nytimes.com/games/pips',
+        anchor='Pips #',
         puzzle=lambda ref: (ref - datetime(2025, 8, 18)).days + 1,
         pattern=lambda ref, n: re.compile(rf'Pips #{n} Hard', re.IGNORECASE),
         parse=_parse_pips,
@@ -675,6 +1191,7 @@ GAME_SPECS = [
     GameSpec(
         key='maptap_challenge', emoji='⚡', title='MapTap Challenge', metric='maptap',
         total=0, url='https://maptap.gg/adventures?gametype=challenge', disabled=True,
+        anchor='MapTap Challenge Round',
         puzzle=lambda ref: (ref - datetime(2024, 6, 22)).days + 1,
         pattern=lambda ref, n: re.compile(rf'MapTap Challenge Round.*{ref.strftime("%b")} {ref.day}', re.IGNORECASE),
         parse=_parse_maptap_challenge,
@@ -682,6 +1199,7 @@ GAME_SPECS = [
     GameSpec(
         key='maptap', emoji='🎯', title='MapTap', metric='maptap',
         total=0, url='https://maptap.gg',
+        anchor='MapTap',
         puzzle=lambda ref: (ref - datetime(2024, 6, 22)).days + 1,
         pattern=lambda ref, n: re.compile(rf'(.*)MapTap(.*){ref.strftime("%B")} {ref.day}', re.IGNORECASE),
         parse=_parse_maptap,
@@ -689,6 +1207,7 @@ GAME_SPECS = [
     GameSpec(
         key='chronophoto', emoji='📷', title='Chronophoto', metric='score',
         total=0, url='https://www.chronophoto.app/daily.html',
+        anchor='Chronophoto: ',
         puzzle=lambda ref: f'{ref.month}/{ref.day}/{ref.year}',
         pattern=lambda ref, n: re.compile(rf"I got a score of (\d+) on today's Chronophoto: {re.escape(n)}", re.IGNORECASE),
         search=lambda ref, n: re.compile(re.escape(n), re.IGNORECASE),
@@ -697,6 +1216,7 @@ GAME_SPECS = [
     GameSpec(
         key='globle', emoji='🌍', title='Globle', metric='guesses',
         total=0, url='https://globle.org', needs_timestamp=True, disabled=True,
+        anchor='Globle in',
         puzzle=lambda ref: f'{ref.strftime("%B")} {ref.day}',
         pattern=lambda ref, n: re.compile(r"I guessed today['’]s Globle in (\d+) tr", re.IGNORECASE),
         parse=lambda m, c: (int(m.group(1)), {}),
@@ -704,6 +1224,7 @@ GAME_SPECS = [
     GameSpec(
         key='worldle', emoji='🗺️', title='Worldle', metric='guesses',
         total=0, url='https://worldlegame.io', needs_timestamp=True, disabled=True,
+        anchor='Worldle in',
         puzzle=lambda ref: f'{ref.strftime("%B")} {ref.day}',
         pattern=lambda ref, n: re.compile(r"I guessed today['’]s Worldle in (\d+) tr", re.IGNORECASE),
         parse=lambda m, c: (int(m.group(1)), {}),
@@ -711,6 +1232,7 @@ GAME_SPECS = [
     GameSpec(
         key='flagle', emoji='🏁', title='Flagle', metric='guesses',
         total=0, url='https://flagle.org', needs_timestamp=True, disabled=True,
+        anchor='Flag in',
         puzzle=lambda ref: f'{ref.strftime("%B")} {ref.day}',
         pattern=lambda ref, n: re.compile(r"I guessed today['’]s Flag in (\d+) tr", re.IGNORECASE),
         parse=lambda m, c: (int(m.group(1)), {}),
@@ -718,6 +1240,7 @@ GAME_SPECS = [
     GameSpec(
         key='quizl', emoji='⁉️', title='Quizl', metric='score',
         total=5, url='https://quizl.io',
+        anchor='Quizl#',
         puzzle=lambda ref: (ref - datetime(2022, 3, 16)).days + 1,
         pattern=lambda ref, n: re.compile(rf'Quizl#{n}', re.IGNORECASE),
         parse=_parse_quizl,
@@ -725,6 +1248,7 @@ GAME_SPECS = [
     GameSpec(
         key='wordle', emoji='📗', title='Wordle', metric='guesses',
         total=DEFAULT_WORDLE_TOTAL, url='https://www.nytimes.com/games/wordle',
+        anchor='Wordle',
         puzzle=lambda ref: (ref - datetime(2021, 6, 19)).days,
         pattern=lambda ref, n: re.compile(rf'Wordle\s+{n:,}\s+([1-6X])/6', re.IGNORECASE),
         parse=_parse_wordle,
@@ -732,6 +1256,7 @@ GAME_SPECS = [
     GameSpec(
         key='travle', emoji='✈️', title='Travle', metric='travle',
         total=0, url='https://travle.earth',
+        anchor='#travle',
         puzzle=lambda ref: (ref - datetime(2022, 12, 15)).days + 1,
         pattern=lambda ref, n: re.compile(rf'#travle\s+#{n}\s+(?:\+(\d+)|\((\d+)\s+away\))(?:[^\n]*?\((\d+)\s+hints?\))?[^\n]*(?:\n([^\n]*))?', re.IGNORECASE),
         parse=_parse_travle,
@@ -739,6 +1264,7 @@ GAME_SPECS = [
     GameSpec(
         key='dialed_color', emoji='🎨', title='Color', metric='score',
         total=50, url='https://dialed.gg/?d=1', needs_timestamp=True,
+        anchor='dialed.gg/?',
         puzzle=lambda ref: f'{ref.strftime("%B")} {ref.day}',
         pattern=lambda ref, n: re.compile(r'dialed\.gg/\?\S*&s=(\d+(?:\.\d+)?)', re.IGNORECASE),
         parse=lambda m, c: (float(m.group(1)), {}),
@@ -746,6 +1272,7 @@ GAME_SPECS = [
     GameSpec(
         key='dialed_sound', emoji='🔊', title='Sound', metric='score',
         total=50, url='https://dialed.gg/sound?d=1', needs_timestamp=True,
+        anchor='dialed.gg/sound?',
         puzzle=lambda ref: f'{ref.strftime("%B")} {ref.day}',
         pattern=lambda ref, n: re.compile(r'dialed\.gg/sound\?\S*&s=(\d+(?:\.\d+)?)', re.IGNORECASE),
         parse=lambda m, c: (float(m.group(1)), {}),
@@ -753,6 +1280,7 @@ GAME_SPECS = [
     GameSpec(
         key='dialed_color2', emoji='🎭', title='Pop Culture Colors', metric='score',
         total=50, url='https://dialed.gg/color2?d=1', needs_timestamp=True,
+        anchor='dialed.gg/color2?',
         puzzle=lambda ref: f'{ref.strftime("%B")} {ref.day}',
         pattern=lambda ref, n: re.compile(r'dialed\.gg/color2\?\S*&s=(\d+(?:\.\d+)?)', re.IGNORECASE),
         parse=lambda m, c: (float(m.group(1)), {}),
@@ -760,6 +1288,7 @@ GAME_SPECS = [
     GameSpec(
         key='enclose', emoji='🐴', title='Enclose', metric='score',
         total=100, url='https://enclose.horse',
+        anchor='enclose.horse Day ',
         puzzle=lambda ref: (ref - datetime(2025, 12, 30)).days + 1,
         pattern=lambda ref, n: re.compile(rf'enclose\.horse Day {n}\b.*?(\d+)%', re.IGNORECASE | re.DOTALL),
         parse=lambda m, c: (int(m.group(1)), {}),
@@ -767,6 +1296,7 @@ GAME_SPECS = [
     GameSpec(
         key='minutecryptic', emoji='🧩', title='Minute Cryptic', metric='guesses',
         total=0, url='https://www.minutecryptic.com',
+        anchor='Minute Cryptic',
         puzzle=lambda ref: (ref - datetime(2024, 6, 26)).days + 1,
         # Scored like golf on hints used, so fewer is better and 0 is a clean
         # solve -- the same shape as the other total=0 'guesses' games. The
@@ -785,6 +1315,7 @@ GAME_SPECS = [
     GameSpec(
         key='gerrymandle', emoji='🗳️', title='Gerrymandle', metric='timed_win',
         total=0, url='https://gerrymandle.com',
+        anchor='Gerrymandle #',
         puzzle=lambda ref: (ref - datetime(2026, 5, 11)).days + 1,
         # The headline line is all the pattern claims; _parse_gerrymandle digs
         # the clock out of it, because everything after the verb is optional and
@@ -928,10 +1459,57 @@ def build_games(puzzle_numbers, game_overrides=None):
             needs_timestamp=spec.needs_timestamp,
             search_pattern=patterns[1],
             parse=spec.parse,
+            anchor=spec.anchor,
         ))
     return games
 
 
+# Dispatch index per set of games: (probes, always). probes pairs each distinct
+# lowercased anchor with the indices of the games that carry it; always holds
+# the games with no anchor, which are tried on every message. A probe is a
+# plain substring test against the lowercased content -- a C-speed scan that
+# costs a fraction of a microsecond, where one regex alternation over all the
+# anchors turned out SLOWER than the per-game patterns it was meant to replace
+# (re tries every branch at every offset). Nested anchors ('Connections'
+# inside 'Connections: Sports Edition') need no special care: each is its own
+# probe. Anchors are spec constants, so the index depends only on WHICH games
+# are enabled -- a handful of entries for the life of a container.
+_dispatch_cache = {}
+
+
+def _dispatch_index(games):
+    keys = tuple(g.key for g in games)
+    index = _dispatch_cache.get(keys)
+    if index is None:
+        by_anchor = {}
+        for i, g in enumerate(games):
+            if g.anchor:
+                by_anchor.setdefault(g.anchor.lower(), []).append(i)
+        always = [i for i, g in enumerate(games) if not g.anchor]
+        index = _dispatch_cache[keys] = (tuple(by_anchor.items()), always)
+    return index
+
+
+def _candidate_games(content, games):
+    """The games whose anchor appears in content, in GAME_SPECS order."""
+    probes, always = _dispatch_index(games)
+    lowered = content.lower()
+    hits = list(always)
+    for anchor, indices in probes:
+        if anchor in lowered:
+            hits += indices
+    return [games[i] for i in sorted(hits)]
+
+
+def names_a_game(content):
+    """True if content contains some game's anchor -- the cheap test for "this
+    could be a shared result", with no puzzle numbers needed. Anchorless games
+    don't count: they would make every message qualify."""
+    probes, _ = _dispatch_index(GAME_SPECS)
+    lowered = content.lower()
+    return any(anchor in lowered for anchor, _ in probes)
+
+
 def match_message(msg, games, timestamp_checker, avatar_hashes=None):
     """Run a single message through all games, including Wordle bot image parsing.
 
@@ -939,12 +1517,13 @@ def match_message(msg, games, timestamp_checker, avatar_hashes=None):
     user_id_override is None for everything except multi-player Wordle bot images,
     where each entry is attributed to the user matched by avatar. Returns [] if no
     match. The first game whose pattern matches and yields a non-None score wins
-    (GAME_SPECS order is parse priority).
+    (GAME_SPECS order is parse priority). Only games whose anchor the content
+    contains are tried, which leaves ordinary chat with no candidates at all.
     """
     content = msg['content']
     timestamp = msg['timestamp']
 
-    for game in games:
+    for game in _candidate_games(content, games):
         # Optional cheap pre-filter before the full pattern (chronophoto).
         if game.search_pattern is not None and not game.search_pattern.search(content):
             continue
@@ -972,6 +1551,226 @@ def match_message(msg, games, timestamp_checker, avatar_hashes=None):
     return []
 
 
+# --- Metrics ------------------------------------------------------------------
+# A GameSpec names its metric; everything that depends on it -- how scores
+# order, which are failures, how one reads on the board -- is declared once
+# here and read by the one ranking kernel (_ranked) and the score lines
+# (_format_game_players). A new metric is a new METRICS row, not another
+# branch in each of them.
+
+@dataclass(frozen=True)
+class Metric:
+    """How one kind of score ranks, fails and reads.
+
+      sort_key  callable(score) -> a number, or a tuple of them; ascending is
+                better. Equal keys must mean equal scores: ties are read off
+                the keys.
+      poop      callable(score, total) -> bool, a failed result. It holds its
+                place in the ranking but earns 0 points and the poop medal.
+      describe  callable(groups, total) -> the score text for each _ranked
+                group, in order. Whole-field rather than per score because
+                maptap's text depends on which scores are tied.
+    """
+    sort_key: object
+    poop: object
+    describe: object
+
+
+def _per_score(fmt):
+    """A describe for a metric whose text depends on the score alone."""
+    return lambda groups, total: [fmt(score, total) for _, score, _, _ in groups]
+
+
+def _mmss(seconds):
+    """A clock as M:SS, shared by every timed metric. Past an hour the minutes
+    just keep counting (73:20) rather than growing an hours field -- a daily
+    puzzle that took that long is a curiosity, not a format to design for."""
+    return f'{seconds // 60}:{seconds % 60:02d}'
+
+
+def _guesses_text(score, total):
+    if total == 0:
+        return str(score)
+    return f"{'X' if score > total else score}/{total}"
+
+
+def _score_text(score, total):
+    return f'{score}/{total}' if total > 0 else str(score)
+
+
+def _connections_text(score, total):
+    mistakes, solved = score
+    if mistakes == -1:
+        return "VERT 🧗"
+    if mistakes == total:
+        return f"{mistakes}/{total} ({solved} solved)"
+    return f"{mistakes}/{total}"
+
+
+def _timed_win_text(score, total):
+    tier, hints, untimed, seconds = score
+    # A win is just its time -- the clock IS the result, and "won" in front
+    # of every top line would be noise. The other two say so.
+    parts = [{1: 'tied', 2: 'lost'}[tier]] if tier else []
+    if not untimed:
+        parts.append(_mmss(seconds))
+    text = ' '.join(parts) or 'won'
+    if hints:
+        # Hints outrank the clock, so they have to be visible: two players a
+        # second apart are otherwise ordered by something the line doesn't show.
+        text += f" ({hints} hint" + ("s)" if hints != 1 else ")")
+    return text
+
+
+def _travle_text(score, total):
+    tier, eff_n, hints, neg_cm = score
+    k = -neg_cm
+    raw_n = eff_n - hints * (hints + 1) // 2  # undo hint penalty for display
+    parts = []
+    if tier == 0 or k:
+        parts.append(f"{k}✓")
+    if hints:
+        parts.append(f"{hints} hint" + ("s" if hints != 1 else ""))
+    extra = f" ({', '.join(parts)})" if parts else ""
+    if tier == 0:
+        return f"+{raw_n}{extra}"
+    return f"{raw_n} away{extra}"   # tier 1, or 2: a complete wiff (the poop)
+
+
+def _maptap_describe(groups, total):
+    # Ranked by the default (weighted) score; the unweighted raw score is only
+    # a tiebreaker, and is shown only where a weighted score is tied.
+    weighted_counts = Counter(score[0] for _, score, uids, _ in groups for _ in uids)
+    return [f'{weighted} ({unweighted} unweighted)' if weighted_counts[weighted] > 1
+            else f'{weighted}'
+            for _, (weighted, unweighted), _, _ in groups]
+
+
+METRICS = {
+    'guesses': Metric(
+        sort_key=lambda s: s,
+        poop=lambda s, total: total > 0 and s > total,
+        describe=_per_score(_guesses_text)),
+    'score': Metric(
+        sort_key=lambda s: -s,
+        poop=lambda s, total: s == 0,
+        describe=_per_score(_score_text)),
+    'time': Metric(
+        sort_key=lambda s: s,
+        poop=lambda s, total: False,
+        describe=_per_score(lambda s, total: _mmss(s))),
+    'connections': Metric(
+        sort_key=lambda s: (s[0], -s[1]),
+        poop=lambda s, total: s[0] == total and s[1] == 0,
+        describe=_per_score(_connections_text)),
+    'maptap': Metric(
+        sort_key=lambda s: (-s[0], -s[1]),
+        poop=lambda s, total: s[0] == 0,
+        describe=_maptap_describe),
+    'travle': Metric(
+        sort_key=tuple,
+        poop=lambda s, total: s[0] == 2,
+        describe=_per_score(_travle_text)),
+    'timed_win': Metric(
+        sort_key=tuple,
+        poop=lambda s, total: s[0] != 0,
+        describe=_per_score(_timed_win_text)),
+}
+
+# Field size at which _ranked hands the sort to numpy. Below it the builtin
+# sort over key tuples is faster than building the arrays; a busy server's
+# game is tens of players, so in practice only a backfill or a very large
+# guild ever crosses it.
+RANK_NUMPY_MIN = 1000
+
+
+def _is_poop(score, metric, total):
+    """True for a failed result: it holds its place in the ranking but earns 0
+    points."""
+    return METRICS[metric].poop(score, total)
+
+
+def _rank_numpy(keys):
+    """(order, group starts) for a large field's sort keys, or None to let the
+    builtin sort do it.
+
+    One lexsort over the key columns, with the field's own order as the last
+    tiebreak so equal keys come out exactly as the stable builtin sort leaves
+    them, and the group starts read off where adjacent rows differ -- no
+    per-player tuple comparisons at all. Keys that don't make a finite float
+    matrix (a malformed stored score) decline rather than guess.
+    """
+    import numpy as np
+
+    try:
+        cols = np.array(keys, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if cols.ndim == 1:
+        cols = cols.reshape(-1, 1)
+    if cols.ndim != 2 or not np.isfinite(cols).all():
+        return None
+    order = np.lexsort((np.arange(len(keys)),) + tuple(cols.T[::-1]))
+    ordered = cols[order]
+    breaks = np.nonzero((ordered[1:] != ordered[:-1]).any(axis=1))[0] + 1
+    return order.tolist(), [0] + breaks.tolist()
+
+
+def _ranked(scores, metric, total):
+    """One game's results in board order, grouped into ties.
+
+    Returns a tuple of (place, score, uids, poop) groups, best first: `place`
+    is the 0-based index of the group's first player in the sorted field (so
+    the next group's place skips the ones a tie consumed), `uids` the tied
+    players in sort order, `poop` whether the score is a failed result. The
+    single ranking both the points (compute_points, ScoringContext) and the
+    score lines (_format_game_players) are read from.
+
+    Each score's sort key (METRICS) is computed once and the field sorted by
+    index, so ties are found by comparing keys rather than re-deriving them;
+    fields of RANK_NUMPY_MIN or more sort in numpy (_rank_numpy). Both orders
+    are the stable sort of the field in results order.
+    """
+    m = METRICS[metric]
+    uids = list(scores)
+    keys = [m.sort_key(score) for score in scores.values()]
+    ranked = _rank_numpy(keys) if len(keys) >= RANK_NUMPY_MIN else None
+    if ranked is not None:
+        order, starts = ranked
+    else:
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        starts = [i for i in range(len(order))
+                  if i == 0 or keys[order[i]] != keys[order[i - 1]]]
+
+    groups = []
+    for i, j in zip(starts, starts[1:] + [len(order)]):
+        score = scores[uids[order[i]]]
+        groups.append((i, score, [uids[k] for k in order[i:j]], m.poop(score, total)))
+    return tuple(groups)
+
+
+def _game_points(groups, first_place_points=None):
+    """{user_id: points} for one ranked game (_ranked); poops are absent.
+
+    Per-game scale: 1 point + 1 for each player strictly below, so a tie pays
+    what its last place would. Rotation scale (first_place_points): placement
+    alone -- the group's place is its best, and the next group skips the
+    places the tie consumed. Poops hold their places too; they just earn 0.
+    """
+    n = sum(len(uids) for _, _, uids, _ in groups)
+    points = {}
+    for place, _, uids, poop in groups:
+        if poop:
+            continue
+        if first_place_points is None:
+            earned = 1 + n - (place + len(uids))
+        else:
+            earned = first_place_points - place
+        for uid in uids:
+            points[uid] = earned
+    return points
+
+
 def compute_points(results, games, minimum_players=1, first_place_points=None):
     """Compute total points per user across all games.
 
@@ -1001,73 +1800,13 @@ def compute_points(results, games, minimum_players=1, first_place_points=None):
     Returns {user_id: int}.
     """
     points = defaultdict(int)
-
     for game in games:
-        game_key, metric, total = game.key, game.metric, game.total
-        if game_key not in results or not results[game_key] or len(results[game_key]) < minimum_players:
+        scores = results.get(game.key)
+        if not scores or len(scores) < minimum_players:
             continue
-
-        # Sort players using the same keys as _format_game_players
-        if metric == 'connections':
-            players = sorted(results[game_key].items(), key=lambda x: (x[1][0], -x[1][1]))
-        elif metric == 'score':
-            players = sorted(results[game_key].items(), key=lambda x: (-x[1]))
-        elif metric == 'maptap':
-            players = sorted(results[game_key].items(), key=lambda x: (-x[1][0], -x[1][1]))
-        else:
-            players = sorted(results[game_key].items(), key=lambda x: x[1])
-
-        n = len(players)
-
-        # Walk the sorted players, grouping ties
-        i = 0
-        while i < len(players):
-            current_score = players[i][1]
-
-            # Check for poop override (no points)
-            is_poop = False
-            if metric == 'connections':
-                mistakes, solved = current_score
-                if mistakes == total and solved == 0:
-                    is_poop = True
-            elif metric == 'guesses' and total > 0:
-                if current_score > total:
-                    is_poop = True
-            elif metric == 'score':
-                if current_score == 0:
-                    is_poop = True
-            elif metric == 'maptap':
-                if current_score[0] == 0:
-                    is_poop = True
-            elif metric == 'travle':
-                if current_score[0] == 2:
-                    is_poop = True
-            elif metric == 'timed_win':
-                if current_score[0] != 0:
-                    is_poop = True
-
-            # Collect tied players
-            j = i + 1
-            while j < len(players) and players[j][1] == current_score:
-                j += 1
-
-            if not is_poop:
-                if first_place_points is None:
-                    # Per-game scale: 1 point + 1 for each player strictly below
-                    # (players[j:]); tied players (players[i:j]) don't count as
-                    # beaten, so a tie pays what its last place would.
-                    player_points = 1 + (n - j)
-                else:
-                    # Rotation scale: placement alone. The group's place is i+1
-                    # -- the best in the tie, not the last -- and the walk
-                    # resumes at j, so the next player skips the places the tie
-                    # consumed. Poops hold their places too; they just earn 0.
-                    player_points = first_place_points - i
-                for k in range(i, j):
-                    points[players[k][0]] += player_points
-
-            i = j
-
+        for uid, earned in _game_points(_ranked(scores, game.metric, game.total),
+                                        first_place_points).items():
+            points[uid] += earned
     return dict(points)
 
 
@@ -1108,12 +1847,7 @@ def points_per_game(results, games, minimum_players=1, rotation=None):
     Games outside it keep the per-game scale: they earn no board points at all,
     so the day's pool is not the yardstick their frozen points belong on.
     """
-    rot = set(rotation) if rotation else None
-    base = (rotation_points_base(results, [g for g in games if g.key in rot],
-                                 minimum_players) if rot else None)
-    return {g.key: compute_points(results, [g], minimum_players,
-                                  base if rot and g.key in rot else None)
-            for g in games}
+    return ScoringContext(results, games, minimum_players, rotation).points_per_game()
 
 
 def scoring_players(results, games, minimum_players=1):
@@ -1130,8 +1864,82 @@ def scoring_players(results, games, minimum_players=1):
     the day makes no difference here: every non-poop result is worth at least 1
     point on either, so eligibility is the same set of players either way.
     """
-    return {key: {uid for uid, pts in scores.items() if pts > 0}
-            for key, scores in points_per_game(results, games, minimum_players).items()}
+    return ScoringContext(results, games, minimum_players).scorers()
+
+
+class ScoringContext:
+    """One day's results ranked once, for every consumer that scores them.
+
+    A board used to sort the same results over and over: the archive's
+    points_per_game (compute_points per game), the streak fold's
+    scoring_players (points_per_game again), the board's own compute_points,
+    and a fresh sort in _format_game_players on every pass of the reduction
+    ladder. A context ranks each game the first time anything asks
+    (_ranked) and keeps the groups; points, scorers and score lines are all
+    read off them. Make one per (results, games, minimum_players, rotation)
+    and hand it to each consumer -- gather_streaks and
+    format_scoreboard_components take it as `scoring`.
+
+    Everything it returns is shared between those consumers: read it, never
+    mutate it. The results must not change under it either; a caller that
+    folds in new results (the sticky's incremental state) makes a new one.
+    """
+
+    def __init__(self, results, games, minimum_players=1, rotation=None):
+        self.results = results
+        self.games = list(games)
+        self.minimum_players = minimum_players
+        self.rotation = rotation
+        self._ranked = {}
+        self._points = None
+        self._scorers = None
+
+    def qualifies(self, game_key):
+        """True if the game drew enough players to score (and to render)."""
+        scores = self.results.get(game_key)
+        return bool(scores) and len(scores) >= self.minimum_players
+
+    def ranked(self, game):
+        """_ranked groups for one of the games, computed on first ask."""
+        groups = self._ranked.get(game.key)
+        if groups is None:
+            groups = self._ranked[game.key] = _ranked(self.results[game.key],
+                                                      game.metric, game.total)
+        return groups
+
+    def points_per_game(self):
+        """points_per_game's {game_key: {user_id: points}}."""
+        if self._points is None:
+            rot = set(self.rotation) if self.rotation else None
+            base = (rotation_points_base(self.results, [g for g in self.games if g.key in rot],
+                                         self.minimum_players) if rot else None)
+            self._points = {
+                g.key: (_game_points(self.ranked(g), base if rot and g.key in rot else None)
+                        if self.qualifies(g.key) else {})
+                for g in self.games}
+        return self._points
+
+    def scorers(self):
+        """scoring_players' {game_key: {user_id, ...}}."""
+        if self._scorers is None:
+            self._scorers = {
+                g.key: ({uid for _, _, uids, poop in self.ranked(g) if not poop for uid in uids}
+                        if self.qualifies(g.key) else set())
+                for g in self.games}
+        return self._scorers
+
+    def board_points(self):
+        """The points summary's {user_id: points}: the day's scored games (the
+        rotation's, or all of them on an unrestricted day) summed on the
+        day's scale -- exactly compute_points over those games, since
+        points_per_game's split sums to it."""
+        per_game = self.points_per_game()
+        points = defaultdict(int)
+        for g in self.games:
+            if self.rotation is None or g.key in self.rotation:
+                for uid, earned in per_game[g.key].items():
+                    points[uid] += earned
+        return dict(points)
 
 
 def _streak_tag(player_streaks, uid):
@@ -1220,16 +2028,9 @@ def _plain_name(name):
     return _MARKDOWN_SPECIALS.sub(r'\\\1', name[:32])
 
 
-def _mmss(seconds):
-    """A clock as M:SS, shared by every timed metric. Past an hour the minutes
-    just keep counting (73:20) rather than growing an hours field -- a daily
-    puzzle that took that long is a curiosity, not a format to design for."""
-    return f'{seconds // 60}:{seconds % 60:02d}'
-
-
-def _format_game_players(game_scores, metric, total, player_streaks=None,
-                         names=None, mention_limit=None):
-    """Format ranked player lines for a single game.
+def _format_game_players(ranked, metric, total, player_streaks=None,
+                         names=None, mention_limit=None, line_chars=None):
+    """Format ranked player lines for a single game, from its _ranked groups.
 
     Returns a markdown string with medal emojis, player mentions, and scores.
     player_streaks ({user_id: streak}) appends an "(xN)" marker to players whose
@@ -1243,6 +2044,12 @@ def _format_game_players(game_scores, metric, total, player_streaks=None,
     anyone from the board -- it only costs those players their ping. Anyone
     `names` can't resolve keeps their mention: unidentifiable is a worse
     failure than over budget, and the ladder has another rung to try.
+
+    line_chars wraps a tie too long for one line onto several, each with the
+    group's medal and score: a split board (_BoardPlan.paginate) can break a
+    section between lines but not inside one, and a big enough server ties
+    more players on one Connections score than a message holds. None keeps
+    every tie on its one line.
     """
     def mention(uid, rank):
         tag = _streak_tag(player_streaks, uid)
@@ -1253,128 +2060,24 @@ def _format_game_players(game_scores, metric, total, player_streaks=None,
 
     medals = ['👑', '🥈', '🥉']
     lines = ''
-
-    if metric == 'maptap':
-        # Rank by the default (weighted) score; the unweighted raw score is only
-        # a tiebreaker, and is shown only where a weighted score is tied.
-        sorted_players = sorted(game_scores.items(), key=lambda x: (-x[1][0], -x[1][1]))
-        weighted_counts = Counter(v[0] for v in game_scores.values())
-        rank = 0
-        prev_val = None
-        i = 0
-        while i < len(sorted_players):
-            weighted = sorted_players[i][1][0]
-            unweighted = sorted_players[i][1][1]
-            score_tuple = (weighted, unweighted)
-            if score_tuple != prev_val:
-                rank = i + 1
-            tied = [mention(sorted_players[i][0], rank)]
-            j = i + 1
-            while j < len(sorted_players) and (sorted_players[j][1][0], sorted_players[j][1][1]) == score_tuple:
-                tied.append(mention(sorted_players[j][0], rank))
-                j += 1
+    # Each group is a distinct score, so a group's rank is simply its place:
+    # a tie shares the best one and the next group skips what it consumed.
+    texts = METRICS[metric].describe(ranked, total)
+    for (place, _, uids, poop), score_str in zip(ranked, texts):
+        rank = place + 1
+        tied_players = [mention(uid, rank) for uid in uids]
+        if poop:
+            medal = '💩 '
+        else:
             medal = f"{medals[rank - 1]} " if rank <= len(medals) else ""
-            if weighted == 0:
-                medal = '💩 '
-            players_str = " ".join(reversed(tied))
-            if weighted_counts[weighted] > 1:
-                lines += f'{medal}{players_str}: {weighted} ({unweighted} unweighted)\n'
-            else:
-                lines += f'{medal}{players_str}: {weighted}\n'
-            prev_val = score_tuple
-            i = j
-        return lines
-
-    if metric == 'connections':
-        players = sorted(game_scores.items(), key=lambda x: (x[1][0], -x[1][1]))
-    elif metric == 'score':
-        players = sorted(game_scores.items(), key=lambda x: (-x[1]))
-    else:
-        players = sorted(game_scores.items(), key=lambda x: x[1])
-
-    rank = 0
-    prev_score = None
-    i = 0
-
-    while i < len(players):
-        current_score = players[i][1]
-
-        if current_score != prev_score:
-            rank = i + 1
-
-        tied_players = [mention(players[i][0], rank)]
-        j = i + 1
-        while j < len(players) and players[j][1] == current_score:
-            tied_players.append(mention(players[j][0], rank))
-            j += 1
-
-        medal = f"{medals[rank - 1]} " if rank <= len(medals) else ""
-
-        if metric == 'time':
-            score_str = _mmss(current_score)
-        elif metric == 'timed_win':
-            tier, hints, untimed, seconds = current_score
-            if tier:
-                medal = '💩 '
-            # A win is just its time -- the clock IS the result, and "won" in
-            # front of every top line would be noise. The other two say so.
-            parts = [{1: 'tied', 2: 'lost'}[tier]] if tier else []
-            if not untimed:
-                parts.append(_mmss(seconds))
-            score_str = ' '.join(parts) or 'won'
-            if hints:
-                # Hints outrank the clock, so they have to be visible: two
-                # players a second apart are otherwise ordered by something
-                # the line doesn't show.
-                score_str += f" ({hints} hint" + ("s)" if hints != 1 else ")")
-        elif metric == 'connections':
-            mistakes, solved = current_score
-            if mistakes == -1:
-                score_str = "VERT 🧗"
-            elif mistakes == total:
-                score_str = f"{mistakes}/{total} ({solved} solved)"
-                if solved == 0:
-                    medal = '💩 '
-            else:
-                score_str = f"{mistakes}/{total}"
-        elif metric == 'score':
-            if current_score == 0:
-                medal = '💩 '
-            score_str = f"{str(current_score)}"
-            if total > 0:
-                score_str = f"{score_str}/{total}"
-        elif metric == 'travle':
-            tier, eff_n, hints, neg_cm = current_score
-            k = -neg_cm
-            raw_n = eff_n - hints * (hints + 1) // 2  # undo hint penalty for display
-            parts = []
-            if tier == 0 or k:
-                parts.append(f"{k}✓")
-            if hints:
-                parts.append(f"{hints} hint" + ("s" if hints != 1 else ""))
-            extra = f" ({', '.join(parts)})" if parts else ""
-            if tier == 0:
-                score_str = f"+{raw_n}{extra}"
-            elif tier == 1:
-                score_str = f"{raw_n} away{extra}"
-            else:  # tier == 2: complete wiff
-                medal = '💩 '
-                score_str = f"{raw_n} away{extra}"
-        else:  # guesses
-            if total == 0:
-                score_str = f"{str(current_score)}"
-            else:
-                if current_score > total:
-                    medal = '💩 '
-                    current_score = 'X'
-                score_str = f"{str(current_score)}/{total}"
-
-        players_str = " ".join(reversed(tied_players))
-        lines += f'{medal}'
-        lines += f"{players_str}: {score_str}\n"
-
-        prev_score = current_score
-        i = j
+        rows = [[]]
+        for player in reversed(tied_players):
+            if (line_chars and rows[-1]
+                    and len(" ".join(rows[-1] + [player])) > line_chars):
+                rows.append([])
+            rows[-1].append(player)
+        for row in rows:
+            lines += f"{medal}{' '.join(row)}: {score_str}\n"
 
     return lines
 
@@ -1491,10 +2194,15 @@ def displayable_text(components):
 
 def over_budget(components):
     """The caps this board currently breaks, as a set of _REDUCTIONS tags."""
+    return _caps_broken(count_components(components), displayable_text(components))
+
+
+def _caps_broken(n_components, n_chars):
+    """over_budget for a board already sized (see _BoardPlan.cost)."""
     over = set()
-    if count_components(components) > MAX_TOTAL_COMPONENTS:
+    if n_components > MAX_TOTAL_COMPONENTS:
         over.add('components')
-    if displayable_text(components) > MAX_DISPLAYABLE_TEXT:
+    if n_chars > MAX_DISPLAYABLE_TEXT:
         over.add('text')
     return over
 
@@ -1521,8 +2229,9 @@ _FULL_STYLE = _Style(separators=True, merge_games=False, mention_limit=None, url
 # and a newline, and 4000 characters holds around 200-230 of those however the
 # games and players divide up (tools/check_caps.py measures the frontier). A day
 # bigger than that does not fit in one message at any formatting, and nothing
-# here truncates to hide it -- see format_scoreboard_components for what happens
-# instead.
+# here truncates to hide it: the daily post splits it across messages
+# (format_scoreboard_pages), and the single-message renderers post it as-is --
+# see format_scoreboard_components.
 _REDUCTIONS = (
     ('separators', False, 'components'),
     ('merge_games', True, 'components'),
@@ -1532,16 +2241,16 @@ _REDUCTIONS = (
 )
 
 
-def format_scoreboard_components(results, reference_date, puzzle_numbers, title="Daily Game Scoreboard", minimum_players=1, streaks=None, game_overrides=None, rotation=None, rotation_off='shown', names=None):
+def format_scoreboard_components(results, reference_date, puzzle_numbers, title="Daily Game Scoreboard", minimum_players=1, streaks=None, game_overrides=None, rotation=None, rotation_off='shown', names=None, scoring=None):
     """Format the scoreboard as Discord Components V2, within Discord's caps.
 
-    Renders the full board, measures it, and if it breaks either cap re-renders
-    with the next reduction from _REDUCTIONS that relieves the cap it actually
-    broke, until it fits. Rendering is pure local string work, so a board is
-    measured before anything is sent and the post is never the thing that finds
-    out it was too big. A board that fits -- every board today does -- takes the
-    first pass and is byte-identical to what this produced before the ladder
-    existed.
+    Sizes the full board, and if it breaks either cap moves to the next
+    reduction from _REDUCTIONS that relieves the cap it actually broke, until
+    it fits; then renders once, at the style the walk settled on. Sizing is
+    pure local string work (_BoardPlan.cost), so a board is measured before
+    anything is sent and the post is never the thing that finds out it was too
+    big. A board that fits -- every board today does -- is sized once and is
+    byte-identical to what this produced before the ladder existed.
 
     names ({user_id: display name}) feeds the podium_only reduction; without it
     that rung is a no-op and the ladder falls through to dropping URLs.
@@ -1562,18 +2271,70 @@ def format_scoreboard_components(results, reference_date, puzzle_numbers, title=
     board is the only surface the setting touches. Both headings appear only on
     a rotation board: without one there is no split to label.
 
+    scoring is the caller's ScoringContext for these same results, games,
+    minimum_players and rotation, when it has one to share (the daily post
+    hands the archive's and the streak fold's to the board); None builds one
+    from the arguments above. Either way every rung the ladder sizes reads the
+    one ranking.
+
     Returns a list[dict] suitable for the 'components' field in a Discord message.
     """
+    if scoring is None:
+        scoring = ScoringContext(results, build_games(puzzle_numbers, game_overrides),
+                                 minimum_players, rotation)
+    plan = _BoardPlan(results, reference_date, title, streaks, rotation_off, names, scoring)
+    style, size = _fit_style(plan)
+    if size:
+        # Out of rungs. Post it anyway and let Discord reject it: a loud
+        # 400 in the logs beats silently inventing a truncation rule here.
+        print(f'scoreboard: STILL over budget after every reduction ({size}); '
+              f'posting as-is')
+    return plan.render(style)
+
+
+def format_scoreboard_pages(results, reference_date, puzzle_numbers, title="Daily Game Scoreboard", minimum_players=1, streaks=None, game_overrides=None, rotation=None, rotation_off='shown', names=None, scoring=None):
+    """The board as one message, or as several when no rung fits it in one.
+
+    Takes format_scoreboard_components' arguments and returns a list of its
+    return values, one per message, in posting order. Every board the ladder
+    can fit comes back as the single message format_scoreboard_components
+    renders, byte for byte. Past the ladder's last rung -- somewhere past 200
+    score lines, see tools/check_caps.py -- the day is more than one message
+    holds at any formatting, and instead of posting a board Discord will
+    reject, it is split (_BoardPlan.paginate): the head keeps the title and
+    the points summary, and the game sections follow in board order, packed
+    into as few messages as the caps allow. Nothing is reduced on a split
+    board -- once it takes more than one message anyway, every mention and
+    link is worth the extra room.
+
+    Each message after the head opens with a continuation line
+    (is_board_continuation), which is how the dedup scan, the pin pruner and
+    the sticky's Yesterday link tell a board's head from the rest of it.
+    """
+    if scoring is None:
+        scoring = ScoringContext(results, build_games(puzzle_numbers, game_overrides),
+                                 minimum_players, rotation)
+    plan = _BoardPlan(results, reference_date, title, streaks, rotation_off, names, scoring)
+    style, size = _fit_style(plan)
+    if not size:
+        return [plan.render(style)]
+    pages = plan.paginate()
+    print(f'scoreboard: STILL over budget after every reduction ({size}); '
+          f'splitting into {len(pages)} messages')
+    return pages
+
+
+def _fit_style(plan):
+    """Walk the reduction ladder on the plan's sizes: (style, None) at the
+    first style that fits, or (the last style, its size) when every rung is
+    spent and the board still breaks a cap."""
     style, applied = _FULL_STYLE, set()
     while True:
-        components = _render_scoreboard(
-            results, reference_date, puzzle_numbers, title, minimum_players,
-            streaks, game_overrides, rotation, rotation_off, names, style)
-        over = over_budget(components)
+        n_components, n_chars = plan.cost(style)
+        over = _caps_broken(n_components, n_chars)
         if not over:
-            return components
-        size = (f'{count_components(components)} components, '
-                f'{displayable_text(components)} chars')
+            return style, None
+        size = f'{n_components} components, {n_chars} chars'
         for i, (field, value, cap) in enumerate(_REDUCTIONS):
             if i not in applied and cap in over:
                 applied.add(i)
@@ -1582,118 +2343,363 @@ def format_scoreboard_components(results, reference_date, puzzle_numbers, title=
                       f'retrying with {field}={value}')
                 break
         else:
-            # Out of rungs. Post it anyway and let Discord reject it: a loud
-            # 400 in the logs beats silently inventing a truncation rule here.
-            print(f'scoreboard: STILL over budget after every reduction ({size}); '
-                  f'posting as-is')
-            return components
-
-
-def _render_scoreboard(results, reference_date, puzzle_numbers, title,
-                       minimum_players, streaks, game_overrides, rotation,
-                       rotation_off, names, style):
-    """One pass of the board at a given style. See format_scoreboard_components."""
-    games = build_games(puzzle_numbers, game_overrides)
-    rot = set(rotation) if rotation is not None else None
-    components = []
-
-    # --- Header container ---
-    header_text = f"### 🧮 {title} - {reference_date.strftime('%B %d, %Y')}"
-    header_children = [{"type": 10, "content": header_text}]
-    break_lines = _streak_break_lines(streaks, {g.key: g for g in games})
-    break_child = ([{"type": 10, "content": "\n".join(break_lines)}]
-                   if break_lines else [])
-
-    if not results:
-        # Break callouts still render: a no-results day is exactly when every
-        # alive streak snaps. There is no scores section to sit at the foot of,
-        # so they go at the foot of the only container there is.
-        return [{"type": 17, "accent_color": HEADER_COLOR, "components": header_children + [
-            {"type": 10, "content": "No results found!"},
-        ] + break_child}]
-
-    # --- Points container (gold accent) ---
-    # The one rotation-restricted compute_points call site: off-rotation games
-    # earn no points on the board, whatever the archive froze for them. A
-    # rotation day also pays on its own scale -- first place in any of its
-    # games is worth the whole day's turnout -- so the games it drew are worth
-    # the same whether four players showed up for one or two.
-    scored_games = games if rot is None else [g for g in games if g.key in rot]
-    base = (None if rot is None
-            else rotation_points_base(results, scored_games, minimum_players))
-    points = compute_points(results, scored_games, minimum_players, base)
-    points_section = format_points_summary(points, (streaks or {}).get('players_overall'))
-    if points_section:
-        header_children.append({"type": 10, "content": points_section.rstrip('\n')})
-        components.append({"type": 17, "accent_color": HEADER_COLOR, "components": header_children})
-    else:
-        components.append({"type": 17, "accent_color": OTHER_GAMES_COLOR, "components": header_children})
-
-    # Canonical app-wide ordering, same as the Play list
-    games.sort(key=lambda g: game_sort_key(g, results, streaks))
-
-    qualified = [g for g in games if g.key in results and results[g.key]
-                 and len(results[g.key]) >= minimum_players
-                 and (rot is None or g.key in rot)]
-
-    game_streaks = streaks['games'] if streaks else {}
-    player_streaks = streaks['players'] if streaks else {}
-
-    def game_text(game):
-        puzzle_label = _puzzle_label(game.puzzle, reference_date)
-        titled = f"[{game.title}]({game.url})" if style.urls else game.title
-        score_text = f"**{titled} {game.emoji} {puzzle_label}**"
-        streak = game_streaks.get(game.key, 0)
-        if streak >= STREAK_MIN:
-            score_text += f" \U0001F525{streak}"
-        return score_text + "\n" + _format_game_players(
-            results[game.key], game.metric, game.total,
-            player_streaks.get(game.key), names, style.mention_limit).rstrip('\n')
-
-    def game_sections(game_list):
+            return style, size
+
+
+# Marks every message of a split board after the first (format_scoreboard_pages):
+# the opening line of its first container, as Discord's small subtext.
+CONTINUATION_MARK = '-# \u21aa '
+
+# Longest tie line on a split board before it wraps (_format_game_players'
+# line_chars): a quarter of a message, so even the longest line leaves a page
+# room to pack around it.
+PAGE_LINE_CHARS = MAX_DISPLAYABLE_TEXT // 4
+
+
+def is_board_continuation(components):
+    """True for a message of a split board other than its head: its first
+    container opens with CONTINUATION_MARK. Takes the message's components,
+    as rendered or as Discord echoes them back."""
+    for container in components or []:
+        for child in container.get('components') or []:
+            if child.get('type') == 10:
+                return (child.get('content') or '').startswith(CONTINUATION_MARK)
+        return False
+    return False
+
+
+# A game's section text outlives the render that built it. A warm container
+# renders the same games over and over -- every Scores click, every sticky
+# pass and the daily post re-render boards whose results mostly haven't
+# changed since the last one -- and building a section's score lines
+# (ranking, medals, mentions, streak tags) is the bulk of a render. Keyed by
+# everything the text is built from (_BoardPlan._section_key), so a stale
+# entry can never match: a new score, a new streak or a new day is a new key,
+# and the least recently used entries give way past the cap.
+GAME_TEXT_CACHE_SIZE = 256
+_game_texts = OrderedDict()   # section key -> section text
+_game_texts_lock = threading.Lock()
+
+
+class _BoardPlan:
+    """One board's content, sized and rendered at any style.
+
+    Everything a style cannot change -- the header, the points summary, which
+    games render and in what order, the streak-break callouts -- is worked
+    out once, here. What a style does change is how the parts are laid out
+    (separators, merging) and what each game's text says (mention_limit,
+    urls), and a game's text is built once per combination of the two fields
+    that reach it (_game_text) -- or not at all, when an earlier render in
+    this container already built it (_game_texts). So the ladder sizes each rung from those
+    parts without rendering it (cost), and the board is rendered once, at the
+    rung it settles on (render). cost and render walk the same layout and
+    must agree exactly: tools/check_caps.py asserts they do at every rung.
+    """
+
+    SCORED_HEADING = "**Scored Games**"
+    OTHER_HEADING = "**Other Games**"
+    NO_RESULTS = "No results found!"
+
+    def __init__(self, results, reference_date, title, streaks, rotation_off, names,
+                 scoring):
+        games = list(scoring.games)
+        minimum_players = scoring.minimum_players
+        rot = set(scoring.rotation) if scoring.rotation is not None else None
+        self.reference_date = reference_date
+        self.names = names
+        self.scoring = scoring
+        self._texts = {}
+        self._keys = {}
+
+        self.title = title
+        self.header_text = f"### 🧮 {title} - {reference_date.strftime('%B %d, %Y')}"
+        break_lines = _streak_break_lines(streaks, {g.key: g for g in games})
+        self.break_text = "\n".join(break_lines) if break_lines else None
+        self.empty = not results
+        if self.empty:
+            return
+
+        # The one rotation-restricted points total: off-rotation games earn no
+        # points on the board, whatever the archive froze for them. A rotation day
+        # also pays on its own scale -- first place in any of its games is worth
+        # the whole day's turnout -- so the games it drew are worth the same
+        # whether four players showed up for one or two.
+        points = scoring.board_points()
+        points_section = format_points_summary(points, (streaks or {}).get('players_overall'))
+        self.points_text = points_section.rstrip('\n') if points_section else None
+
+        # Canonical app-wide ordering, same as the Play list
+        games.sort(key=lambda g: game_sort_key(g, results, streaks))
+
+        self.qualified = [g for g in games if g.key in results and results[g.key]
+                          and len(results[g.key]) >= minimum_players
+                          and (rot is None or g.key in rot)]
+        # Heading only when a rotation governs the day and there are scored games to
+        # head: it exists to pair with the off-rotation heading below, and an
+        # unrestricted board has nothing to contrast with. Keyed on `qualified`, not
+        # on the scores section, so a container holding only streak-break callouts is
+        # not labelled as scores.
+        self.scored_heading = rot is not None and bool(self.qualified)
+        # Games outside the rotation that were played: rendered with scores but no
+        # points, always below the scored games -- or not at all under 'hidden'.
+        self.exhibition = ([g for g in games if g.key not in rot and results.get(g.key)
+                            and len(results[g.key]) >= minimum_players]
+                           if rot is not None and rotation_off != 'hidden' else [])
+
+        self.game_streaks = streaks['games'] if streaks else {}
+        self.player_streaks = streaks['players'] if streaks else {}
+
+    def _section_key(self, game):
+        """Everything a game's text is built from but the style: the game's
+        title line, and each player in results order (the ranking's tie
+        order) with their score, streak tag and display name."""
+        key = self._keys.get(game.key)
+        if key is None:
+            ps = self.player_streaks.get(game.key)
+            names = self.names or {}
+            streak = self.game_streaks.get(game.key, 0)
+            key = self._keys[game.key] = (
+                game.key, game.title, game.emoji, game.url, game.metric, game.total,
+                _puzzle_label(game.puzzle, self.reference_date),
+                streak if streak >= STREAK_MIN else 0,
+                tuple((uid, tuple(score) if isinstance(score, list) else score,
+                       _streak_tag(ps, uid), names.get(uid))
+                      for uid, score in self.scoring.results[game.key].items()))
+        return key
+
+    def _game_text(self, game, style, line_chars=None):
+        """The game's section text at `style`: from this plan if an earlier
+        rung built it, else from _game_texts if an earlier render did, else
+        built here. line_chars is _format_game_players'."""
+        local = (game.key, style.urls, style.mention_limit, line_chars)
+        text = self._texts.get(local)
+        if text is not None:
+            return text
+        key = (self._section_key(game), style.urls, style.mention_limit, line_chars)
+        with _game_texts_lock:
+            text = _game_texts.get(key)
+            if text is not None:
+                _game_texts.move_to_end(key)
+        if text is None:
+            puzzle_label = _puzzle_label(game.puzzle, self.reference_date)
+            titled = f"[{game.title}]({game.url})" if style.urls else game.title
+            text = f"**{titled} {game.emoji} {puzzle_label}**"
+            streak = self.game_streaks.get(game.key, 0)
+            if streak >= STREAK_MIN:
+                text += f" \U0001F525{streak}"
+            text += "\n" + _format_game_players(
+                self.scoring.ranked(game), game.metric, game.total,
+                self.player_streaks.get(game.key), self.names,
+                style.mention_limit, line_chars).rstrip('\n')
+            with _game_texts_lock:
+                _game_texts[key] = text
+                while len(_game_texts) > GAME_TEXT_CACHE_SIZE:
+                    _game_texts.popitem(last=False)
+        self._texts[local] = text
+        return text
+
+    def _sections_cost(self, game_list, style):
+        if not game_list:
+            return 0, 0
+        chars = sum(len(self._game_text(g, style)) for g in game_list)
+        if style.merge_games:
+            return 1, chars + 2 * (len(game_list) - 1)
+        separators = len(game_list) - 1 if style.separators else 0
+        return len(game_list) + separators, chars
+
+    def cost(self, style):
+        """(components, chars) the board renders to at `style` -- what
+        count_components and displayable_text would say of render(style)."""
+        if self.empty:
+            n = 3 + (self.break_text is not None)
+            return n, (len(self.header_text) + len(self.NO_RESULTS)
+                       + len(self.break_text or ''))
+
+        # Header container: the title, and the points summary when there is one.
+        n, chars = 2, len(self.header_text)
+        if self.points_text is not None:
+            n, chars = n + 1, chars + len(self.points_text)
+
+        scores_n, scores_chars = self._sections_cost(self.qualified, style)
+        if self.scored_heading:
+            scores_n, scores_chars = scores_n + 1, scores_chars + len(self.SCORED_HEADING)
+        if self.break_text:
+            scores_n += 1 + bool(scores_n and style.separators)
+            scores_chars += len(self.break_text)
+        if scores_n:
+            n, chars = n + 1 + scores_n, chars + scores_chars
+
+        if self.exhibition:
+            other_n, other_chars = self._sections_cost(self.exhibition, style)
+            n += 2 + other_n
+            chars += len(self.OTHER_HEADING) + other_chars
+        return n, chars
+
+    def _game_sections(self, game_list, style):
         # Merging folds every game into one Text Display: the games read the
         # same, but the section costs one component instead of one per game.
         if style.merge_games:
-            return ([{"type": 10, "content": "\n\n".join(game_text(g) for g in game_list)}]
+            return ([{"type": 10, "content": "\n\n".join(self._game_text(g, style)
+                                                          for g in game_list)}]
                     if game_list else [])
         children = []
         for g_idx, game in enumerate(game_list):
             if g_idx > 0 and style.separators:
                 children.append({"type": 14, "spacing": 1})  # Separator
-            children.append({"type": 10, "content": game_text(game)})
+            children.append({"type": 10, "content": self._game_text(game, style)})
         return children
 
-    # --- Scores container ---
-    scores_children = game_sections(qualified)
-
-    # Heading only when a rotation governs the day and there are scored games to
-    # head: it exists to pair with the off-rotation heading below, and an
-    # unrestricted board has nothing to contrast with. Keyed on `qualified`, not
-    # on scores_children, so a container holding only streak-break callouts is
-    # not labelled as scores.
-    # No separator under either heading: it reads as a label on the games below,
-    # not as a section of its own, and the container edge already divides them.
-    if rot is not None and qualified:
-        scores_children = [{"type": 10, "content": "**Scored Games**"}] + scores_children
-
-    if break_child:
-        if scores_children and style.separators:
-            scores_children.append({"type": 14, "spacing": 1})  # Separator
-        scores_children += break_child
-
-    if scores_children:
-        components.append({"type": 17, "accent_color": SCORES_COLOR, "components": scores_children})
-
-    # --- Off-rotation container ---
-    # Games outside the rotation that were played: rendered with scores but no
-    # points, always below the scored games -- or not at all under 'hidden'.
-    if rot is not None and rotation_off != 'hidden':
-        exhibition = [g for g in games if g.key not in rot and results.get(g.key)
-                      and len(results[g.key]) >= minimum_players]
-        if exhibition:
-            heading = [{"type": 10, "content": "**Other Games**"}]
-            components.append({"type": 17, "accent_color": OTHER_GAMES_COLOR,
-                               "components": heading + game_sections(exhibition)})
+    def render(self, style):
+        """The board at `style`. See format_scoreboard_components."""
+        # --- Header container ---
+        header_children = [{"type": 10, "content": self.header_text}]
+        break_child = ([{"type": 10, "content": self.break_text}]
+                       if self.break_text else [])
+
+        if self.empty:
+            # Break callouts still render: a no-results day is exactly when every
+            # alive streak snaps. There is no scores section to sit at the foot of,
+            # so they go at the foot of the only container there is.
+            return [{"type": 17, "accent_color": HEADER_COLOR, "components": header_children + [
+                {"type": 10, "content": self.NO_RESULTS},
+            ] + break_child}]
+
+        # --- Points container (gold accent) ---
+        components = []
+        if self.points_text is not None:
+            header_children.append({"type": 10, "content": self.points_text})
+            components.append({"type": 17, "accent_color": HEADER_COLOR, "components": header_children})
+        else:
+            components.append({"type": 17, "accent_color": OTHER_GAMES_COLOR, "components": header_children})
 
-    return components
+        # --- Scores container ---
+        scores_children = self._game_sections(self.qualified, style)
 
+        # No separator under either heading: it reads as a label on the games below,
+        # not as a section of its own, and the container edge already divides them.
+        if self.scored_heading:
+            scores_children = [{"type": 10, "content": self.SCORED_HEADING}] + scores_children
+
+        if break_child:
+            if scores_children and style.separators:
+                scores_children.append({"type": 14, "spacing": 1})  # Separator
+            scores_children += break_child
+
+        if scores_children:
+            components.append({"type": 17, "accent_color": SCORES_COLOR, "components": scores_children})
+
+        # --- Off-rotation container ---
+        if self.exhibition:
+            heading = [{"type": 10, "content": self.OTHER_HEADING}]
+            components.append({"type": 17, "accent_color": OTHER_GAMES_COLOR,
+                               "components": heading + self._game_sections(self.exhibition, style)})
+
+        return components
+
+    def _page_items(self, style):
+        """The board as the run of (container, kind, text, title) items a split
+        board is packed from, in board order. `title` is what a piece of the
+        item opens with when it has to be split across pages (paginate): a
+        game's title line, marked continued, so no page opens on anonymous
+        scores; '' for the points summary, whose lines carry their own names;
+        None for what never splits."""
+        items = [('header', 'title', self.header_text, None)]
+        if self.points_text is not None:
+            items.append(('header', 'points', self.points_text, ''))
+        if self.scored_heading:
+            items.append(('scores', 'heading', self.SCORED_HEADING, None))
+        for game in self.qualified:
+            text = self._game_text(game, style, PAGE_LINE_CHARS)
+            items.append(('scores', 'game', text, text.partition('\n')[0] + ' (continued)'))
+        if self.break_text:
+            items.append(('scores', 'break', self.break_text, None))
+        if self.exhibition:
+            items.append(('other', 'heading', self.OTHER_HEADING, None))
+            for game in self.exhibition:
+                text = self._game_text(game, style, PAGE_LINE_CHARS)
+                items.append(('other', 'game', text, text.partition('\n')[0] + ' (continued)'))
+        return items
+
+    def _render_page(self, items, page):
+        """One message of a split board: its items, in containers laid out the
+        way render lays out the whole board, behind the continuation line on
+        every page but the first."""
+        accents = {'header': HEADER_COLOR if self.points_text is not None else OTHER_GAMES_COLOR,
+                   'scores': SCORES_COLOR, 'other': OTHER_GAMES_COLOR}
+        containers = []   # [container, children, kinds]
+        for container, kind, text, _ in items:
+            if not containers or containers[-1][0] != container:
+                containers.append((container, [], []))
+            _, children, kinds = containers[-1]
+            if kinds and ((kind == 'game' and kinds[-1] == 'game') or kind == 'break'):
+                children.append({"type": 14, "spacing": 1})  # Separator
+            children.append({"type": 10, "content": text})
+            kinds.append(kind)
+        if page > 1:
+            date = self.reference_date.strftime('%B %d, %Y')
+            containers[0][1].insert(0, {
+                "type": 10,
+                "content": f"{CONTINUATION_MARK}{self.title} - {date} (continued, part {page})"})
+        return [{"type": 17, "accent_color": accents[container], "components": children}
+                for container, children, _ in containers]
+
+    def paginate(self):
+        """The board split into as few messages as fit, in board order, at the
+        full style. See format_scoreboard_pages.
+
+        Greedy: each item goes on the current page if the page still fits
+        both caps with it, else starts the next one -- which for a run that
+        has to stay in order is the fewest pages there are. A section too big
+        for a page of its own (a game with hundreds of players, the points
+        summary of a huge server) is the one thing split: as many of its lines
+        as the current page has room for, then the rest onward. Anything
+        smaller moves over whole rather than straddle two messages, and a
+        heading never ends a page -- it moves over with the section it heads.
+        """
+        if self.empty:
+            return [self.render(_FULL_STYLE)]
+
+        pages, page = [], []
+
+        def fits(items):
+            return not over_budget(self._render_page(items, len(pages) + 1))
+
+        def close():
+            nonlocal page
+            carry = []
+            while len(page) > 1 and page[-1][1] == 'heading':
+                carry.insert(0, page.pop())
+            pages.append(page)
+            page = carry
+
+        for item in self._page_items(_FULL_STYLE):
+            while not fits(page + [item]):
+                container, kind, text, title = item
+                if title is None or fits([item]):
+                    if not page:
+                        break   # unsplittable and still too big: post it and let Discord say so
+                    close()
+                    continue
+                # Too big for any page: take the most lines the current page
+                # has room for (binary search -- fits is monotone in lines).
+                lines = text.split('\n')
+                lo, hi = 0, len(lines) - 1
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if fits(page + [(container, kind, '\n'.join(lines[:mid]), title)]):
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                # A piece that is only a title line says nothing; hold out for more.
+                if lo < (2 if title else 1):
+                    if not page:
+                        break
+                    close()
+                    continue
+                page.append((container, kind, '\n'.join(lines[:lo]), title))
+                close()
+                rest = '\n'.join(lines[lo:])
+                item = (container, kind, f'{title}\n{rest}' if title else rest, title)
+            page.append(item)
+        pages.append(page)
+        return [self._render_page(items, i + 1) for i, items in enumerate(pages)]
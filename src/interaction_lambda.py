@@ -11,14 +11,15 @@ from nacl.signing import VerifyKey
 from game_parser import (
     build_games, compute_puzzle_numbers, format_scoreboard_components,
     make_timestamp_checker, game_sort_key, match_suggestion, GAME_SPECS,
-    spec_enabled, game_link_button,
+    spec_enabled, game_link_button, fetch_window_start, ScoringContext,
 )
 from scoreboard import (
     DISCORD_API_BASE, make_session, fetch_messages, reference_date, parse_results,
     build_avatar_pool, build_name_map, safe_guild_id, gather_streaks, is_sticky_message,
     PLAY_BUTTON_CUSTOM_ID, MORE_BUTTON_CUSTOM_ID, SCORES_BUTTON_CUSTOM_ID,
     TEXT_CHANNEL_TYPES, PERM_ADMINISTRATOR, PERM_MANAGE_GUILD, MAX_BUTTONS_PER_ROW,
-    MAX_MESSAGE_LENGTH, FLAG_EPHEMERAL, FLAG_IS_COMPONENTS_V2,
+    MAX_MESSAGE_LENGTH, FLAG_EPHEMERAL, FLAG_IS_COMPONENTS_V2, WINDOW_FETCH_CAP,
+    discord_governor,
 )
 import store
 
@@ -81,12 +82,14 @@ def guild_cfg(guild_id, strict=False):
 
 
 def fetch_today_results(channel_id, cfg):
-    """Fetch one page of channel history and parse today's game results.
+    """Fetch today's channel history and parse today's game results.
 
     Shared by the Scores and Play buttons so both reflect the same live view of
-    the channel they were clicked in. Single page (limit=100) keeps the call
-    under Discord's 3-second interaction-response budget; the daily summary
-    lambda is the source of truth for the full archive, this is a live preview.
+    the channel they were clicked in. Reads back to the earliest post that can
+    count for today, however many pages that takes -- both buttons are
+    deferred, so the 3-second response budget no longer caps the depth. The
+    daily summary lambda is still the source of truth for the archive; this is
+    a live preview.
 
     Returns (results, puzzle_numbers, today, rotation, names) -- rotation is
     store.current_rotation's key list for today, or None when the day is
@@ -96,7 +99,8 @@ def fetch_today_results(channel_id, cfg):
     tz = ZoneInfo(cfg['timezone'])
     today = reference_date(datetime.now(tz), tz, cfg['hours_after_midnight'])
     rotation = store.current_rotation(cfg, store.day_str(today))
-    messages = fetch_messages(_session, channel_id, limit=100)
+    messages = fetch_messages(_session, channel_id, limit=WINDOW_FETCH_CAP,
+                              since=fetch_window_start(today, tz))
     checker = make_timestamp_checker(today, tz, cfg['hours_after_midnight'],
                                      cfg['time_window_hours'])
     avatar_pool = build_avatar_pool(_session, messages, checker, cfg['guild_id'])
@@ -117,14 +121,15 @@ def build_scoreboard_response(channel_id, guild_id=None, cfg=None):
     cfg = cfg or guild_cfg(guild_id)
     results, puzzle_numbers, today, rotation, names = fetch_today_results(channel_id, cfg)
 
-    streaks = gather_streaks(guild_id, today, results,
-                             build_games(puzzle_numbers, cfg['game_overrides']),
-                             cfg['minimum_players'])
+    games = build_games(puzzle_numbers, cfg['game_overrides'])
+    scoring = ScoringContext(results, games, cfg['minimum_players'], rotation)
+    streaks = gather_streaks(guild_id, today, results, games, cfg['minimum_players'],
+                             scoring=scoring)
     components = format_scoreboard_components(
         results, today, puzzle_numbers,
         title="Today's Scores", minimum_players=cfg['minimum_players'], streaks=streaks,
         game_overrides=cfg['game_overrides'], rotation=rotation,
-        rotation_off=cfg['rotation_off_mode'], names=names,
+        rotation_off=cfg['rotation_off_mode'], names=names, scoring=scoring,
     )
 
     # V2 messages can't have a content field, so the builder's output goes
@@ -411,6 +416,7 @@ def run_deferred(work):
         f"/messages/@original", json=data)
     if not r.ok:
         print(f'defer: follow-up edit failed {r.status_code} {r.text[:200]}')
+    print(discord_governor.report())
     return {'statusCode': 200,
             'body': json.dumps({'deferred': work['action'], 'edit': r.status_code})}
 
@@ -611,7 +617,6 @@ def config_summary(cfg):
         f"Timezone `{cfg['timezone']}` · day starts {cfg['hours_after_midnight']:02d}:00 · "
         f"posts {post_hour:02d}:00 · window {cfg['time_window_hours']}h",
         f"Minimum players {cfg['minimum_players']} · "
-        f"volume ~{cfg['hundreds_of_messages'] * 100} msgs/day · "
         f"pins {cfg['pin_keep_days']} days",
     ]
     enabled = [s for s in GAME_SPECS if spec_enabled(s, cfg['game_overrides'])]
@@ -762,7 +767,6 @@ def handle_setup(body, guild_id):
         store.update_config(guild_id, updates)
         merged = {**cfg, **updates}
         return _ephemeral(f"✅ Limits updated: minimum players {merged['minimum_players']}, "
-                          f"volume ~{merged['hundreds_of_messages'] * 100} msgs/day, "
                           f"pinning {merged['pin_keep_days']} days of scoreboards.")
 
     # 'show' and anything unrecognized fall back to the summary.
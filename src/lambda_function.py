@@ -1,21 +1,24 @@
 import json
 import os
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from game_parser import (format_scoreboard_components, make_timestamp_checker,
-                         build_games, points_per_game, compute_puzzle_numbers,
+from game_parser import (format_scoreboard_pages, make_timestamp_checker,
+                         build_games, compute_puzzle_numbers,
                          next_rotation, game_sort_key, game_link_button,
-                         scoring_players, GAME_SPECS, spec_enabled)
+                         scoring_players, GAME_SPECS, spec_enabled,
+                         fetch_window_start, ScoringContext, image_pool)
 from scoreboard import (
     DISCORD_API_BASE, make_session, fetch_messages, reference_date,
     parse_results, build_avatar_pool, build_name_map, is_scoreboard_message,
-    gather_streaks,
+    gather_streaks, discord_governor,
     FLAG_SUPPRESS_EMBEDS, FLAG_SUPPRESS_NOTIFICATIONS, FLAG_IS_COMPONENTS_V2,
-    MAX_BUTTONS_PER_ROW, MAX_ACTION_ROWS,
+    MAX_BUTTONS_PER_ROW, MAX_ACTION_ROWS, WINDOW_FETCH_CAP,
 )
 import store
 
@@ -26,6 +29,20 @@ DISCORD_BOT_ID = os.getenv('DISCORD_BOT_ID') or 0
 
 _session = make_session(DISCORD_BOT_TOKEN)
 
+# Guilds processed at once on a tick. Guilds sharing a post hour used to queue
+# behind each other's round trips; a small pool overlaps them without moving
+# the two shared ceilings. Discord's global limit is 50 requests/second per
+# bot, and a guild's board is a dozen-odd requests spread over seconds, so
+# four in flight stays far under it. The table is the tighter one -- 5 WCU --
+# which is why the archive write is serialized separately (_archive_lock)
+# rather than left to this number.
+GUILD_WORKERS = 4
+
+# One guild's day archive and aggregate fold at a time. A single guild's burst
+# already runs near the table's 5 WCU; two at once would spend the retry budget
+# on throttling instead of landing either.
+_archive_lock = threading.Lock()
+
 
 def send_message(channel_id, components):
     url = f'{DISCORD_API_BASE}/channels/{channel_id}/messages'
@@ -128,8 +145,7 @@ def rotate_pin(channel_id, message_id, keep, bot_id=None):
         return f'pin: FAILED {_pin_error(e)} ({prune})'
 
 
-def persist_results(cfg, results, puzzle_numbers, ref_date, games, rotation=None,
-                    write=True):
+def persist_results(cfg, results, puzzle_numbers, ref_date, scoring, write=True):
     """SPEC.md write path: freeze the day and fold streak aggregates.
 
     Runs BEFORE the scoreboard renders (the board displays the exact streaks
@@ -145,6 +161,10 @@ def persist_results(cfg, results, puzzle_numbers, ref_date, games, rotation=None
     _put_guarded's finalized_through condition rejects a replay.) The scoring
     fold still runs either way, so the parse -> points path stays covered by
     the routine post-change test event.
+
+    scoring is the day's ScoringContext -- its games, minimum_players and
+    rotation are the ones the board renders with, and its ranking is shared
+    with the streak fold and the board.
     """
     try:
         day = store.day_str(ref_date)
@@ -153,15 +173,15 @@ def persist_results(cfg, results, puzzle_numbers, ref_date, games, rotation=None
         # scale its own games freeze on, so what the item stores for them is
         # what the board printed. Doubles as the streak-eligibility signal:
         # finalize_day counts a play only where points landed.
-        points_by_game = points_per_game(results, games, cfg['minimum_players'],
-                                         rotation)
+        points_by_game = scoring.points_per_game()
         if not write:
             n_scored = sum(1 for pts in points_by_game.values() if pts)
             return f'store: dry run, would write day={day} ({n_scored} scored games)'
-        archived = store.write_day(cfg['guild_id'], day, results, points_by_game,
-                                   puzzle_numbers, rotation)
-        stats = store.finalize_day(cfg['guild_id'], day, results, points_by_game,
-                                   [g.key for g in games])
+        with _archive_lock:
+            archived = store.write_day(cfg['guild_id'], day, results, points_by_game,
+                                       puzzle_numbers, scoring.rotation)
+            stats = store.finalize_day(cfg['guild_id'], day, results, points_by_game,
+                                       [g.key for g in scoring.games])
         return (f'store: day={day} archived={archived} '
                 f'aggs updated={stats["updated"]} skipped={stats["skipped"]}')
     except Exception as e:
@@ -357,11 +377,15 @@ def process_guild(cfg, is_test, test_channel_id, days_back=1):
     if not board_due and not rotation_due:
         return blocked
 
-    # One fetch and one parse of the closed day, shared by both stages.
+    # One fetch and one parse of the closed day, shared by both stages. It
+    # reads back from the present to the earliest post that could count for
+    # the scored day, so its depth is that day's traffic plus whatever has
+    # been posted since -- late shares included.
     messages, results, streaks = None, None, None
     if board_due or needs_counts:
         messages = fetch_messages(_session, cfg['input_channel_id'],
-                                  limit=cfg['hundreds_of_messages'] * 100)
+                                  limit=WINDOW_FETCH_CAP,
+                                  since=fetch_window_start(scored, tz))
         note(f'fetched {len(messages)} messages')
 
     if board_due:
@@ -404,26 +428,45 @@ def process_guild(cfg, is_test, test_channel_id, days_back=1):
 
     if board_due:
         games = build_games(puzzle_numbers, cfg['game_overrides'])
+        # One ranking of the day for the archive, the streak fold and every
+        # pass of the board's reduction ladder.
+        scoring = ScoringContext(results, games, cfg['minimum_players'], rotation)
         # Two independent reasons to hold the write back: a test run must leave
         # the table exactly as it found it, and an open day has no business
         # being archived at all. Reads are unaffected -- gather_streaks below
         # still renders real streaks either way.
-        note(persist_results(cfg, results, puzzle_numbers, scored, games, rotation,
+        note(persist_results(cfg, results, puzzle_numbers, scored, scoring,
                              write=not is_test and days_back >= 1))
 
-        streaks = gather_streaks(gid, scored, results, games, cfg['minimum_players'])
-        components = format_scoreboard_components(results, scored, puzzle_numbers,
-                                                  minimum_players=cfg['minimum_players'],
-                                                  streaks=streaks,
-                                                  game_overrides=cfg['game_overrides'],
-                                                  rotation=rotation,
-                                                  rotation_off=cfg['rotation_off_mode'],
-                                                  names=build_name_map(messages))
+        streaks = gather_streaks(gid, scored, results, games, cfg['minimum_players'],
+                                 scoring=scoring)
+        pages = format_scoreboard_pages(results, scored, puzzle_numbers,
+                                        minimum_players=cfg['minimum_players'],
+                                        streaks=streaks,
+                                        game_overrides=cfg['game_overrides'],
+                                        rotation=rotation,
+                                        rotation_off=cfg['rotation_off_mode'],
+                                        names=build_name_map(messages),
+                                        scoring=scoring)
         board_channel = test_channel_id if is_test else cfg['output_channel_id']
-        response = send_message(board_channel, components=components)
+        response = send_message(board_channel, components=pages[0])
         note('posted scoreboard')
-        parts.append(f'TEST: posted {day} scoreboard to {board_channel}' if is_test
-                     else f'posted {day}')
+        # The rest of a board too big for one message. Once the head is out,
+        # the day's board HAS posted -- it is what gets pinned and what the
+        # dedup scan finds -- so a part that fails is reported rather than
+        # raised: raising would skip set_last_posted and the next tick would
+        # heal the marker anyway, having posted nothing more.
+        sent = 1
+        for i, page in enumerate(pages[1:], start=2):
+            try:
+                send_message(board_channel, components=page)
+                sent += 1
+            except Exception as e:
+                note(f'scoreboard part {i}/{len(pages)}: FAILED {type(e).__name__}: {e}')
+        if len(pages) > 1:
+            note(f'posted {sent}/{len(pages)} scoreboard parts')
+        posted = f'posted {day}' + (f' in {sent}/{len(pages)} parts' if len(pages) > 1 else '')
+        parts.append(f'TEST: {posted} scoreboard to {board_channel}' if is_test else posted)
     else:
         parts.append(blocked)
 
@@ -480,7 +523,8 @@ def process_guild(cfg, is_test, test_channel_id, days_back=1):
         parts.append(announced)
 
     # Pinning last keeps Discord's "pinned a message" notice below the
-    # announcement, so the board and today's games stay adjacent.
+    # announcement, so the board and today's games stay adjacent. A split board
+    # pins its head only -- one pin per day, so pin_keep_days still counts days.
     if response and not is_test:
         note(rotate_pin(cfg['output_channel_id'], response['id'],
                         cfg['pin_keep_days']))
@@ -526,15 +570,31 @@ def lambda_handler(event, context):
     if event.get('guild_id'):
         configs = [c for c in configs if c['guild_id'] == str(event['guild_id'])]
 
-    summary = {}
-    for cfg in configs:
-        gid = cfg['guild_id']
+    def run(cfg):
+        # Each guild's failure stays its own: the exception becomes that
+        # guild's summary line and the pool carries on with the rest.
+        t0 = time.time()
         try:
-            summary[gid] = process_guild(cfg, is_test, test_channel_id, days_back)
+            outcome = process_guild(cfg, is_test, test_channel_id, days_back)
         except Exception as e:
             traceback.print_exc()
-            summary[gid] = f'FAILED {type(e).__name__}: {e}'
-        print(f'guild {gid}: {summary[gid]}')
+            outcome = f'FAILED {type(e).__name__}: {e}'
+        print(f'guild {cfg["guild_id"]}: {outcome} ({time.time() - t0:.2f}s)')
+        return outcome
+
+    # Test runs post every guild's board into the one test channel, so they
+    # keep to one guild at a time and the boards land in partition order.
+    workers = 1 if is_test else GUILD_WORKERS
+    # The image workers fork while this is still the only thread (image_pool).
+    image_pool()
+    t0 = time.time()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        outcomes = list(ex.map(run, configs))
+    summary = {cfg['guild_id']: outcome for cfg, outcome in zip(configs, outcomes)}
+    if configs:
+        print(f'tick: {len(configs)} guild(s) in {time.time() - t0:.2f}s, '
+              f'{workers} at a time')
+        print(discord_governor.report())
 
     if not summary:
         summary = 'no guilds configured'
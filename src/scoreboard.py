@@ -1,15 +1,18 @@
 """Shared orchestration above game_parser: session, fetch, parse, dedup."""
+import re
+import threading
 import time
 
 import requests
-from datetime import timedelta
-from collections import defaultdict
-from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
+from collections import defaultdict, deque
 
 import store
 from game_parser import (
     compute_puzzle_numbers, build_games, scoring_players,
-    make_timestamp_checker, match_message, _avatar_ahash, WORDLE_BOT_ID,
+    make_timestamp_checker, match_message, prefetch_wordle_attachments, wordle_decodes,
+    image_pool, names_a_game, is_board_continuation, _avatar_ahash, _match_avatars,
+    WORDLE_BOT_ID,
 )
 
 DISCORD_API_BASE = 'https://discord.com/api/v10'
@@ -59,39 +62,258 @@ MAX_MESSAGE_LENGTH = 2000    # characters in one message's content
 DISCORD_TIMEOUT = (3.05, 10)
 
 
+# Client-side ceiling under Discord's global limit (50 requests/second per
+# bot). Interaction callbacks are exempt from the global limit on Discord's
+# side, so they are exempt here too.
+GLOBAL_RATE_LIMIT = 50
+
+# 429s the session replays before handing the response back to the caller --
+# the count the urllib3 Retry this replaced was configured with.
+RATE_LIMIT_RETRIES = 2
+
+# How often a request queued behind a route's first (bucket-discovering)
+# request looks again. Discord answers in well under this on a normal day.
+PROBE_POLL = 0.05
+
+# Slack past a bucket's reset before the governor counts it refilled.
+# Reset-After is measured on Discord's clock and reaches us a response's
+# latency late, so a request released at exactly the reset can still land in
+# the old window and be rejected.
+RESET_MARGIN = 0.25
+
+# Major parameters: the path ids Discord keys a bucket on in addition to the
+# route, so the same route in two channels has two independent budgets.
+# Webhook routes carry the token as part of theirs. The resource type stays in
+# the route: a channel's and a guild's routes are never the same bucket.
+_MAJOR_RE = re.compile(r'^/(channels|guilds)/(\d+)|^/webhooks/(\d+)(?:/([^/?]+))?')
+_ID_RE = re.compile(r'/\d{15,}')
+
+
+class RateLimitGovernor:
+    """Waits out Discord's rate limits BEFORE a request goes out, instead of
+    finding each bucket by being rejected from it.
+
+    Every response carries its bucket's state (X-RateLimit-Bucket, -Remaining,
+    -Reset-After). The governor remembers it per (bucket, major parameter) and
+    per route -> bucket, and acquire() holds a request back while its bucket is
+    spent, reserving a slot when it lets one through so that concurrent callers
+    -- build_avatar_pool's threads, the daily tick's guild pool -- share one
+    budget rather than each believing the last header they saw. A route seen
+    for the first time in a channel or guild sends ONE request and holds the
+    rest until its response says what that bucket has left -- otherwise a
+    fresh container's first fan-out, or the first pass over a new channel, is
+    exactly the flat-out burst this exists to prevent. A route whose responses
+    carry no bucket is remembered as having none and only waits on the global
+    limit, which is tracked client-side as a one-second sliding window, plus
+    whatever a global 429 asks for.
+
+    Counters separate the two ways a request can lose time: `waited` is the
+    governor holding it back ahead of time, `retried` is sleeping after a 429
+    that got through anyway. A healthy run has the second near zero. Both are
+    summed over threads, so a pool that queued on one bucket reports each
+    request's wait, not the wall-clock time.
+    """
+
+    def __init__(self, global_limit=GLOBAL_RATE_LIMIT):
+        self._lock = threading.Lock()
+        self._global_limit = global_limit
+        self._recent = deque()        # monotonic send times inside the last second
+        self._global_until = 0.0
+        self._route_bucket = {}       # route -> bucket hash, '' for none
+        self._probing = set()         # (route, major) with its first request in flight
+        self._buckets = {}            # (bucket, major) -> [remaining, reset_at, limit, window]
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.waited = self.retried = 0.0
+        self.waits = self.rejections = 0
+
+    @staticmethod
+    def route(method, url):
+        """(route, major) for a Discord API url, or None for anything else."""
+        if not url.startswith(DISCORD_API_BASE):
+            return None
+        path = url[len(DISCORD_API_BASE):].split('?', 1)[0]
+        m = _MAJOR_RE.match(path)
+        major = ''
+        if m:
+            major = m.group(0)
+            path = f'/{m.group(1) or "webhooks"}/:major' + path[m.end():]
+        return f'{method.upper()} {_ID_RE.sub("/:id", path)}', major
+
+    def _state(self, key, now):
+        """The live [remaining, reset_at, limit, window] for a bucket, refilled
+        to its last known limit once its window has passed. reset_at already
+        carries RESET_MARGIN."""
+        state = self._buckets.get(key)
+        if state and state[1] <= now:
+            state[0], state[1] = state[2], now + state[3] + RESET_MARGIN
+        return state
+
+    def acquire(self, method, url):
+        route = self.route(method, url)
+        if route is None:
+            return
+        route, major = route
+        is_global = not route.split(' ', 1)[1].startswith('/interactions/')
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                delay = 0.0
+                if is_global:
+                    delay = self._global_until - now
+                    while self._recent and self._recent[0] <= now - 1:
+                        self._recent.popleft()
+                    if len(self._recent) >= self._global_limit:
+                        delay = max(delay, self._recent[0] + 1 - now)
+                bucket = self._route_bucket.get(route)
+                state = self._state((bucket, major), now) if bucket else None
+                if state and state[0] <= 0:
+                    delay = max(delay, state[1] - now)
+                elif state is None and bucket != '' and (route, major) in self._probing:
+                    delay = max(delay, PROBE_POLL)
+                if delay <= 0:
+                    if state:
+                        state[0] -= 1
+                    elif bucket != '':
+                        self._probing.add((route, major))
+                    if is_global:
+                        self._recent.append(now)
+                    if waited:
+                        self.waited += waited
+                        self.waits += 1
+                    return
+            time.sleep(delay)
+            waited += delay
+
+    def update(self, method, url, response):
+        """Fold a response's rate-limit headers in. Returns the seconds a 429
+        asks to wait, or None when the request was not rejected. response is
+        None when the request failed outright; that only releases the route."""
+        route = self.route(method, url)
+        if route is None:
+            return None
+        route, major = route
+        if response is None:
+            with self._lock:
+                self._probing.discard((route, major))
+            return None
+        h = response.headers
+        now = time.monotonic()
+        retry_after = None
+        if response.status_code == 429:
+            try:
+                retry_after = float(h.get('Retry-After')
+                                    or response.json().get('retry_after') or 1)
+            except ValueError:
+                retry_after = 1.0
+        with self._lock:
+            self._probing.discard((route, major))
+            if retry_after is not None:
+                self.rejections += 1
+                if h.get('X-RateLimit-Global') or h.get('X-RateLimit-Scope') == 'global':
+                    self._global_until = max(self._global_until, now + retry_after)
+            bucket = h.get('X-RateLimit-Bucket')
+            if not bucket:
+                # No bucket on a route not yet placed: it has none, so later
+                # requests stop probing and keep to the global window alone.
+                # A bucket seen later on the route still replaces this.
+                self._route_bucket.setdefault(route, '')
+                return retry_after
+            self._route_bucket[route] = bucket
+            try:
+                remaining = int(h['X-RateLimit-Remaining'])
+                window = float(h['X-RateLimit-Reset-After'])
+                limit = int(h.get('X-RateLimit-Limit') or remaining + 1)
+            except (KeyError, ValueError):
+                return retry_after
+            if retry_after is not None:
+                remaining, window = 0, max(window, retry_after)
+            reset_at = now + window + RESET_MARGIN
+            state = self._buckets.get((bucket, major))
+            if state and abs(state[1] - reset_at) < 1 and state[1] > now:
+                # Same window: requests still in flight reserved slots this
+                # header doesn't know about yet, so keep the lower count.
+                state[0] = min(state[0], remaining)
+            else:
+                # Reset-After counts down, so the longest one seen is the best
+                # guess at the bucket's period -- the window it refills on
+                # before any response has said otherwise.
+                period = max(window, state[3]) if state else window
+                self._buckets[(bucket, major)] = [remaining, reset_at, limit, period]
+        return retry_after
+
+    def back_off(self, seconds):
+        """Sleep out a 429's Retry-After, on the retry clock."""
+        time.sleep(seconds)
+        with self._lock:
+            self.retried += seconds
+
+    def report(self):
+        """One log line of this run's rate-limit cost, resetting the counters.
+        Lambda runs one invocation per container at a time, so this is that
+        invocation's share."""
+        with self._lock:
+            line = (f'discord rate limits: waited {self.waited:.2f}s ({self.waits}x) '
+                    f'ahead of time, retried {self.retried:.2f}s after '
+                    f'{self.rejections} 429(s)')
+            self._reset_stats()
+        return line
+
+
+# One per process: the limits belong to the bot token, not to a session, and
+# every session make_session builds here is for the same bot.
+discord_governor = RateLimitGovernor()
+
+
 class _TimeoutSession(requests.Session):
-    """Session that applies DISCORD_TIMEOUT to calls that don't set their own.
+    """Session that applies DISCORD_TIMEOUT to calls that don't set their own,
+    and routes Discord API calls through its governor.
 
     requests only supports a per-call timeout, and the alternative -- passing it
     at every get/post/patch/delete across four modules -- is exactly the kind of
     thing the next call site forgets, silently reverting to no cap at all.
-    """
 
-    def request(self, *args, **kwargs):
-        kwargs.setdefault('timeout', DISCORD_TIMEOUT)
-        return super().request(*args, **kwargs)
+    429s are replayed here rather than by urllib3 so the governor sees both the
+    rejection and the retry, and so the sleep lands in its `retried` counter.
+    A rate-limited call was rejected unprocessed, so replaying it is safe for
+    every method, POST included. An exhausted 429 is still handed back as a
+    response, as before, rather than a new exception class at every call site.
+    """
 
+    governor = None
 
-def make_session(token, pool_connections=4, pool_maxsize=32):
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', DISCORD_TIMEOUT)
+        gov = self.governor
+        if gov is None:
+            return super().request(method, url, *args, **kwargs)
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            gov.acquire(method, url)
+            r = None
+            try:
+                r = super().request(method, url, *args, **kwargs)
+            finally:
+                retry_after = gov.update(method, url, r)
+            if retry_after is None or attempt == RATE_LIMIT_RETRIES:
+                return r
+            gov.back_off(retry_after)
+        return r
+
+
+def make_session(token, pool_connections=4, pool_maxsize=32, governor=discord_governor):
     s = _TimeoutSession()
+    s.governor = governor
     s.headers.update({
         'Authorization': f'Bot {token}',
         'Content-Type': 'application/json',
     })
-    # Retry 429s only, honouring Retry-After: a rate-limited call was rejected
-    # unprocessed, so replaying it is safe for every method, POST included --
-    # where before the guild simply lost that tick. Connection/read failures
-    # stay non-retried: a timed-out POST may have landed, and replaying it
-    # could double-post. raise_on_status=False keeps the old contract of
-    # handing an exhausted 429 back as a response rather than introducing a
-    # new exception class at every call site.
-    retries = Retry(total=2, connect=0, read=0, other=0, status=2,
-                    status_forcelist=[429], allowed_methods=None,
-                    backoff_factor=0.5, raise_on_status=False,
-                    respect_retry_after_header=True)
+    # No transport-level retries: 429s are the session's own (see
+    # _TimeoutSession), and connection/read failures stay non-retried -- a
+    # timed-out POST may have landed, and replaying it could double-post.
     s.mount('https://', requests.adapters.HTTPAdapter(
         pool_connections=pool_connections, pool_maxsize=pool_maxsize,
-        max_retries=retries,
     ))
     return s
 
@@ -137,7 +359,7 @@ _aggs_cache = {}   # guild_pk -> (expires, {SK: item})
 
 
 def gather_streaks(guild_id, ref_date, results, games, minimum_players=1,
-                   include_players=True):
+                   include_players=True, scoring=None):
     """Display-ready streak numbers for one board render, or None when the
     store can't serve them (no guild, IAM grant not applied yet, outage) --
     callers render streak-less, so store problems never break a view.
@@ -145,7 +367,9 @@ def gather_streaks(guild_id, ref_date, results, games, minimum_players=1,
     Takes the built `games` (not just their keys) because streak eligibility is
     scoring, not merely posting: game_parser.scoring_players() needs each game's
     metric to tell a scoring result from a poop. That is the same rule
-    store.finalize_day() folds, so the two never disagree.
+    store.finalize_day() folds, so the two never disagree. A caller that
+    already ranked the day passes its ScoringContext as `scoring` and the
+    scorers are read from it instead.
 
     Works identically on both sides of the daily finalize because
     store.display_streak() folds the "played on ref_date" flag in itself:
@@ -177,7 +401,8 @@ def gather_streaks(guild_id, ref_date, results, games, minimum_players=1,
         game_keys = [g.key for g in games]
         # Poop scores earn 0 points and keep nothing alive; everything below
         # keys off who scored, never off who merely posted.
-        scorers = scoring_players(results, games, minimum_players)
+        scorers = (scoring.scorers() if scoring
+                   else scoring_players(results, games, minimum_players))
         gpk = store.guild_pk(guild_id)
         cached = _aggs_cache.get(gpk)
         if cached and cached[0] > time.monotonic():
@@ -233,7 +458,24 @@ def gather_streaks(guild_id, ref_date, results, games, minimum_players=1,
         return None
 
 
-def fetch_messages(session, channel_id, limit=100):
+# Discord ids are snowflakes: milliseconds since the Discord epoch, shifted
+# left 22 bits. The smallest id a message posted at a given instant can have
+# is therefore a pure function of the time, which is what lets a fetch stop at
+# a time boundary without parsing a single timestamp.
+DISCORD_EPOCH_MS = 1420070400000
+
+# The most a window-bounded fetch will read. A ceiling, not a depth: a normal
+# day stops well short of it on its own, and a day that reaches it keeps the
+# NEWEST messages, exactly as the old fixed depths did.
+WINDOW_FETCH_CAP = 2000
+
+
+def snowflake_at(when):
+    """The lowest message id Discord can assign at `when` (an aware datetime)."""
+    return max(int(when.timestamp() * 1000) - DISCORD_EPOCH_MS, 0) << 22
+
+
+def fetch_messages(session, channel_id, limit=100, after=None, since=None):
     """Up to `limit` messages from a channel, newest first.
 
     One loop covering every page including the first. The first page used to be
@@ -245,12 +487,29 @@ def fetch_messages(session, channel_id, limit=100):
     A short page means the channel is exhausted -- Discord returns fewer
     messages than asked only when there is no more history -- so stop instead
     of spending a round trip per run rediscovering the end of a small channel.
+
+    since (an aware datetime) bounds the read by time instead of by count:
+    pages walk back until one reaches past that instant, and whatever is older
+    is trimmed off, so the depth follows the channel's real traffic. `limit`
+    is then only a ceiling (WINDOW_FETCH_CAP). The walk goes backward rather
+    than forward from the boundary so that a day busy enough to hit the
+    ceiling loses its oldest messages, not the ones posted a minute ago.
+
+    after (a message id) reads forward instead: only what was posted since that
+    message, still handed back newest first. Discord answers an `after` page
+    with the oldest block past the cursor, so each further page starts from the
+    newest id of the one before it. A caller that gets back a full `limit` has
+    not necessarily reached the present.
     """
+    floor = snowflake_at(since) if since is not None else None
     messages = []
+    cursor = after
     while len(messages) < limit:
         page_size = min(limit - len(messages), 100)
         url = f'{DISCORD_API_BASE}/channels/{channel_id}/messages?limit={page_size}'
-        if messages:
+        if after is not None:
+            url += f'&after={cursor}'
+        elif messages:
             url += f'&before={messages[-1]["id"]}'
         r = session.get(url)
         r.raise_for_status()
@@ -258,8 +517,15 @@ def fetch_messages(session, channel_id, limit=100):
         if not isinstance(page, list) or not page:
             break
         messages += page
+        if after is not None:
+            cursor = max(page, key=lambda m: int(m['id']))['id']
+        if floor is not None and int(page[-1]['id']) < floor:
+            messages = [m for m in messages if int(m['id']) >= floor]
+            break
         if len(page) < page_size:
             break
+    if after is not None:
+        messages.sort(key=lambda m: int(m['id']), reverse=True)
     return messages
 
 
@@ -282,6 +548,7 @@ def parse_results(messages, ref_date, tz, hours_after_midnight, time_window_hour
     puzzle_numbers = compute_puzzle_numbers(ref_date)
     games = build_games(puzzle_numbers, game_overrides)
     checker = make_timestamp_checker(ref_date, tz, hours_after_midnight, time_window_hours)
+    prefetch_wordle_attachments(messages, checker)
     results = defaultdict(dict)
     for msg in messages:
         for game_key, score, metadata, uid_override in match_message(
@@ -302,33 +569,88 @@ def build_avatar_pool(session, messages, checker, guild_id=None):
     guild_id is known). That guard is an in-memory scan of messages the caller
     already fetched, so a channel the Wordle bot doesn't post in pays nothing
     for this call. Each user can carry more than one hash -- see
-    _user_avatar_hashes for why -- and _match_avatar scores them by their
+    _user_avatar_hashes for why -- and _match_avatars scores them by their
     closest one.
 
     guild_id is optional so a caller that can't resolve it still gets the
-    global-avatar pool rather than nothing.
+    global-avatar pool rather than nothing. With it, hashes also persist in the
+    guild's AVATARS item, so a cold container resolves a known pool with one
+    table read instead of a CDN round trip per candidate.
+
+    A guild also remembers which crop each player's grid showed (the CROPS
+    item, _remember_crops). When every finished grid in the window's images
+    matches a remembered crop of someone posting in the window, those crops
+    are the whole pool and nothing is fetched -- which on most days is every
+    pass after the first.
+
+    Otherwise the pool is built in two tiers. First only the likely players
+    (_likely_wordle_players), with whatever server avatars this process
+    already knows and no member-list read. Most of a window's authors are
+    chatting, not playing, so this is fewer CDN downloads -- and with fewer
+    faces to tell apart, the margin test has fewer near misses to trip on.
+    Only if a finished grid is still unmatched does the pool widen to every
+    author in the window, with the member list read for server avatars, as
+    it always used to be built.
     """
     if not _has_multiplayer_wordle(messages, checker):
         return {}
     uid_to_avatar = _extract_user_avatars(messages)
     if not uid_to_avatar:
         return {}
-    # Whole-guild server avatars in one read, before the per-user hashing.
-    server_avatars = _guild_server_avatars(session, guild_id)
+    decodes = [d for d in wordle_decodes(messages, checker) if len(d.grids) > 1]
+    memory = _load_crop_memory(guild_id)
+    learned = {}
+    for h, entry in memory.items():
+        if entry['uid'] in uid_to_avatar:
+            learned[entry['uid']] = learned.get(entry['uid'], ()) + (h,)
+    if learned and decodes and all(_resolves(d, learned, max_distance=CROP_MATCH_DISTANCE)
+                                   for d in decodes):
+        _remember_crops(guild_id, decodes, learned, learn=False)
+        return learned
+
+    _load_avatar_hashes(guild_id)
+    likely = _likely_wordle_players(messages, checker, guild_id) | set(learned)
+    candidates = {uid: a for uid, a in uid_to_avatar.items() if uid in likely}
+    pool = None
+    if decodes and 0 < len(candidates) < len(uid_to_avatar):
+        server_avatars = _known_server_avatars(guild_id)
+        pool = _hash_pool(session, guild_id, candidates, server_avatars, learned)
+        if not all(_resolves(d, pool) for d in decodes):
+            pool = None
+    if pool is None:
+        # Whole-guild server avatars in one read, before the per-user hashing.
+        candidates = uid_to_avatar
+        server_avatars = _guild_server_avatars(session, guild_id)
+        pool = _hash_pool(session, guild_id, candidates, server_avatars, learned)
+    used = [a for uid, avatar in candidates.items()
+            for a in (server_avatars.get(uid) if guild_id else None, avatar) if a]
+    _save_avatar_hashes(guild_id, used)
+    _remember_crops(guild_id, decodes, pool)
+    return pool
+
 
+def _hash_pool(session, guild_id, candidates, server_avatars, learned):
+    """{uid: hashes} for `candidates` ({uid: global avatar id}), each user's
+    pictures hashed side by side, plus the learned crops of those users."""
+    # The hashing goes to the image pool, when one is configured, for more
+    # than one candidate; the threads still overlap the downloads.
+    workers = image_pool() if len(candidates) > 1 else None
     from concurrent.futures import ThreadPoolExecutor, as_completed
     pool = {}
     with ThreadPoolExecutor(max_workers=16) as ex:
         futures = {
             ex.submit(_user_avatar_hashes, session, guild_id, uid, avatar,
-                      server_avatars.get(uid)): uid
-            for uid, avatar in uid_to_avatar.items()
+                      server_avatars.get(uid), workers): uid
+            for uid, avatar in candidates.items()
         }
         for fut in as_completed(futures):
             uid = futures[fut]
             hashes = fut.result()
             if hashes:
                 pool[uid] = hashes
+    for uid, hashes in learned.items():
+        if uid in candidates:
+            pool[uid] = pool.get(uid, ()) + hashes
     return pool
 
 
@@ -343,10 +665,18 @@ def is_scoreboard_message(msg, bot_id=None):
     unpins what it matches: another app's v2 post in the channel must not
     qualify. The dedup callers pass nothing and keep the flag-only behaviour --
     a board is a board there, whoever posted it.
+
+    A board split across messages (format_scoreboard_pages) is still one
+    board, and only its head matches: the rest open with a continuation line
+    (is_board_continuation). So the dedup scan finds the head, the pin pruner
+    only ever counts heads, and the sticky's Yesterday link lands on the top
+    of the board rather than on whichever part of it went out last.
     """
     flags = msg.get('flags') or 0
     if not flags & FLAG_IS_COMPONENTS_V2:
         return False
+    if is_board_continuation(msg.get('components')):
+        return False
     if bot_id:
         return (msg.get('author') or {}).get('id') == str(bot_id)
     return True
@@ -446,30 +776,211 @@ def _has_multiplayer_wordle(messages, checker):
     return False
 
 
-# Keyed by the full avatar URL, which embeds Discord's own content hash for the
-# picture. A member who changes their avatar therefore gets a new key and is
-# re-hashed on sight, while the old entry simply goes unused -- so this never
-# needs to expire and never serves a stale picture. Survives across calls
-# within a warm process.
-_avatar_hash_cache = {}   # avatar url -> hash
+# How far back the DAY# archive counts someone as a Wordle player. Read once a
+# day per guild per process: the archive only grows at finalize, and fourteen
+# items is a Query the 5-RCU table should not pay every sticky minute.
+WORDLE_RECENT_DAYS = 14
+_recent_wordle_players = {}   # guild_id -> (UTC day read, {uid})
 
 
-def _download_avatar_hash(session, url):
-    if url in _avatar_hash_cache:
-        return _avatar_hash_cache[url]
+def _archived_wordle_players(guild_id):
+    """Everyone with a Wordle result in the guild's last WORDLE_RECENT_DAYS
+    archived days. Fail-open: a store error means nobody, which only narrows
+    less."""
+    if not guild_id:
+        return set()
+    today = datetime.now(timezone.utc).date()
+    cached = _recent_wordle_players.get(guild_id)
+    if cached and cached[0] == today:
+        return cached[1]
+    try:
+        start = store.day_str(today - timedelta(days=WORDLE_RECENT_DAYS))
+        days = store.fetch_days(guild_id, start, store.day_str(today))
+        players = {uid for d in days for uid in d['games'].get('wordle', {})}
+    except Exception as e:
+        print(f'avatar pool: archive unavailable, not narrowing by it -- '
+              f'{type(e).__name__}: {e}')
+        players = set()
+    _recent_wordle_players[guild_id] = (today, players)
+    return players
+
+
+def _likely_wordle_players(messages, checker, guild_id):
+    """Who is likely to be in one of the window's Wordle grids: recent Wordle
+    players from the archive, anyone posting a game result in the window
+    today (names_a_game), and anyone the Wordle bot's own messages mention."""
+    likely = set(_archived_wordle_players(guild_id))
+    for m in messages:
+        if not checker(m['timestamp']):
+            continue
+        if m['author']['id'] == WORDLE_BOT_ID:
+            likely.update(u['id'] for u in m.get('mentions') or () if u.get('id'))
+        elif names_a_game(m.get('content') or ''):
+            iu = m.get('interaction_metadata', {}).get('user') or {}
+            likely.add(iu.get('id') or m['author']['id'])
+    return likely
+
+
+# Keyed by avatar id -- Discord's own content hash for the picture, which is
+# also the last segment of its CDN URL. A member who changes their avatar
+# therefore gets a new key and is re-hashed on sight, while the old entry simply
+# goes unused -- so this never needs to expire and never serves a stale
+# picture. Survives across calls within a warm process, and is seeded from the
+# guild's AVATARS item on a cold one (_load_avatar_hashes).
+_avatar_hash_cache = {}   # avatar id -> hash
+
+# What each guild's AVATARS item holds, as far as this process knows: loaded
+# once per guild per process, and replaced by every write this process makes.
+_stored_avatar_hashes = {}   # guild_id -> {avatar id: hash}
+
+
+def _download_avatar_hash(session, avatar_id, url, workers=None):
+    if avatar_id in _avatar_hash_cache:
+        return _avatar_hash_cache[avatar_id]
     from PIL import Image
     import io
     try:
         r = session.get(url, timeout=3)
         r.raise_for_status()
-        img = Image.open(io.BytesIO(r.content)).convert('RGB')
-        h = _avatar_ahash(img)
-        _avatar_hash_cache[url] = h
+        if workers:
+            h = workers.ahash(r.content)
+        else:
+            h = _avatar_ahash(Image.open(io.BytesIO(r.content)).convert('RGB'))
+        _avatar_hash_cache[avatar_id] = h
         return h
     except Exception:
         return None
 
 
+def _load_avatar_hashes(guild_id):
+    """Seed the in-process cache from the guild's AVATARS item, once.
+
+    A cold container otherwise re-downloads and re-hashes every candidate's
+    picture from the CDN before it can attribute a single grid; with this it
+    starts from one read. Fail-open: a store error leaves the CDN path to do
+    the work, and is not retried until the next cold start.
+    """
+    if not guild_id or guild_id in _stored_avatar_hashes:
+        return
+    try:
+        stored = store.get_avatar_hashes(guild_id)
+    except Exception as e:
+        print(f'avatar pool: stored hashes unavailable -- {type(e).__name__}: {e}')
+        stored = {}
+    _stored_avatar_hashes[guild_id] = stored
+    for avatar_id, h in stored.items():
+        _avatar_hash_cache.setdefault(avatar_id, h)
+
+
+def _save_avatar_hashes(guild_id, used):
+    """Write the pool's hashes back to the AVATARS item, if any are new to it.
+
+    `used` is every avatar id this pool looked up. The item keeps the
+    AVATAR_HASH_CAP most recently used: entries this pool did not touch go
+    first, oldest write first. Nothing is written when the item already had
+    everything, which is nearly every call.
+    """
+    if not guild_id or guild_id not in _stored_avatar_hashes:
+        return
+    stored = _stored_avatar_hashes[guild_id]
+    used = [a for a in used if a in _avatar_hash_cache]
+    if all(a in stored for a in used):
+        return
+    recent = set(used)
+    merged = {a: h for a, h in stored.items() if a not in recent}
+    merged.update((a, _avatar_hash_cache[a]) for a in used)
+    merged = dict(list(merged.items())[-store.AVATAR_HASH_CAP:])
+    try:
+        store.put_avatar_hashes(guild_id, merged)
+    except Exception as e:
+        print(f'avatar pool: could not store hashes -- {type(e).__name__}: {e}')
+        return
+    _stored_avatar_hashes[guild_id] = merged
+
+
+# Learned crops. The Wordle bot draws a player's picture the same way in every
+# image, so once a grid's crop has been attributed against the real avatar
+# pool, the crop itself identifies that player next time. An entry counts the
+# days it was seen (`hits`) and when it was last seen (`seen`, epoch days), and
+# fades with CROP_HALF_LIFE_DAYS of absence: one sighting lasts about a month,
+# a regular's months. It only ever stands in for the pool when it matches
+# almost bit for bit (CROP_MATCH_DISTANCE), so a different picture -- a new
+# avatar, a newcomer -- always falls through to the real thing.
+CROP_MATCH_DISTANCE = 4
+CROP_HALF_LIFE_DAYS = 14
+CROP_MIN_WEIGHT = 0.25
+CROP_MEMORY_CAP = 300
+_crop_memory = {}   # guild_id -> {crop hash: {'uid', 'hits', 'seen'}}
+
+
+def _load_crop_memory(guild_id):
+    """The guild's learned crops, read from the table once per process.
+    Fail-open: a store error means an empty memory, so the pool gets built."""
+    if not guild_id:
+        return {}
+    if guild_id not in _crop_memory:
+        try:
+            _crop_memory[guild_id] = store.get_crop_memory(guild_id)
+        except Exception as e:
+            print(f'avatar pool: learned crops unavailable -- {type(e).__name__}: {e}')
+            _crop_memory[guild_id] = {}
+    return _crop_memory[guild_id]
+
+
+def _resolves(decoded, pool, **match):
+    """True when every finished grid of a decoded image matches someone in the
+    pool, under _match_avatars' thresholds or the ones given."""
+    matched = _match_avatars(decoded.crop_hashes, pool, **match)
+    return all(uid is not None
+               for uid, h, score in zip(matched, decoded.crop_hashes, decoded.scores)
+               if h is not None and score not in (None, -1))
+
+
+def _crop_weight(entry, today):
+    return entry['hits'] * 0.5 ** ((today - entry['seen']) / CROP_HALF_LIFE_DAYS)
+
+
+def _remember_crops(guild_id, decodes, pool, learn=True):
+    """Record which crop each attributed grid showed, and write the CROPS item
+    back if that changed anything.
+
+    learn=False only refreshes entries that already exist -- a pass that was
+    attributed from the memory itself must not teach it anything new. Counted
+    once per entry per day, so a day of sticky passes costs one write.
+    """
+    memory = _crop_memory.get(guild_id)
+    if memory is None:
+        return
+    today = int(time.time() // 86400)
+    changed = False
+    for decoded in decodes:
+        for h, uid in zip(decoded.crop_hashes, _match_avatars(decoded.crop_hashes, pool)):
+            if uid is None:
+                continue
+            entry = memory.get(h)
+            if entry and entry['uid'] == uid:
+                if entry['seen'] < today:
+                    entry['hits'] = max(1, round(_crop_weight(entry, today))) + 1
+                    entry['seen'] = today
+                    changed = True
+            elif learn:
+                memory[h] = {'uid': uid, 'hits': 1, 'seen': today}
+                changed = True
+    if not changed:
+        return
+    faded = [h for h, e in memory.items() if _crop_weight(e, today) < CROP_MIN_WEIGHT]
+    for h in faded:
+        del memory[h]
+    if len(memory) > CROP_MEMORY_CAP:
+        keep = sorted(memory, key=lambda h: _crop_weight(memory[h], today))[-CROP_MEMORY_CAP:]
+        for h in set(memory) - set(keep):
+            del memory[h]
+    try:
+        store.put_crop_memory(guild_id, memory)
+    except Exception as e:
+        print(f'avatar pool: could not store learned crops -- {type(e).__name__}: {e}')
+
+
 # One request per 1000 members, via the Server Members Intent. This replaced a
 # per-user fan-out at GET /guilds/{id}/members/{id}, whose 5-requests-per-second
 # bucket 429d most of a pool built flat-out -- and did it silently, since a
@@ -536,7 +1047,14 @@ def _guild_server_avatars(session, guild_id):
     return avatars
 
 
-def _user_avatar_hashes(session, guild_id, uid, global_avatar, server_avatar):
+def _known_server_avatars(guild_id):
+    """The server avatars this process last read for the guild, expired or not,
+    without reading them again -- {} if it never has."""
+    cached = _server_avatar_cache.get(guild_id)
+    return cached[1] if cached else {}
+
+
+def _user_avatar_hashes(session, guild_id, uid, global_avatar, server_avatar, workers=None):
     """Hashes of every picture the Wordle image might render this user with.
 
     Discord shows a member's *server* avatar everywhere inside that guild, and
@@ -546,12 +1064,15 @@ def _user_avatar_hashes(session, guild_id, uid, global_avatar, server_avatar):
     ceiling, where the server avatar landed at 3). Both are hashed rather than
     just the server one, because most members have never set a server avatar
     and older images predate whatever they have set since.
+
+    `workers` is an ImagePool to hash in, or None to hash in this process.
     """
-    urls = []
+    pictures = []
     if guild_id and server_avatar:
-        urls.append(f'https://cdn.discordapp.com/guilds/{guild_id}/users/{uid}'
-                    f'/avatars/{server_avatar}.png?size=64')
+        pictures.append((server_avatar, f'https://cdn.discordapp.com/guilds/{guild_id}'
+                                         f'/users/{uid}/avatars/{server_avatar}.png?size=64'))
     if global_avatar:
-        urls.append(f'https://cdn.discordapp.com/avatars/{uid}/{global_avatar}.png?size=64')
-    return tuple(h for h in (_download_avatar_hash(session, u) for u in urls)
+        pictures.append((global_avatar, f'https://cdn.discordapp.com/avatars/{uid}'
+                                         f'/{global_avatar}.png?size=64'))
+    return tuple(h for h in (_download_avatar_hash(session, a, u, workers) for a, u in pictures)
                  if h is not None)
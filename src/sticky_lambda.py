@@ -2,18 +2,21 @@ import json
 import os
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from collections import defaultdict
 
 from game_parser import (
     compute_puzzle_numbers, build_games, top_game_buttons,
-    match_message, make_timestamp_checker, STREAK_MIN,
+    match_message, make_timestamp_checker, fetch_window_start, STREAK_MIN,
+    WORDLE_BOT_ID, prefetch_wordle_attachments, image_pool,
 )
 from scoreboard import (
     DISCORD_API_BASE, FLAG_SUPPRESS_EMBEDS, FLAG_SUPPRESS_NOTIFICATIONS,
     make_session, fetch_messages, reference_date, is_scoreboard_message,
     is_sticky_message, build_avatar_pool, safe_guild_id, gather_streaks,
+    WINDOW_FETCH_CAP, discord_governor,
     PLAY_BUTTON_CUSTOM_ID, MORE_BUTTON_CUSTOM_ID, SCORES_BUTTON_CUSTOM_ID,
     STICKY_HEADING,
 )
@@ -216,12 +219,147 @@ def update_sticky(channel_id, channel_messages, results, server_streak=0,
 _probe_state = {}   # guild_id -> {'fingerprint', 'newest_id', 'expires'}
 PROBE_MAX_AGE = 600
 
-# Don't start another guild with less than this left on the clock; a typical
-# pass is well under it, so the margin only ever trims the pathological runs.
+# What the last pass parsed, per guild, so the next one only has to read what
+# was posted since: the newest message id seen (the cursor), the channel tail
+# the sticky decisions run against, and the day's results folded so far. Same
+# lifetime and fingerprint as _probe_state, and for the same reason the probe
+# is bounded: reading forward from a cursor cannot see an older message being
+# edited or deleted, so a full re-parse still runs every RECONCILE_MAX_AGE --
+# and on every day rollover or config change, which move the fingerprint.
+_ingest_state = {}  # guild_id -> {'fingerprint', 'cursor', 'messages',
+                    #              'results', 'puzzle_numbers', 'reconcile_at'}
+RECONCILE_MAX_AGE = 600
+
+# The most an incremental read will take before it gives up and re-parses
+# instead: a minute busier than this is rare enough that the full pass is the
+# simpler answer to it.
+INCREMENTAL_LIMIT = 100
+
+# Don't start another guild with less than this left on the clock, on top of
+# what that guild's last pass took; a typical pass is well under it, so the
+# margin only ever trims the pathological runs.
 DEADLINE_MARGIN_MS = 8000
 
+# Guilds run at once. Most passes are one probe request, so the pool is mostly
+# overlapping round trips; the rate-limit governor keeps the sum honest.
+STICKY_WORKERS = 8
 
-def run_guild(cfg, force=False):
+# How each guild's last pass went, for ordering the next tick: when it last
+# settled, what it cost, and whether it left work behind. Same lifetime as
+# _probe_state. guild_id -> {'settled_at', 'cost', 'pending'}
+_guild_runs = {}
+
+
+def _fold_results(cfg, messages, games, checker, avatar_pool, results, puzzle_numbers):
+    """Parse `messages` into results, in place. Returns how many had their
+    embeds suppressed.
+
+    A player's FIRST result for a game is the one that counts, so messages are
+    folded oldest first and an entry already present is never overwritten. That
+    makes folding a later batch into an earlier pass's results the same as
+    parsing the lot in one go -- and re-folding a batch a failed pass already
+    half-applied changes nothing.
+    """
+    prefetch_wordle_attachments(messages, checker)
+    suppressed = 0
+    for msg in reversed(messages):
+        entries = match_message(msg, games, checker, avatar_hashes=avatar_pool)
+        if entries:
+            suppressed += _fold_entries(cfg, msg, entries, results, puzzle_numbers)
+    return suppressed
+
+
+def _fold_entries(cfg, msg, entries, results, puzzle_numbers):
+    """Fold one message's match_message entries into results; True when its
+    embeds were suppressed on the way."""
+    suppressed = bool(cfg['suppress_embeds']
+                      and suppress_embeds(cfg['input_channel_id'], msg))
+    for game_key, score, metadata, uid_override in entries:
+        user_id = uid_override or msg.get('interaction_metadata', {}).get('user', {}).get('id') or msg['author']['id']
+        results[game_key].setdefault(user_id, score)
+        puzzle_numbers.update(metadata)
+    return suppressed
+
+
+def _day_fingerprint(cfg):
+    """(today, tz, today_day, fingerprint) for a guild right now. The
+    fingerprint is what both pieces of per-guild state are pinned to: the open
+    day plus the whole config, so a rollover or a /setup edit retires them."""
+    tz = ZoneInfo(cfg['timezone'])
+    today = reference_date(datetime.now(tz), tz, cfg['hours_after_midnight'])
+    today_day = store.day_str(today)
+    return today, tz, today_day, f"{today_day} {json.dumps(cfg, sort_keys=True, default=str)}"
+
+
+def forget_guild(guild_id):
+    """Drop everything the last pass kept for a guild, so its next pass is a
+    full one."""
+    _probe_state.pop(guild_id, None)
+    _ingest_state.pop(guild_id, None)
+
+
+def apply_gateway_event(cfg, event_type, data):
+    """Fold one gateway dispatch for cfg's input channel into the guild's
+    ingest state, the push-side twin of run_guild's forward read. Returns
+    (entries, needs_pass): what match_message made of a new message, and
+    whether the sticky should be settled again.
+
+    Used by tools/gateway_consumer.py, which then calls run_guild(cfg,
+    current=True) once the channel goes quiet. A new message is parsed on
+    arrival and folded exactly as a forward read would fold it; anything the
+    kept state cannot absorb -- an edit or a deletion inside the tail, a Wordle
+    bot image (its attribution needs the avatar pool), a new day or config --
+    drops the state instead, and the pass that follows is a full one. With no
+    state at all there is nothing to fold into, and the pass is full anyway.
+
+    An update that leaves the content alone is ignored: that is what our own
+    embed suppression looks like from the gateway, and it must not turn every
+    counted share into a full re-parse.
+    """
+    gid = cfg['guild_id']
+    state = _ingest_state.get(gid)
+    ids = {m['id'] for m in state['messages']} if state else set()
+
+    if event_type == 'MESSAGE_UPDATE':
+        old = next((m for m in state['messages'] if m['id'] == data['id']), None) \
+            if data['id'] in ids else None
+        if old is None or 'content' not in data or data['content'] == old.get('content'):
+            return [], False
+        forget_guild(gid)
+        return [], True
+
+    if event_type == 'MESSAGE_DELETE':
+        if data['id'] not in ids:
+            return [], False
+        forget_guild(gid)
+        return [], True
+
+    if event_type != 'MESSAGE_CREATE':
+        return [], False
+
+    ours = data['author']['id'] == str(DISCORD_BOT_ID)
+    if data['author']['id'] == WORDLE_BOT_ID and data.get('attachments'):
+        forget_guild(gid)
+        return [], True
+    today, tz, _, fingerprint = _day_fingerprint(cfg)
+    games = build_games(compute_puzzle_numbers(today), cfg['game_overrides'])
+    checker = make_timestamp_checker(today, tz, cfg['hours_after_midnight'],
+                                     cfg['time_window_hours'])
+    entries = match_message(data, games, checker)
+    if state is None or state['fingerprint'] != fingerprint:
+        forget_guild(gid)
+        return entries, not ours
+    if int(data['id']) <= int(state['cursor']):
+        return entries, False   # already read, by a pass or a replay
+    state['messages'].insert(0, data)
+    state['cursor'] = data['id']
+    if entries:
+        _fold_entries(cfg, data, entries, state['results'], state['puzzle_numbers'])
+    _probe_state.pop(gid, None)
+    return entries, not ours
+
+
+def run_guild(cfg, force=False, current=False):
     """One guild's sticky pass: parse today's plays and settle the sticky.
 
     Runs around the clock. The day it tracks is whichever one reference_date
@@ -231,24 +369,23 @@ def run_guild(cfg, force=False):
     later therefore has a window each morning where the day has rolled but
     yesterday's board has not posted yet; the only thing in the sticky that
     depends on the board is the Yesterday link, and it gates itself below.
+
+    current=True is the gateway consumer vouching that apply_gateway_event has
+    already folded everything posted since the last pass, so the forward read
+    is skipped; a pass with no usable state is a full one regardless.
     """
     channel_id = cfg['input_channel_id']
-    tz = ZoneInfo(cfg['timezone'])
-    now_local = datetime.now(tz)
-
-    today = reference_date(now_local, tz, cfg['hours_after_midnight'])
+    today, tz, today_day, fingerprint = _day_fingerprint(cfg)
 
     # Probe short-circuit: when the last full pass left the sticky settled and
     # neither the date nor the config has moved, a single-message fetch proving
     # "the newest message is still the settled sticky" also proves the parse
     # could not have changed -- no new plays, same window, same games -- so the
-    # 200-message fetch, the regex pass, and the streak read are all skipped.
+    # channel read, the regex pass, and the streak read are all skipped.
     # Bounded by PROBE_MAX_AGE so what a head probe can't see (an edit or
     # deletion of an older message, a changed avatar) still heals within
     # minutes rather than waiting on the next new message.
     gid = cfg['guild_id']
-    today_day = store.day_str(today)
-    fingerprint = f"{today_day} {json.dumps(cfg, sort_keys=True, default=str)}"
     state = None if force else _probe_state.get(gid)
     if state and state['fingerprint'] == fingerprint \
             and state['expires'] > time.monotonic():
@@ -258,26 +395,43 @@ def run_guild(cfg, force=False):
     _probe_state.pop(gid, None)
 
     rotation = store.current_rotation(cfg, today_day)
-    puzzle_numbers = compute_puzzle_numbers(today)
-    games = build_games(puzzle_numbers, cfg['game_overrides'])
+    games = build_games(compute_puzzle_numbers(today), cfg['game_overrides'])
     checker = make_timestamp_checker(today, tz, cfg['hours_after_midnight'],
                                      cfg['time_window_hours'])
 
-    messages = fetch_messages(_session, channel_id, limit=200)
-    avatar_pool = build_avatar_pool(_session, messages, checker, cfg['guild_id'])
-
-    results = defaultdict(dict)
-    suppressed = 0
-    for msg in messages:
-        entries = match_message(msg, games, checker, avatar_hashes=avatar_pool)
-        if not entries:
-            continue
-        if cfg['suppress_embeds'] and suppress_embeds(channel_id, msg):
-            suppressed += 1
-        for game_key, score, metadata, uid_override in entries:
-            user_id = uid_override or msg.get('interaction_metadata', {}).get('user', {}).get('id') or msg['author']['id']
-            results[game_key][user_id] = score
-            puzzle_numbers.update(metadata)
+    # Incremental read: only what was posted since the last pass, folded into
+    # the results that pass kept. Anything the cursor can't vouch for -- a new
+    # day, a config edit, a test run, the reconcile clock running out, or a
+    # burst too big for one read -- falls through to the full pass below.
+    ingest = None if force else _ingest_state.pop(gid, None)
+    if ingest and ingest['fingerprint'] == fingerprint \
+            and ingest['reconcile_at'] > time.monotonic():
+        fresh = [] if current else fetch_messages(
+            _session, channel_id, limit=INCREMENTAL_LIMIT, after=ingest['cursor'])
+        if len(fresh) >= INCREMENTAL_LIMIT:
+            ingest = None
+    else:
+        ingest = None
+
+    if ingest:
+        # The newest WINDOW_FETCH_CAP, the same ceiling a full pass reads to,
+        # so a busy day's kept tail stops growing with every tick.
+        messages = (fresh + ingest['messages'])[:WINDOW_FETCH_CAP]
+        results, puzzle_numbers = ingest['results'], ingest['puzzle_numbers']
+        reconcile_at = ingest['reconcile_at']
+        # The kept tail has already been attributed; only a new bot image needs
+        # a pool, and build_avatar_pool checks the whole tail for that itself.
+        avatar_pool = (build_avatar_pool(_session, messages, checker, gid)
+                       if any(m['author']['id'] == WORDLE_BOT_ID for m in fresh) else {})
+    else:
+        messages = fresh = fetch_messages(_session, channel_id, limit=WINDOW_FETCH_CAP,
+                                          since=fetch_window_start(today, tz))
+        results, puzzle_numbers = defaultdict(dict), compute_puzzle_numbers(today)
+        reconcile_at = time.monotonic() + RECONCILE_MAX_AGE
+        avatar_pool = build_avatar_pool(_session, messages, checker, gid)
+
+    suppressed = _fold_results(cfg, fresh, games, checker, avatar_pool,
+                               results, puzzle_numbers)
 
     # Server-wide streak flair, bare fire+number at the end of the content
     # line -- kept alive today (live +1) or still extendable from yesterday.
@@ -311,6 +465,17 @@ def run_guild(cfg, force=False):
     action = update_sticky(channel_id, messages, results, server_streak,
                            link_yesterday=link_yesterday,
                            game_buttons=game_buttons, show_more=show_more)
+    if not force and messages:
+        # Whatever update_sticky deleted is gone from the channel, and what it
+        # posted is newer than the cursor, so the next read picks that up.
+        tail = messages if action == 'unchanged' else \
+            [m for m in messages if not is_sticky_message(m, DISCORD_BOT_ID)]
+        _ingest_state[gid] = {'fingerprint': fingerprint,
+                              'cursor': messages[0]['id'],
+                              'messages': tail,
+                              'results': results,
+                              'puzzle_numbers': puzzle_numbers,
+                              'reconcile_at': reconcile_at}
     if action == 'unchanged' and not force:
         # 'unchanged' guarantees messages[0] is the single, settled sticky.
         _probe_state[gid] = {'fingerprint': fingerprint,
@@ -320,6 +485,29 @@ def run_guild(cfg, force=False):
     return f'{action}{note}'
 
 
+def schedule(configs):
+    """Order guilds for a tick, the ones most in need of a pass first.
+
+    Guilds with work left behind come first -- a failed or deferred pass, or
+    one that had to change the sticky, which is what an active channel looks
+    like. Then the longest since a pass last completed, so a guild can't be
+    pushed back indefinitely; one this container has never run counts as the
+    stalest of all. Cheapest last-known pass breaks ties, getting the most
+    guilds settled if the clock does run short. The pool takes guilds in this
+    order, and the per-guild deadline check defers from the back of it.
+    """
+    now = time.monotonic()
+
+    def urgency(cfg):
+        last = _guild_runs.get(cfg['guild_id'])
+        if last is None:
+            return (0, float('-inf'), 0)
+        age = now - last['settled_at'] if 'settled_at' in last else float('inf')
+        return (0 if last['pending'] else 1, -age, last.get('cost', 0))
+
+    return sorted(configs, key=urgency)
+
+
 def lambda_handler(event, context):
     """Frequent tick: settle the sticky for every guild with one enabled.
 
@@ -347,32 +535,48 @@ def lambda_handler(event, context):
         result = run_guild(cfg, force=True)
         return {'statusCode': 200, 'body': json.dumps(f'Sticky (test): {result}')}
 
-    configs = [cfg for cfg in store.all_configs()
-               if cfg['sticky_enabled'] and cfg['input_channel_id']]
-    # A different starting guild each minute: if a run ever runs out of time,
-    # the deferral below lands on different guilds each tick instead of
-    # deterministically starving the tail of the partition order.
-    if len(configs) > 1:
-        offset = int(time.time() // 60) % len(configs)
-        configs = configs[offset:] + configs[:offset]
-
-    summary = {}
-    for i, cfg in enumerate(configs):
+    configs = schedule(cfg for cfg in store.all_configs()
+                       if cfg['sticky_enabled'] and cfg['input_channel_id'])
+
+    def run(cfg):
         gid = cfg['guild_id']
-        if context is not None \
-                and context.get_remaining_time_in_millis() < DEADLINE_MARGIN_MS:
-            # Stop cleanly rather than letting Lambda kill the run mid-guild;
-            # the start-offset rotation above spreads the deferral around.
-            print(f'sticky: out of time, deferring {len(configs) - i} guild(s)')
-            for later in configs[i:]:
-                summary[later['guild_id']] = 'deferred: out of time'
-            break
+        last = _guild_runs.get(gid) or {}
+        if context is not None and context.get_remaining_time_in_millis() \
+                < DEADLINE_MARGIN_MS + last.get('cost', 0) * 1000:
+            # Stop cleanly rather than letting Lambda kill the run mid-guild.
+            # A deferred guild stays pending and keeps aging, so it sorts to
+            # the front of the next tick instead of starving at the back.
+            _guild_runs[gid] = {**last, 'pending': True}
+            return 'deferred: out of time'
+        t0 = time.monotonic()
         try:
-            summary[gid] = run_guild(cfg)
+            outcome = run_guild(cfg)
         except Exception as e:
             traceback.print_exc()
-            summary[gid] = f'FAILED {type(e).__name__}: {e}'
-
+            _guild_runs[gid] = {**last, 'cost': time.monotonic() - t0, 'pending': True}
+            return f'FAILED {type(e).__name__}: {e}'
+        now = time.monotonic()
+        _guild_runs[gid] = {'settled_at': now, 'cost': now - t0,
+                            'pending': not outcome.startswith('unchanged')}
+        return outcome
+
+    # Guilds are independent -- each one's channel, probe and ingest state are
+    # its own -- so the pool only overlaps their round trips. It changes
+    # nothing about a double-fire: each guild still runs once per invocation,
+    # and two overlapping invocations converge through update_sticky's
+    # post-write sweep exactly as they did when this loop was serial.
+    # The image workers fork while this is still the only thread (image_pool).
+    image_pool()
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=STICKY_WORKERS) as ex:
+        outcomes = list(ex.map(run, configs))
+    summary = {cfg['guild_id']: outcome for cfg, outcome in zip(configs, outcomes)}
+    deferred = sum(1 for o in outcomes if o.startswith('deferred'))
+    if deferred:
+        print(f'sticky: out of time, deferred {deferred} guild(s)')
+    if configs:
+        print(f'sticky: {len(configs)} guild(s) in {time.monotonic() - t0:.2f}s')
+        print(discord_governor.report())
     if not summary:
         summary = 'no guilds with a sticky to run'
     return {'statusCode': 200, 'body': json.dumps(summary)}
@@ -9,6 +9,8 @@ One table, generic PK/SK string keys, no GSIs. Item catalog (see SPEC.md):
     GUILD#<gid>               AGG#GAME#<key>    per-game server streak + player sets
     GUILD#<gid>#PLAYER#<uid>  AGG#SERVER        per-player overall streak (any game)
     GUILD#<gid>#PLAYER#<uid>  AGG#GAME#<key>    per-player-per-game streak + totals
+    GUILD#<gid>               AVATARS           avatar id -> perceptual hash, a cache
+    GUILD#<gid>               CROPS             Wordle avatar crop hash -> uid, learned
 
 All configs share one partition (GUILDS) so the scheduled lambdas can load every
 guild with a single small Query each tick -- a Scan would read the whole table
@@ -52,6 +54,14 @@ DAY_FMT = '%Y-%m-%d'
 GUILDS_PK = 'GUILDS'
 SERVER_AGG_SK = 'AGG#SERVER'
 GAME_AGG_PREFIX = 'AGG#GAME#'
+AVATARS_SK = 'AVATARS'
+
+# Entries the AVATARS item keeps. Each is ~60 bytes, so this holds the item
+# near 12KB -- 12 WCU a rewrite, paid only when a picture nobody had hashed
+# before shows up, which the 5-WCU table's burst capacity absorbs.
+AVATAR_HASH_CAP = 200
+
+CROPS_SK = 'CROPS'
 
 # --- Per-server configuration schema -------------------------------------------
 # The table is the ONLY source of per-server config -- env vars configure
@@ -195,9 +205,6 @@ CONFIG_FIELDS = [
     # /setup limits
     ConfigField('minimum_players', default=1, coerce=int, group='limits', minimum=1,
                 describe='Hide games with fewer players than this (default 1)'),
-    ConfigField('hundreds_of_messages', default=1, coerce=int, group='limits',
-                option='message_volume', minimum=1, maximum=8,
-                describe='Hundreds of messages/day in the input channel (default 1)'),
     # The channel's pin ceiling is shared with every other pin in it, so the
     # daily board needs a window rather than an ever-growing stack. Bounded by
     # PIN_CAP because a window wider than the channel can hold is meaningless.
@@ -644,6 +651,23 @@ def all_configs():
     return configs
 
 
+def get_avatar_hashes(guild_id):
+    """{avatar id: 64-bit average hash} from the guild's AVATARS item, {} when
+    it has none. See scoreboard.build_avatar_pool."""
+    resp = table().get_item(Key={'PK': guild_pk(guild_id), 'SK': AVATARS_SK})
+    item = resp.get('Item') or {}
+    return {k: int(v) for k, v in (item.get('hashes') or {}).items()}
+
+
+def get_crop_memory(guild_id):
+    """{crop hash: {'uid', 'hits', 'seen'}} from the guild's CROPS item, {}
+    when it has none. See scoreboard.build_avatar_pool."""
+    resp = table().get_item(Key={'PK': guild_pk(guild_id), 'SK': CROPS_SK})
+    item = resp.get('Item') or {}
+    return {int(h, 16): {'uid': str(e['uid']), 'hits': int(e['hits']), 'seen': int(e['seen'])}
+            for h, e in (item.get('crops') or {}).items()}
+
+
 # --- Writes ---------------------------------------------------------------------
 
 def update_config(guild_id, updates):
@@ -892,6 +916,25 @@ def set_rotation(guild_id, day, game_keys, prev_day=None, prev_games=()):
             raise
 
 
+def put_avatar_hashes(guild_id, hashes):
+    """Replace the guild's AVATARS item with `hashes` ({avatar id: hash}).
+
+    A plain overwrite, like DAY#: the item is a cache of content-addressed
+    values, so two writers racing only means the loser's new entries are
+    hashed again by whoever next misses them.
+    """
+    table().put_item(Item={'PK': guild_pk(guild_id), 'SK': AVATARS_SK,
+                           'hashes': {k: int(v) for k, v in hashes.items()}})
+
+
+def put_crop_memory(guild_id, memory):
+    """Replace the guild's CROPS item. Hashes are stored as hex: the map keys
+    of a DynamoDB item are strings. A plain overwrite, as put_avatar_hashes."""
+    table().put_item(Item={'PK': guild_pk(guild_id), 'SK': CROPS_SK, 'crops': {
+        f'{h:016x}': {'uid': e['uid'], 'hits': int(e['hits']), 'seen': int(e['seen'])}
+        for h, e in memory.items()}})
+
+
 def rebuild_aggregates(guild_id, through_day):
     """Recompute every aggregate from DAY# items (the source of truth).
 
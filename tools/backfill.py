@@ -18,6 +18,7 @@ import argparse
 import os
 import sys
 import time
+from bisect import bisect_right
 from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -46,13 +47,15 @@ DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
 LATE_GRACE_DAYS = 7
 
 
-def fetch_history(session, channel_id, cutoff=None):
-    """All channel messages newest-first, back to cutoff (aware dt) or channel start.
+def iter_history(session, channel_id):
+    """Channel history one page at a time, newest first, back to channel start.
 
-    Unlike scoreboard.fetch_messages this paces itself and honors 429s, since a
-    deep backfill can be hundreds of pages.
+    A generator, so the caller decides how far back to go simply by how long
+    it keeps asking -- and never has to hold what it is done with. Unlike
+    scoreboard.fetch_messages this paces itself and honors 429s, since a deep
+    backfill can be hundreds of pages.
     """
-    messages, before = [], None
+    before, fetched = None, 0
     while True:
         url = f'{DISCORD_API_BASE}/channels/{channel_id}/messages?limit=100'
         if before:
@@ -65,27 +68,55 @@ def fetch_history(session, channel_id, cutoff=None):
         page = r.json()
         if not page:
             break
-        messages += page
+        fetched += len(page)
         before = page[-1]['id']
         oldest = datetime.fromisoformat(page[-1]['timestamp'])
-        print(f'\r  fetched {len(messages)} messages (back to {oldest:%Y-%m-%d})',
+        print(f'\r  fetched {fetched} messages (back to {oldest:%Y-%m-%d})',
               end='', flush=True)
-        if len(page) < 100 or (cutoff and oldest < cutoff):
+        yield page
+        if len(page) < 100:
             break
         time.sleep(0.3)
     print()
-    return messages
 
 
-def backfill_days(session, cfg, tz, messages, start_dt, through_dt):
-    """Parse and archive each day in [start_dt, through_dt]. Returns days written."""
-    stamped = [(datetime.fromisoformat(m['timestamp']), m) for m in messages]
+def backfill_days(session, cfg, tz, pages, start_dt, through_dt):
+    """Parse and archive each day from through_dt back to start_dt (None: back
+    to the oldest message). Returns days written.
+
+    pages is iter_history's stream, newest first. Days run in the same
+    direction, so the messages any one day can use -- posted from the day
+    before it to LATE_GRACE_DAYS after it -- are always the newest slice of
+    what has been read so far: pages are pulled only until that slice is
+    complete, the slice is cut with two bisects, and whatever is newer than the
+    next day can use is dropped. Memory stays at roughly grace + 2 days of
+    messages, and the bucketing is O(messages) over the whole run instead of a
+    scan of every message for every day.
+    """
+    # Parallel lists, newest first: negated POSIX timestamps (so they ascend,
+    # which is what bisect wants) and the messages themselves.
+    keys, window = [], []
+    pages = iter(pages)
+    exhausted = False
     written = 0
-    day_dt = start_dt
-    while day_dt <= through_dt:
-        lo = (day_dt - timedelta(days=1)).replace(tzinfo=tz)
-        hi = (day_dt + timedelta(days=1 + LATE_GRACE_DAYS)).replace(tzinfo=tz)
-        day_msgs = [m for ts, m in stamped if lo <= ts < hi]
+    day_dt = through_dt
+    while start_dt is None or day_dt >= start_dt:
+        lo = (day_dt - timedelta(days=1)).replace(tzinfo=tz).timestamp()
+        hi = (day_dt + timedelta(days=1 + LATE_GRACE_DAYS)).replace(tzinfo=tz).timestamp()
+        while not exhausted and (not keys or -keys[-1] >= lo):
+            page = next(pages, None)
+            if page is None:
+                exhausted = True
+                break
+            for m in page:
+                keys.append(-datetime.fromisoformat(m['timestamp']).timestamp())
+                window.append(m)
+        # Nothing newer than this day can use is needed by any older day.
+        newest = bisect_right(keys, -hi)
+        del keys[:newest], window[:newest]
+        if exhausted and not keys:
+            break
+        day_msgs = window[:bisect_right(keys, -lo)]
         if day_msgs:
             checker = make_timestamp_checker(day_dt, tz, cfg['hours_after_midnight'],
                                              cfg['time_window_hours'])
@@ -102,8 +133,9 @@ def backfill_days(session, cfg, tz, messages, start_dt, through_dt):
                 written += 1
                 total = sum(len(v) for v in results.values())
                 played = sum(1 for v in results.values() if v)
-                print(f'  {day}: {total} results across {played} games')
-        day_dt += timedelta(days=1)
+                # \r and the padding overwrite iter_history's progress line.
+                print(f'\r  {day}: {total} results across {played} games'.ljust(60))
+        day_dt -= timedelta(days=1)
     return written
 
 
@@ -161,21 +193,14 @@ def main():
     through_day = store.day_str(through_dt)
 
     if not args.rebuild_only:
+        pages = iter_history(session, cfg['input_channel_id'])
         if args.all:
-            print('fetching entire channel history...')
-            messages = fetch_history(session, cfg['input_channel_id'])
-            if not messages:
-                raise SystemExit('channel has no messages')
-            oldest = min(datetime.fromisoformat(m['timestamp']) for m in messages)
-            start_dt = (oldest.astimezone(tz) - timedelta(days=1)) \
-                .replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+            start_dt = None
+            print(f'parsing back from {through_day} through the entire channel history...')
         else:
             start_dt = through_dt - timedelta(days=args.days - 1)
-            cutoff = start_dt.replace(tzinfo=tz)
-            print(f'fetching history back to {store.day_str(start_dt)}...')
-            messages = fetch_history(session, cfg['input_channel_id'], cutoff)
-        print(f'parsing {store.day_str(start_dt)} .. {through_day}')
-        written = backfill_days(session, cfg, tz, messages, start_dt, through_dt)
+            print(f'parsing {through_day} back to {store.day_str(start_dt)}...')
+        written = backfill_days(session, cfg, tz, pages, start_dt, through_dt)
         print(f'archived {written} days with plays')
 
     summary = store.rebuild_aggregates(cfg['guild_id'], through_day)
@@ -0,0 +1,123 @@
+"""Time the daily board's scoring and rendering, offline.
+
+Local-only tooling (never deployed). The daily post scores one day's results
+three times over -- the archive's points_per_game, the streak fold's
+scoring_players and the board itself, whose reduction ladder renders once per
+rung -- and all three read the same ranking. This times that path both ways:
+each consumer building its own ScoringContext (what a caller that passes no
+`scoring` gets) against one context handed to all three (what the daily
+lambda and /scoreboard do), over the same synthetic boards check_caps asserts
+on. Both start cold; "warm" is the shared path again over unchanged results,
+with the game sections an earlier render left in _game_texts -- a second
+Scores click in the same container. Run from the repository root:
+
+    python3 tools/bench_board.py                 # the default shapes
+    python3 tools/bench_board.py --shape 30x20   # one games x players shape
+
+Needs no credentials, no network and no table. Fails (exit 1) if the shared
+context or the warm sections ever produce a different board, points or
+scorers than the cold separate path -- a speedup that changes the post is not
+one.
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import game_parser as gp
+from check_caps import NAME, REF, fake_score, spec_pool
+
+# A quiet day, this server's busy day, a board that walks the component rungs
+# and one that walks the text rungs too.
+SHAPES = ((6, 6), (12, 8), (30, 6), (18, 12))
+
+
+def day(n_games, n_players):
+    """Everything one board's consumers are handed: results, games and names."""
+    pn = gp.compute_puzzle_numbers(REF)
+    overrides = {s.key: True for s in gp.GAME_SPECS}
+    games = gp.build_games(pn, overrides)
+    uids = [str(100000000000000000 + i) for i in range(n_players)]
+    results = {g.key: {u: fake_score(g.metric, (i * 7 + j) % n_players)
+                       for i, u in enumerate(uids)}
+               for j, g in enumerate(games)}
+    return pn, overrides, games, results, {u: NAME for u in uids}
+
+
+def post(pn, overrides, games, results, names, shared, warm=False):
+    """The daily lambda's scoring path for one board; returns what it produced."""
+    if not warm:
+        gp._game_texts.clear()
+    if shared:
+        scoring = gp.ScoringContext(results, games, 1)
+        points = scoring.points_per_game()
+        scorers = scoring.scorers()
+    else:
+        scoring = None
+        points = gp.points_per_game(results, games, 1)
+        scorers = gp.scoring_players(results, games, 1)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        board = gp.format_scoreboard_components(
+            results, REF, pn, minimum_players=1, game_overrides=overrides,
+            names=names, scoring=scoring)
+    return board, points, scorers, log.getvalue().count('retrying with ')
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('--shape', action='append', metavar='GAMESxPLAYERS',
+                    help='a board shape to time (repeatable; default: a spread)')
+    ap.add_argument('--repeat', type=int, default=7, help='runs per measurement')
+    args = ap.parse_args()
+
+    shapes = ([tuple(int(n) for n in s.lower().split('x')) for s in args.shape]
+              if args.shape else SHAPES)
+    failures = []
+    print(f'{"shape":<14} {"rungs":>5} {"separate":>10} {"shared":>10} {"warm":>10} '
+          f'{"rank once":>10}')
+    for n_games, n_players in shapes:
+        original = gp.GAME_SPECS
+        gp.GAME_SPECS = spec_pool(n_games)
+        try:
+            pn, overrides, games, results, names = day(n_games, n_players)
+            sep_ms, sep = timed(lambda: post(pn, overrides, games, results, names, False),
+                                args.repeat)
+            shr_ms, shr = timed(lambda: post(pn, overrides, games, results, names, True),
+                                args.repeat)
+            warm_ms, warm = timed(lambda: post(pn, overrides, games, results, names, True,
+                                               warm=True), args.repeat)
+            # The ranking itself, the part a shared context does only once.
+            rank_ms, _ = timed(lambda: [gp.ScoringContext(results, games).ranked(g)
+                                        for g in games], args.repeat)
+        finally:
+            gp.GAME_SPECS = original
+        label = f'{n_games}x{n_players}'
+        same = sep == shr == warm
+        if not same:
+            failures.append(label)
+        print(f'{label:<14} {shr[3]:>5} {sep_ms:>8.2f}ms {shr_ms:>8.2f}ms {warm_ms:>8.2f}ms '
+              f'{rank_ms:>8.2f}ms{"" if same else "  MISMATCH"}')
+
+    if failures:
+        print(f'FAIL: sharing or reuse changed the output for {", ".join(failures)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,359 @@
+"""Benchmark the Wordle bot image parser, and check it against known answers.
+
+Local-only tooling (never deployed). Every change to _detect_grids,
+_read_grids or _match_avatars used to be checked by waiting for the bot to post
+real images; this renders Wordle-bot-style previews instead, with a known
+answer for each, and times and scores the same decode_wordle_image +
+attribute_wordle pair parse_wordle_attachment runs. Run from the repository
+root:
+
+    python3 tools/bench_wordle.py                     # 200 synthetic images
+    python3 tools/bench_wordle.py --players 8-30 --noise jpeg
+    python3 tools/bench_wordle.py --per-row 6         # wrapped multi-row layouts
+    python3 tools/bench_wordle.py --corpus-only       # just the committed corpus
+    python3 tools/bench_wordle.py --workers 2         # image pool vs inline
+
+Synthetic previews copy the real sample (img/wordle_result.png): 23px cells
+at a 24px pitch on a near-black card, empty cells as GRAY-bordered squares,
+the avatar beside a lone grid and above each grid of a multi-player image.
+Every solve state is drawn -- solved in 1 to 6, X/6, in progress, not started
+-- under avatars picked from a fixed set of reference pictures, and the pool
+each image is attributed against holds those players plus --pool distractors.
+--noise adds a little jitter (light, the default) or the block artefacts of a
+JPEG round trip (jpeg). The bot posts PNGs, so jpeg is a stress setting for
+the parser's colour tolerance rather than a picture of production.
+
+--workers N also decodes the whole synthetic batch, and hashes the reference
+avatars, once in this process and once through an N-process ImagePool
+(game_parser.image_pool, IMAGE_WORKERS in production), fed by N threads the
+way the fetch threads feed it. The pool pays pipe and pickling costs per
+image, so it wins only with N spare cores; run it on the machine size in
+question.
+
+The committed corpus (tests/wordle/corpus.json) lists real previews with their
+expected results. A corpus mismatch exits 1; the synthetic numbers are a
+report, not a gate. Needs no credentials, no network and no table.
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+# The lambda modules live in src/ and ship flat in the deploy zip; put that
+# directory on the path so this tool runs against the same code as production.
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+import game_parser as gp
+
+CORPUS = ROOT / 'tests' / 'wordle' / 'corpus.json'
+
+# The real sample's geometry and palette.
+CELL, PITCH = 23, 24
+GRID_W = PITCH * 5 - (PITCH - CELL)
+AVATAR_R = GRID_W // 2
+BACKGROUND = (21, 21, 21)
+CARD_EDGE = (58, 58, 60)
+TITLE = (252, 252, 252)
+TILES = (gp._WORDLE_GREEN, gp._WORDLE_YELLOW, gp._WORDLE_GRAY)
+
+# How far apart the players of a multi-player image sit, edge to edge.
+PLAYER_GAP = 40
+
+REFERENCE_AVATARS = 48
+AVATAR_SIZE = 64   # the size=64 rendition the avatar pool downloads
+
+STATES = ('solved', 'x', 'in_progress', 'not_started')
+
+
+def reference_avatar(i):
+    """The i-th reference picture: a gradient under a few shapes, seeded by i.
+
+    Shapes and gradients rather than per-pixel noise, so that like a real
+    picture the 8x8 average hash has structure to latch on to.
+    """
+    rnd = random.Random(f'avatar-{i}')
+    img = Image.new('RGB', (AVATAR_SIZE, AVATAR_SIZE))
+    a = [rnd.randrange(256) for _ in range(3)]
+    b = [rnd.randrange(256) for _ in range(3)]
+    img.putdata([tuple(a[c] + (b[c] - a[c]) * (x + y) // (2 * AVATAR_SIZE) for c in range(3))
+                 for y in range(AVATAR_SIZE) for x in range(AVATAR_SIZE)])
+    draw = ImageDraw.Draw(img)
+    for _ in range(rnd.randint(2, 5)):
+        x0, y0 = rnd.randrange(AVATAR_SIZE), rnd.randrange(AVATAR_SIZE)
+        box = [x0, y0, x0 + rnd.randint(12, 40), y0 + rnd.randint(12, 40)]
+        fill = tuple(rnd.randrange(256) for _ in range(3))
+        (draw.ellipse if rnd.random() < 0.5 else draw.rectangle)(box, fill=fill)
+    return img
+
+
+def random_player(rnd, uid):
+    """(uid, avatar index, rows, state, expected score or None)."""
+    state = rnd.choice(STATES)
+    if state == 'solved':
+        rows = rnd.randint(1, 6)
+        score = rows
+    elif state == 'x':
+        rows, score = 6, gp.DEFAULT_WORDLE_TOTAL + 1
+    elif state == 'in_progress':
+        rows, score = rnd.randint(1, 5), -1
+    else:
+        rows, score = 0, None
+    return uid, rnd.randrange(REFERENCE_AVATARS), rows, state, score
+
+
+def draw_grid(draw, rnd, x0, y0, rows, state):
+    for r in range(6):
+        for c in range(5):
+            box = [x0 + c * PITCH, y0 + r * PITCH, x0 + c * PITCH + CELL - 1,
+                   y0 + r * PITCH + CELL - 1]
+            if r >= rows:
+                draw.rectangle(box, fill=gp._WORDLE_EMPTY, outline=gp._WORDLE_GRAY)
+            elif r == rows - 1 and state == 'solved':
+                draw.rectangle(box, fill=gp._WORDLE_GREEN)
+            else:
+                # Never an all-green row before the last: that would be a solve.
+                fill = rnd.choice(TILES) if c else gp._WORDLE_YELLOW
+                draw.rectangle(box, fill=fill)
+
+
+def paste_avatar(img, avatars, index, cx, cy, r):
+    face = avatars[index].resize((2 * r, 2 * r))
+    mask = Image.new('L', (2 * r, 2 * r), 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, 2 * r - 1, 2 * r - 1], fill=255)
+    img.paste(face, (cx - r, cy - r), mask)
+
+
+def render(players, rnd, avatars, per_row=0):
+    """A preview of `players` (random_player tuples) as a PIL image.
+
+    One player gets the real sample's card: avatar left, grid right. More get
+    the multi-player layout _detect_grids expects, each avatar directly above
+    its grid, in one row -- or wrapped every `per_row` players.
+    """
+    if len(players) == 1:
+        img = Image.new('RGB', (512, 280), BACKGROUND)
+        draw = ImageDraw.Draw(img)
+        draw.text((205, 28), 'Wordle No. 1749', fill=TITLE)
+        draw.rounded_rectangle([94, 68, 417, 251], radius=12, outline=CARD_EDGE)
+        _, face, rows, state, _ = players[0]
+        paste_avatar(img, avatars, face, 184, 160, AVATAR_R)
+        draw_grid(draw, rnd, 269, 89, rows, state)
+        return img
+
+    per_row = per_row or len(players)
+    cols = min(per_row, len(players))
+    n_rows = -(-len(players) // per_row)
+    block_h = 2 * AVATAR_R + 18 + 6 * PITCH + PLAYER_GAP
+    img = Image.new('RGB', (PLAYER_GAP + cols * (GRID_W + PLAYER_GAP),
+                            60 + n_rows * block_h), BACKGROUND)
+    draw = ImageDraw.Draw(img)
+    draw.text((PLAYER_GAP, 20), 'Wordle No. 1749', fill=TITLE)
+    for i, (_, face, rows, state, _) in enumerate(players):
+        x0 = PLAYER_GAP + (i % per_row) * (GRID_W + PLAYER_GAP)
+        y0 = 60 + (i // per_row) * block_h + 2 * AVATAR_R + 18
+        paste_avatar(img, avatars, face, x0 + GRID_W // 2, y0 - AVATAR_R - 18, AVATAR_R)
+        draw_grid(draw, rnd, x0, y0, rows, state)
+    return img
+
+
+def encode(img, noise, rnd):
+    """PNG bytes of img, after the requested noise."""
+    if noise == 'mix':
+        noise = rnd.choice(('none', 'light', 'jpeg'))
+    if noise == 'light':
+        import numpy as np
+        arr = np.asarray(img, dtype=np.int16)
+        jitter = np.random.default_rng(rnd.randrange(1 << 30)).integers(-2, 3, arr.shape)
+        img = Image.fromarray(np.clip(arr + jitter, 0, 255).astype(np.uint8))
+    elif noise == 'jpeg':
+        buf = io.BytesIO()
+        img.save(buf, 'JPEG', quality=90)
+        img = Image.open(io.BytesIO(buf.getvalue())).convert('RGB')
+    buf = io.BytesIO()
+    img.save(buf, 'PNG')
+    return buf.getvalue()
+
+
+def parse(png, pool):
+    decoded = gp.decode_wordle_image(png)
+    return decoded, gp.attribute_wordle(decoded, pool)
+
+
+def percentile(values, q):
+    """Nearest-rank percentile; q in 0..100."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def run_corpus(failures):
+    with open(CORPUS) as f:
+        entries = json.load(f)['images']
+    print(f'corpus ({len(entries)} image(s), {CORPUS.relative_to(ROOT)})')
+    for entry in entries:
+        png = (ROOT / entry['file']).read_bytes()
+        pool = {uid: tuple(int(h, 16) for h in hashes)
+                for uid, hashes in (entry.get('pool') or {}).items()}
+        decoded, results = parse(png, pool)
+        got = sorted([uid, score] for uid, score in results)
+        want = sorted(entry['results'])
+        ok = len(decoded.grids) == entry['grids'] and got == want
+        print(f'  {"ok  " if ok else "FAIL"} {entry["file"]}: {len(decoded.grids)} grid(s), '
+              f'{got}')
+        if not ok:
+            failures.append(f'{entry["file"]}: expected {entry["grids"]} grid(s), {want}')
+
+
+def run_synthetic(args):
+    rnd = random.Random(args.seed)
+    avatars = [reference_avatar(i) for i in range(REFERENCE_AVATARS)]
+    avatar_hashes = [gp._avatar_ahash(a) for a in avatars]
+    lo, hi = (int(n) for n in args.players.split('-')) if '-' in args.players \
+        else (int(args.players),) * 2
+
+    cases = []
+    for i in range(args.images):
+        n = rnd.randint(lo, hi)
+        faces = rnd.sample(range(REFERENCE_AVATARS), min(REFERENCE_AVATARS,
+                                                          n + args.pool))
+        players = [random_player(rnd, f'u{i}-{k}') for k in range(n)]
+        # Everyone in the image wears their own face; distractors the rest.
+        players = [(uid, faces[k], rows, state, score)
+                   for k, (uid, _, rows, state, score) in enumerate(players)]
+        pool = {uid: (avatar_hashes[face],) for uid, face, *_ in players}
+        pool.update({f'd{i}-{k}': (avatar_hashes[face],)
+                     for k, face in enumerate(faces[n:])})
+        png = encode(render(players, rnd, avatars, args.per_row), args.noise, rnd)
+        cases.append((players, pool, png))
+
+    # Timing pass first, untraced: tracemalloc's bookkeeping would inflate it.
+    gp._wordle_decode_cache.clear()
+    latencies = []
+    outcomes = []
+    for players, pool, png in cases:
+        t0 = time.perf_counter()
+        decoded, results = parse(png, pool)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        outcomes.append((players, decoded, results))
+    peaks = []
+    for _, pool, png in cases:
+        tracemalloc.start()
+        parse(png, pool)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+
+    images_detected = grids_expected = grids_read = 0
+    attributable = attributed = misattributed = 0
+    for players, decoded, results in outcomes:
+        # A grid with nothing in it has no tile to find; the bot's own
+        # description only ever counts finished and unfinished games.
+        visible = [p for p in players if p[2]]
+        grids_expected += len(visible)
+        if len(decoded.grids) == len(visible):
+            images_detected += 1
+            grids_read += sum(score == p[4] for score, p in zip(decoded.scores, visible))
+        finished = {(uid, score) for uid, _, _, _, score in visible if score != -1}
+        if len(players) == 1:
+            finished = {(None, score) for _, score in finished}
+        attributable += len(finished)
+        attributed += len(finished & set(results))
+        misattributed += len(set(results) - finished)
+
+    n = len(cases)
+    print(f'\nsynthetic ({n} images, {lo}-{hi} players, noise={args.noise}, '
+          f'pool=players+{args.pool}, per_row={args.per_row or "all"}, seed={args.seed})')
+    print(f'  latency ms     p50 {percentile(latencies, 50):7.2f}   '
+          f'p90 {percentile(latencies, 90):7.2f}   p99 {percentile(latencies, 99):7.2f}   '
+          f'max {max(latencies):7.2f}')
+    print(f'  peak KiB       p50 {percentile(peaks, 50):7.0f}   '
+          f'p90 {percentile(peaks, 90):7.0f}   p99 {percentile(peaks, 99):7.0f}   '
+          f'max {max(peaks):7.0f}')
+    print(f'  detection      {images_detected}/{n} images found every visible grid')
+    print(f'  scores         {grids_read}/{grids_expected} grids read correctly')
+    print(f'  attribution    {attributed}/{attributable} finished grids to the right '
+          f'player, {misattributed} to a wrong one')
+    return [png for _, _, png in cases]
+
+
+def run_workers(pngs, workers):
+    """Wall time of one batch of decodes and avatar hashes, inline against an
+    ImagePool of `workers` processes; exits 1 if the two disagree."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    avatars = []
+    for i in range(REFERENCE_AVATARS):
+        buf = io.BytesIO()
+        reference_avatar(i).save(buf, 'PNG')
+        avatars.append(buf.getvalue())
+
+    t0 = time.perf_counter()
+    inline = [gp.decode_wordle_image(png) for png in pngs]
+    inline_hashes = [gp._avatar_ahash(Image.open(io.BytesIO(a)).convert('RGB'))
+                     for a in avatars]
+    inline_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    pool = gp.ImagePool(workers)
+    start_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pooled = list(ex.map(pool.decode, pngs))
+        pooled_hashes = list(ex.map(pool.ahash, avatars))
+    pooled_ms = (time.perf_counter() - t0) * 1000
+
+    n = len(pngs) + len(avatars)
+    print(f'\nimage pool ({len(pngs)} decodes + {len(avatars)} avatar hashes, '
+          f'{workers} worker(s))')
+    print(f'  inline         {inline_ms:8.1f} ms   {inline_ms / n:6.2f} ms/image')
+    print(f'  pool           {pooled_ms:8.1f} ms   {pooled_ms / n:6.2f} ms/image   '
+          f'(+{start_ms:.1f} ms to start, once per container)')
+    same = pooled == inline and pooled_hashes == inline_hashes
+    print(f'  results        {"identical" if same else "DIFFERENT"}')
+    return same
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--images', type=int, default=200, help='synthetic images (default 200)')
+    ap.add_argument('--players', default='1-30',
+                    help='players per image, N or LO-HI (default 1-30)')
+    ap.add_argument('--noise', choices=('none', 'light', 'jpeg', 'mix'), default='light',
+                    help='light: +-2 per channel (default); jpeg: a quality-90 round '
+                         'trip; mix: one of none/light/jpeg per image')
+    ap.add_argument('--pool', type=int, default=12,
+                    help='distractor users in each pool beyond the players (default 12)')
+    ap.add_argument('--per-row', type=int, default=0,
+                    help='wrap multi-player layouts every N players (default: one row)')
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--corpus-only', action='store_true')
+    ap.add_argument('--workers', type=int, default=0,
+                    help='also time the batch through an image pool of N processes')
+    args = ap.parse_args()
+
+    failures = []
+    run_corpus(failures)
+    pool_ok = True
+    if not args.corpus_only:
+        pngs = run_synthetic(args)
+        if args.workers:
+            pool_ok = run_workers(pngs, args.workers)
+    if not pool_ok:
+        print('\nFAIL: the image pool disagrees with the inline decode')
+        return 1
+    if failures:
+        print(f'\nFAIL: {len(failures)} corpus image(s)')
+        for f in failures:
+            print(f'  {f}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,12 +12,15 @@ in production. Run from the repository root:
 
 Needs no credentials, no network and no table: it drives the same
 format_scoreboard_components the lambdas call, over synthetic results dense
-enough to force every rung of the reduction ladder.
+enough to force every rung of the reduction ladder -- and past the last rung,
+the same format_scoreboard_pages the daily post calls, whose every part has to
+fit on its own.
 """
 import argparse
 import contextlib
 import dataclasses
 import io
+import itertools
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -39,8 +42,10 @@ NAME = 'PlayerName'
 # name, a score and a newline and 4000 characters only holds so many of them.
 # Measured at 216 lines (18 games x 12 players) and 230 (10 x 23); this is the
 # conservative floor across the shapes in between. For scale, this server runs
-# around 35 score lines a day. Raising it needs a new rung in _REDUCTIONS or a
-# second message -- not a bigger number here.
+# around 35 score lines a day. Raising it needs a new rung in _REDUCTIONS, not a
+# bigger number here. Past it the daily post splits the board across messages
+# (format_scoreboard_pages), asserted at the bottom; Scores, which answers in
+# one message, still posts as-is.
 SUPPORTED_LINES = 200
 
 
@@ -73,37 +78,100 @@ def score_lines(n_games, n_players):
     return n_games * n_players
 
 
-def build(n_games, n_players, *, broken=False, off_rotation=0, with_names=True):
-    """One board, plus the reduction rungs its render needed."""
+@contextlib.contextmanager
+def specs(n_games):
+    """GAME_SPECS swapped for spec_pool(n_games) for the duration."""
     original = gp.GAME_SPECS
     gp.GAME_SPECS = spec_pool(n_games)
     try:
-        pn = gp.compute_puzzle_numbers(REF)
-        overrides = {s.key: True for s in gp.GAME_SPECS}
-        games = gp.build_games(pn, overrides)
-        uids = [str(100000000000000000 + i) for i in range(n_players)]
-        results = {g.key: {u: fake_score(g.metric, i) for i, u in enumerate(uids)}
-                   for g in games}
-        keys = [g.key for g in games]
-        streaks = None
-        if broken:
-            streaks = {'games': {}, 'players': {}, 'broken': {k: 7 for k in keys[:3]}}
-        names = {u: NAME for u in uids} if with_names else None
+        yield
+    finally:
+        gp.GAME_SPECS = original
+
+
+def board_args(n_games, n_players, *, broken=False, off_rotation=0, with_names=True):
+    """format_scoreboard_components' arguments for one synthetic day. Call
+    inside specs(n_games)."""
+    pn = gp.compute_puzzle_numbers(REF)
+    overrides = {s.key: True for s in gp.GAME_SPECS}
+    games = gp.build_games(pn, overrides)
+    uids = [str(100000000000000000 + i) for i in range(n_players)]
+    results = {g.key: {u: fake_score(g.metric, i) for i, u in enumerate(uids)}
+               for g in games}
+    keys = [g.key for g in games]
+    streaks = None
+    if broken:
+        streaks = {'games': {}, 'players': {}, 'broken': {k: 7 for k in keys[:3]}}
+    return dict(results=results, reference_date=REF, puzzle_numbers=pn,
+                minimum_players=1, streaks=streaks, game_overrides=overrides,
+                rotation=(keys[:n_games - off_rotation] if off_rotation else None),
+                rotation_off='shown',
+                names={u: NAME for u in uids} if with_names else None)
+
+
+def build(n_games, n_players, **kw):
+    """One board, plus the reduction rungs its render needed."""
+    with specs(n_games):
         # Captured rather than printed: the ladder's own log lines are how this
         # tool reports which rungs a shape needed.
         log = io.StringIO()
         with contextlib.redirect_stdout(log):
-            board = gp.format_scoreboard_components(
-                results, REF, pn, minimum_players=1, streaks=streaks,
-                game_overrides=overrides,
-                rotation=(keys[:n_games - off_rotation] if off_rotation else None),
-                rotation_off='shown', names=names)
+            board = gp.format_scoreboard_components(**board_args(n_games, n_players, **kw))
         rungs = [line.split('retrying with ')[1]
                  for line in log.getvalue().splitlines() if 'retrying with ' in line]
         exhausted = 'STILL over budget' in log.getvalue()
         return board, rungs, exhausted
-    finally:
-        gp.GAME_SPECS = original
+
+
+def build_pages(n_games, n_players, **kw):
+    """One board as the daily post splits it, plus the same board unsplit."""
+    with specs(n_games):
+        args = board_args(n_games, n_players, **kw)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pages = gp.format_scoreboard_pages(**args)
+            single = gp.format_scoreboard_components(**args)
+        games = gp.build_games(args['puzzle_numbers'], args['game_overrides'])
+        return pages, single, games, list(next(iter(args['results'].values())))
+
+
+def split_problems(pages, games, uids):
+    """What is wrong with a split board, if anything: a part over a cap, a
+    head or continuation marked wrongly, or a game or player gone missing."""
+    problems = [f'part {i} {gp.count_components(p)} comp {gp.displayable_text(p)} chars'
+                for i, p in enumerate(pages, 1) if gp.over_budget(p)]
+    marks = [gp.is_board_continuation(p) for p in pages]
+    if marks != [False] + [True] * (len(pages) - 1):
+        problems.append(f'continuation marks {marks}')
+    text = '\n'.join(c.get('content') or '' for p in pages for box in p
+                     for c in box['components'])
+    problems += [f'{g.title} missing' for g in games if f'[{g.title}]' not in text]
+    problems += [f'<@{u}> missing' for u in uids if f'<@{u}>' not in text][:3]
+    return problems
+
+
+def every_style():
+    """The full style and every combination of the ladder's relaxed fields."""
+    values = {field: [value] for field, value in gp._FULL_STYLE._asdict().items()}
+    for field, value, _ in gp._REDUCTIONS:
+        if value not in values[field]:
+            values[field].append(value)
+    return [gp._Style(*combo) for combo in itertools.product(*values.values())]
+
+
+def missized(n_games, n_players, **kw):
+    """The styles at which the ladder's size model (_BoardPlan.cost) disagrees
+    with the board it renders. The ladder picks its rung from the model alone,
+    so any disagreement is a board posted at the wrong rung -- or over a cap."""
+    with specs(n_games):
+        args = board_args(n_games, n_players, **kw)
+        games = gp.build_games(args['puzzle_numbers'], args['game_overrides'])
+        scoring = gp.ScoringContext(args['results'], games, args['minimum_players'],
+                                    args['rotation'])
+        plan = gp._BoardPlan(args['results'], REF, 'Daily Game Scoreboard',
+                             args['streaks'], args['rotation_off'], args['names'], scoring)
+        return [style for style in every_style()
+                if plan.cost(style) != (gp.count_components(plan.render(style)),
+                                        gp.displayable_text(plan.render(style)))]
 
 
 def check(label, board, rungs, exhausted, failures, report):
@@ -189,6 +257,19 @@ def main():
         elif args.report:
             print(f'  all {n_specs} games x 3 players costs separators only')
 
+    # The ladder sizes every rung from the plan and renders only the one it
+    # settles on, so the plan's arithmetic has to match what render produces at
+    # every style -- including the ones today's shapes never reach.
+    cases = [(n_specs, 6, {}), (n_specs, 10, dict(broken=True)),
+             (30, 6, dict(broken=True, off_rotation=3)), (1, 1, dict(with_names=False))]
+    for n_games, n_players, kw in cases:
+        bad = missized(n_games, n_players, **kw)
+        if bad:
+            failures.append(f'{n_games}x{n_players} {kw}: size model disagrees with '
+                            f'the render at {len(bad)} style(s), e.g. {bad[0]}')
+    if args.report and not any('size model' in f for f in failures):
+        print(f'  size model matches the render at all {len(every_style())} styles')
+
     # The empty board still renders (and still carries its break callouts).
     empty = gp.format_scoreboard_components({}, REF, gp.compute_puzzle_numbers(REF))
     if not empty or gp.count_components(empty) > gp.MAX_TOTAL_COMPONENTS:
@@ -225,6 +306,34 @@ def main():
                   f'{gp.count_components(board)} comp (under cap), every text rung '
                   f'spent, logged, board intact ({gp.displayable_text(board)} chars)')
 
+    # Past the envelope the daily post does not post as-is: it splits the board,
+    # nothing reduced, into as few messages as fit -- each under both caps, the
+    # head unmarked and every other part marked, every game and every player
+    # present. The last two shapes are a few games with huge fields, which
+    # only fit by breaking a section (and a tie line) across parts.
+    if args.report:
+        print('\nbeyond the envelope, split (the daily post)')
+    for n_games, n_players, kw in ((n_specs, 30, {}), (40, 20, {}),
+                                   (60, 20, dict(broken=True, off_rotation=10)),
+                                   (3, 400, {}), (1, 900, dict(with_names=False))):
+        pages, _, games, uids = build_pages(n_games, n_players, **kw)
+        problems = split_problems(pages, games, uids)
+        if len(pages) < 2:
+            problems.append('not split')
+        if problems:
+            failures.append(f'{n_games}x{n_players} split: {"; ".join(problems)}')
+        elif args.report:
+            floor = -(-sum(gp.displayable_text(p) for p in pages) // gp.MAX_DISPLAYABLE_TEXT)
+            print(f'  {n_games} games x {n_players} players: {len(pages)} messages '
+                  f'(text alone needs {floor}), every part under both caps')
+
+    # ...and a board that fits one message is never split: it comes back as
+    # exactly the one message the ladder renders.
+    for n_games, n_players in ((n_specs, 3), (n_specs, 10), (30, 6)):
+        pages, single, _, _ = build_pages(n_games, n_players)
+        if pages != [single]:
+            failures.append(f'{n_games}x{n_players}: a board that fits was split')
+
     if args.report:
         print()
     if failures:
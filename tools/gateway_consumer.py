@@ -0,0 +1,233 @@
+"""Settle stickies from the Discord gateway as messages arrive (optional).
+
+Local/long-lived tooling, never deployed to Lambda. The sticky rule polls once a
+minute; this holds a gateway connection instead, folds each MESSAGE_CREATE for
+a configured input channel into the sticky pass's state on arrival
+(sticky_lambda.apply_gateway_event), and settles the sticky a couple of seconds
+after the channel goes quiet. Edits and deletions inside the day's tail drop
+that state, so the next pass re-parses. The minute rule keeps running as the
+reconcile: while this is up it mostly finds the sticky already settled and
+stops at its one-message probe.
+
+    dotenv run -- python3 tools/gateway_consumer.py             # live
+    dotenv run -- python3 tools/gateway_consumer.py --dry-run   # parse and log only
+
+Offline, against the recorded events in tests/events/gateway/ (no Discord, no
+table -- --channel stands in a default config for the one input channel):
+
+    python3 tools/gateway_replay.py tests/events/gateway/sticky_burst.json &
+    python3 tools/gateway_consumer.py --url ws://localhost:8765 \\
+        --channel 1425900000000000001 --dry-run
+
+Needs the MESSAGE_CONTENT privileged intent enabled for the application, the
+same as reading history over REST does, and `websockets` (requirements.txt,
+local tooling).
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+from websockets.exceptions import ConnectionClosed
+from websockets.sync.client import connect
+
+load_dotenv()
+
+# The lambda modules live in src/ and ship flat in the deploy zip; put that
+# directory on the path so this tool runs against the same code as production.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+# Local imports after load_dotenv(): store and sticky_lambda read the env at
+# import time.
+import store
+import sticky_lambda
+from scoreboard import DISCORD_API_BASE
+
+DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
+
+INTENT_GUILDS = 1 << 0
+INTENT_GUILD_MESSAGES = 1 << 9
+INTENT_MESSAGE_CONTENT = 1 << 15
+INTENTS = INTENT_GUILDS | INTENT_GUILD_MESSAGES | INTENT_MESSAGE_CONTENT
+
+OP_DISPATCH, OP_HEARTBEAT, OP_IDENTIFY = 0, 1, 2
+OP_RECONNECT, OP_INVALID_SESSION, OP_HELLO, OP_HEARTBEAT_ACK = 7, 9, 10, 11
+
+MESSAGE_EVENTS = ('MESSAGE_CREATE', 'MESSAGE_UPDATE', 'MESSAGE_DELETE')
+
+# Quiet time before a guild's sticky is settled. A burst of shares (the morning
+# rush, one player pasting three games) then costs one repost, not one each.
+DEBOUNCE_SECONDS = 2.0
+
+# How long the channel map may go unrefreshed; /setup edits reach the consumer
+# on the same clock they reach the sticky rule (store.CONFIGS_TTL_SECONDS).
+CONFIG_REFRESH_SECONDS = store.CONFIGS_TTL_SECONDS
+
+RECONNECT_DELAY = 5
+
+
+def gateway_url(session):
+    r = session.get(f'{DISCORD_API_BASE}/gateway/bot')
+    r.raise_for_status()
+    return r.json()['url']
+
+
+class Consumer:
+    """One gateway connection's worth of state: the channel -> config map and
+    the guilds waiting out their debounce.
+
+    Everything that touches sticky_lambda's per-guild state runs on the one
+    thread that reads the socket -- events are folded and passes are run in
+    arrival order -- so a pass can never interleave with the fold of a
+    message it is about to read past. Only the heartbeat has a thread.
+    """
+
+    def __init__(self, dry_run=False, channel=None):
+        self.dry_run = dry_run
+        self.channel = channel
+        self.by_channel = {}
+        self.refreshed = 0.0
+        self.due = {}       # guild_id -> monotonic time its pass may run
+        self.seq = None
+
+    def refresh_configs(self, force=False):
+        if not force and time.monotonic() - self.refreshed < CONFIG_REFRESH_SECONDS:
+            return
+        if self.channel:
+            # Offline stand-in: the one channel under a default config, the
+            # same shape the sticky's test event runs under.
+            cfg = store.default_config(guild_id=None)
+            cfg.update(input_channel_id=self.channel, guild_id=f'test-{self.channel}')
+            configs = [cfg]
+        else:
+            configs = [c for c in store.all_configs()
+                       if c['sticky_enabled'] and c['input_channel_id']]
+        self.by_channel = {c['input_channel_id']: c for c in configs}
+        self.refreshed = time.monotonic()
+
+    def handle(self, event_type, data):
+        if event_type not in MESSAGE_EVENTS:
+            return
+        self.refresh_configs()
+        cfg = self.by_channel.get(data.get('channel_id'))
+        if cfg is None:
+            return
+        entries, needs_pass = sticky_lambda.apply_gateway_event(cfg, event_type, data)
+        for game_key, score, _, uid in entries:
+            who = uid or (data.get('author') or {}).get('id')
+            print(f'[guild {cfg["guild_id"]}] {event_type} {data["id"]}: '
+                  f'{game_key} {score} by {who}')
+        if needs_pass:
+            self.due[cfg['guild_id']] = time.monotonic() + DEBOUNCE_SECONDS
+
+    def run_due(self, flush=False):
+        """Settle every guild whose debounce has run out (all of them on flush)."""
+        now = time.monotonic()
+        ready = [gid for gid, at in self.due.items() if flush or at <= now]
+        for gid in ready:
+            del self.due[gid]
+            cfg = next((c for c in self.by_channel.values() if c['guild_id'] == gid), None)
+            if cfg is None:
+                continue
+            if self.dry_run:
+                print(f'[guild {gid}] would settle the sticky')
+                continue
+            t0 = time.monotonic()
+            try:
+                outcome = sticky_lambda.run_guild(cfg, current=True)
+            except Exception as e:
+                outcome = f'FAILED {type(e).__name__}: {e}'
+                sticky_lambda.forget_guild(gid)
+            print(f'[guild {gid}] {outcome} ({time.monotonic() - t0:.2f}s)')
+
+    def next_timeout(self):
+        if not self.due:
+            return None
+        return max(min(self.due.values()) - time.monotonic(), 0)
+
+    def serve(self, url):
+        """One connection, from HELLO until it closes. Returns normally when the
+        server asks for a reconnect or hangs up; the caller decides whether to
+        dial again."""
+        with connect(f'{url}?v=10&encoding=json', max_size=None) as ws:
+            hello = json.loads(ws.recv())
+            if hello.get('op') != OP_HELLO:
+                raise RuntimeError(f'expected HELLO, got op {hello.get("op")}')
+            stop = threading.Event()
+            beat = threading.Thread(target=self._heartbeat, daemon=True,
+                                    args=(ws, hello['d']['heartbeat_interval'] / 1000, stop))
+            beat.start()
+            ws.send(json.dumps({'op': OP_IDENTIFY, 'd': {
+                'token': DISCORD_BOT_TOKEN or '',
+                'intents': INTENTS,
+                'properties': {'os': sys.platform, 'browser': 'daily-game-scorekeeper',
+                               'device': 'daily-game-scorekeeper'},
+            }}))
+            # Whatever happened while we were away was never folded, so every
+            # guild starts this connection with a full pass due.
+            self.refresh_configs(force=True)
+            for cfg in self.by_channel.values():
+                sticky_lambda.forget_guild(cfg['guild_id'])
+            try:
+                while True:
+                    try:
+                        raw = ws.recv(timeout=self.next_timeout())
+                    except TimeoutError:
+                        self.run_due()
+                        continue
+                    msg = json.loads(raw)
+                    if msg.get('s') is not None:
+                        self.seq = msg['s']
+                    op = msg.get('op')
+                    if op == OP_DISPATCH:
+                        self.handle(msg.get('t'), msg.get('d') or {})
+                    elif op == OP_HEARTBEAT:
+                        ws.send(json.dumps({'op': OP_HEARTBEAT, 'd': self.seq}))
+                    elif op in (OP_RECONNECT, OP_INVALID_SESSION):
+                        print(f'gateway: op {op}, reconnecting')
+                        return
+                    self.run_due()
+            except ConnectionClosed as e:
+                print(f'gateway: connection closed ({e.rcvd.code if e.rcvd else "no code"})')
+            finally:
+                stop.set()
+                self.run_due(flush=True)
+
+    def _heartbeat(self, ws, interval, stop):
+        while not stop.wait(interval):
+            try:
+                ws.send(json.dumps({'op': OP_HEARTBEAT, 'd': self.seq}))
+            except ConnectionClosed:
+                return
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('--url', help='gateway url (default: asked of Discord); '
+                                  'point at tools/gateway_replay.py to run offline')
+    ap.add_argument('--channel', help='stand in a default config for this one '
+                                      'input channel instead of reading the table')
+    ap.add_argument('--dry-run', action='store_true',
+                    help='parse and log, never touch a sticky')
+    ap.add_argument('--once', action='store_true',
+                    help='exit when the connection closes instead of redialling')
+    args = ap.parse_args()
+
+    consumer = Consumer(dry_run=args.dry_run, channel=args.channel)
+    while True:
+        url = args.url or gateway_url(sticky_lambda._session)
+        try:
+            consumer.serve(url)
+        except (OSError, RuntimeError) as e:
+            print(f'gateway: {type(e).__name__}: {e}')
+        if args.once:
+            return
+        time.sleep(RECONNECT_DELAY)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Local stand-in for the Discord gateway: replays recorded dispatches.
+
+Local-only tooling (never deployed). Serves one websocket connection the way
+the gateway opens one -- HELLO, wait for IDENTIFY, READY -- then sends each
+recorded event in order and hangs up, so tools/gateway_consumer.py can be run
+end to end with no Discord and no table:
+
+    python3 tools/gateway_replay.py tests/events/gateway/sticky_burst.json &
+    python3 tools/gateway_consumer.py --url ws://localhost:8765 \\
+        --channel 1425900000000000001 --dry-run --once
+
+Fixtures are {"events": [{"t": <dispatch name>, "d": <payload>, "delay": <s>}]}.
+What a share counts for depends on the day, so the day-dependent values are
+${VAR} placeholders, resolved at replay time the way the other fixtures'
+installation-specific ones are: ${NOW} (an ISO timestamp), ${PUZZLE_<KEY>} (that
+game's puzzle for today, UTC day start -- the default config the consumer's
+--channel mode runs under), with an optional format spec, e.g.
+${PUZZLE_WORDLE:,} for Wordle's thousands separator. Anything else comes from
+the environment.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from websockets.sync.server import serve
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from game_parser import GAME_SPECS
+from scoreboard import reference_date
+
+OP_DISPATCH, OP_IDENTIFY, OP_HELLO = 0, 2, 10
+
+HEARTBEAT_INTERVAL_MS = 41250
+
+
+def placeholders():
+    now = datetime.now(timezone.utc)
+    today = reference_date(now, timezone.utc, 0)
+    values = {f'PUZZLE_{spec.key.upper()}': spec.puzzle(today) for spec in GAME_SPECS}
+    values['NOW'] = now.isoformat()
+    return values
+
+
+def render(raw):
+    values = placeholders()
+
+    def fill(m):
+        value = values[m.group(1)] if m.group(1) in values else os.environ[m.group(1)]
+        return format(value, m.group(2) or '')
+
+    return re.sub(r'\$\{(\w+)(?::([^}]*))?\}', fill, raw)
+
+
+def replay(events, done):
+    def handler(ws):
+        try:
+            ws.send(json.dumps({'op': OP_HELLO,
+                                'd': {'heartbeat_interval': HEARTBEAT_INTERVAL_MS}}))
+            identify = json.loads(ws.recv())
+            if identify.get('op') != OP_IDENTIFY:
+                print(f'replay: expected IDENTIFY, got op {identify.get("op")}')
+                return
+            print(f'replay: identified with intents {identify["d"].get("intents")}')
+            seq = 1
+            ws.send(json.dumps({'op': OP_DISPATCH, 's': seq, 't': 'READY',
+                                'd': {'v': 10, 'session_id': 'replay'}}))
+            for event in events:
+                time.sleep(event.get('delay', 0))
+                seq += 1
+                ws.send(json.dumps({'op': OP_DISPATCH, 's': seq, 't': event['t'],
+                                    'd': event['d']}))
+            print(f'replay: sent {len(events)} event(s)')
+        finally:
+            done.set()
+    return handler
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('fixture', help='recorded events, e.g. tests/events/gateway/sticky_burst.json')
+    ap.add_argument('--port', type=int, default=8765)
+    args = ap.parse_args()
+
+    with open(args.fixture) as f:
+        events = json.loads(render(f.read()))['events']
+    # One connection and done: the handler returning closes the socket, which
+    # is the consumer's cue to flush its pending passes.
+    done = threading.Event()
+    with serve(replay(events, done), 'localhost', args.port) as server:
+        print(f'replay: serving {len(events)} event(s) on ws://localhost:{args.port}')
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        done.wait()
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -98,12 +98,14 @@ class Function:
 # partition (managed by /setup) and the code has no env fallback for them, so
 # anything server-shaped appearing here would be dead weight. TABLE_NAME is
 # derived from the constant above; the rest are read from the local environment.
-COMMON_ENV = ('TABLE_NAME', 'DISCORD_BOT_TOKEN', 'DISCORD_BOT_ID', 'MINIMUM_STREAK')
+COMMON_ENV = ('TABLE_NAME', 'DISCORD_BOT_TOKEN', 'DISCORD_BOT_ID', 'MINIMUM_STREAK',
+              'IMAGE_WORKERS')
 
 # Declared, but the code carries a working default, so leaving one unset is a
 # choice rather than a gap -- absent values are set when available and not
-# reported when not.
-OPTIONAL_ENV = frozenset({'MINIMUM_STREAK'})
+# reported when not. IMAGE_WORKERS (game_parser.image_pool) only pays on a
+# function with a second vCPU, which none of the sizes below buys.
+OPTIONAL_ENV = frozenset({'MINIMUM_STREAK', 'IMAGE_WORKERS'})
 
 FUNCTIONS = [
     Function(
@@ -114,9 +116,11 @@ FUNCTIONS = [
         runtime='python3.13',
         # The hourly tick loops every guild and re-parses each one's history.
         timeout=120,
-        # Same Pillow reasoning as the sticky below, on up to 8 pages of
-        # history: this function decodes Wordle grids and avatars too, and at
-        # 128MB its measured peak was 104MB -- one large image from an OOM.
+        # Same Pillow reasoning as the sticky below: this function decodes
+        # Wordle grids and avatars too. Its history read goes up to
+        # WINDOW_FETCH_CAP (20 pages). The 104MB peak measured at 128MB -- one
+        # large image from an OOM -- is from the old 8-page read; locally the
+        # 12 extra pages of parsed messages add about 2MB, well inside 512MB.
         memory=512,
         env=COMMON_ENV + ('TEST_CHANNEL_ID',),
         # Named 'time' for historical reasons. EventBridge cannot rename a rule